@@ -0,0 +1,186 @@
+# FILE: activity.py
+# Asynchronous, batched ActivityLog writer
+
+import atexit
+import os
+import queue
+import threading
+import time
+import traceback
+from datetime import datetime
+from flask import current_app
+
+
+class ActivityLogWriter:
+    """
+    Collects activity-log entries in a bounded in-memory queue and writes
+    them from a background thread as multi-row INSERTs, whenever
+    `batch_size` entries are waiting or `flush_interval` seconds have
+    passed. Requests only pay for a queue put. When the queue is full a
+    caller waits up to `put_timeout` seconds before the entry is dropped
+    (and counted). A batch the database rejects is retried row by row so
+    only the bad entries are lost. close() drains everything still queued.
+    """
+
+    def __init__(self, app, batch_size=100, flush_interval=1.0, max_queue=10000, put_timeout=0.5):
+        self.app = app
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        self._counters = {'enqueued': 0, 'written': 0, 'batches': 0, 'dropped': 0, 'failed': 0}
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+        self._thread.start()
+        return self
+
+    def _count(self, key, amount=1):
+        with self._counter_lock:
+            self._counters[key] += amount
+
+    def log(self, user_id, action_type, description, ip_address=None):
+        entry = {
+            'user_id': user_id,
+            'action_type': action_type,
+            'description': description,
+            'ip_address': ip_address,
+            'created_at': datetime.now()
+        }
+        try:
+            self._queue.put(entry, timeout=self.put_timeout)
+            self._count('enqueued')
+        except queue.Full:
+            self._count('dropped')
+            print(f"⚠️  Activity log queue full, dropped: {action_type} - {description}")
+
+    def _take_batch(self, wait):
+        """Up to batch_size entries, waiting at most `wait` seconds for the first one"""
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=wait) if wait else self._queue.get_nowait())
+        except queue.Empty:
+            return batch
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        from database import db
+        from model import ActivityLog
+
+        with self._write_lock, self.app.app_context():
+            try:
+                db.session.execute(ActivityLog.__table__.insert().values(batch))
+                db.session.commit()
+                self._count('written', len(batch))
+                self._count('batches')
+            except Exception:
+                db.session.rollback()
+                if len(batch) == 1:
+                    self._count('failed')
+                    print("⚠️  Failed to write an activity log entry:")
+                    traceback.print_exc()
+                else:
+                    # One bad row fails the whole statement; retry row by row
+                    # so only the bad rows are lost
+                    self._write_each(batch)
+            finally:
+                db.session.remove()
+
+    def _write_each(self, batch):
+        from database import db
+        from model import ActivityLog
+
+        failed = 0
+        for entry in batch:
+            try:
+                db.session.execute(ActivityLog.__table__.insert().values(entry))
+                db.session.commit()
+                self._count('written')
+            except Exception:
+                db.session.rollback()
+                failed += 1
+                if failed == 1:
+                    print("⚠️  Failed to write an activity log entry:")
+                    traceback.print_exc()
+        if failed:
+            self._count('failed', failed)
+            print(f"⚠️  {failed} of {len(batch)} activity log entries could not be written")
+
+    def _run(self):
+        pending = []
+        deadline = time.monotonic() + self.flush_interval
+        while not self._stop.is_set():
+            pending.extend(self._take_batch(max(0.0, deadline - time.monotonic())))
+            if len(pending) >= self.batch_size or time.monotonic() >= deadline:
+                if pending:
+                    self._write(pending)
+                    pending = []
+                deadline = time.monotonic() + self.flush_interval
+        if pending:
+            self._write(pending)
+
+    def flush(self):
+        """Write everything queued so far from the calling thread"""
+        while True:
+            batch = self._take_batch(0)
+            if not batch:
+                return
+            self._write(batch)
+
+    def close(self, timeout=5.0):
+        """Stop the background thread and drain the queue (registered with atexit)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+
+    def stats(self):
+        with self._counter_lock:
+            return {**self._counters, 'queued': self._queue.qsize()}
+
+
+def log_activity(user_id, action_type, description, ip_address=None):
+    """
+    Record an ActivityLog entry. With the async writer running (the default)
+    this only enqueues it; otherwise the row is inserted and committed on
+    the current session right away.
+    """
+    writer = current_app.extensions.get('activity_log')
+    if writer is not None:
+        writer.log(user_id, action_type, description, ip_address)
+        return
+
+    from database import db
+    from model import ActivityLog
+    db.session.add(ActivityLog(
+        user_id=user_id,
+        action_type=action_type,
+        description=description,
+        ip_address=ip_address,
+        created_at=datetime.now()
+    ))
+    db.session.commit()
+
+
+def init_activity_log(app):
+    """Start the background ActivityLog writer unless ACTIVITY_LOG_ASYNC=0"""
+    if os.environ.get('ACTIVITY_LOG_ASYNC', '1') == '0':
+        return None
+    writer = ActivityLogWriter(
+        app,
+        batch_size=int(os.environ.get('ACTIVITY_LOG_BATCH_SIZE', '100')),
+        flush_interval=float(os.environ.get('ACTIVITY_LOG_FLUSH_INTERVAL', '1.0')),
+        max_queue=int(os.environ.get('ACTIVITY_LOG_QUEUE_SIZE', '10000'))
+    ).start()
+    app.extensions['activity_log'] = writer
+    atexit.register(writer.close)
+    return writer
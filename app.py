@@ -1,7 +1,13 @@
+import os
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from flask_wtf.csrf import CSRFProtect
-from database import init_db, create_tables
+from database import init_db, init_read_replicas, create_tables
+from metrics import init_metrics
+from caching import init_caching
+from tasks import init_tasks, reconcile_dashboard_job
+from activity import init_activity_log
+from sqlite_profile import init_sqlite_profile
 
 # Import blueprints
 from routes.pages import pages
@@ -11,6 +17,7 @@ from routes.locations import api_locations
 from routes.sightings import api_sightings
 from routes.reports import api_reports
 from routes.dashboard import api_dashboard
+from routes.map import api_map
 from routes.admin import api_admin
 
 
@@ -24,6 +31,8 @@ def create_app():
     app.config['SESSION_COOKIE_HTTPONLY'] = True
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
     app.config['PERMANENT_SESSION_LIFETIME'] = 3600  # 1 hour
+    # Requests with a larger body are rejected with 413 before they are read
+    app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', str(16 * 1024 * 1024)))
     
     # Initialize CORS
     CORS(app)
@@ -31,6 +40,18 @@ def create_app():
     # Initialize database
     init_db(app)
     
+    # WAL, busy timeout and write serialization on SQLite
+    init_sqlite_profile(app)
+    
+    # Send read-only GETs to replicas when DATABASE_REPLICA_URLS is set
+    init_read_replicas(app)
+    
+    # Per-request SQL statement counts and timings
+    init_metrics(app)
+    
+    # Table version counters behind ETag / Last-Modified on read APIs
+    init_caching(app)
+    
     # Initialize CSRF protection
     app.config['WTF_CSRF_CHECK_DEFAULT'] = False
     csrf = CSRFProtect(app)
@@ -64,8 +85,45 @@ def create_app():
     app.register_blueprint(api_sightings)
     app.register_blueprint(api_reports)
     app.register_blueprint(api_dashboard)
+    app.register_blueprint(api_map)
     app.register_blueprint(api_admin)
     
+    # Periodic maintenance jobs (dashboard stats reconciliation)
+    init_tasks(app)
+    
+    # Background writer that batches ActivityLog inserts off the request path
+    init_activity_log(app)
+    
+    @app.cli.command('reconcile-stats')
+    def reconcile_stats():
+        """Repair drift in today's dashboard statistics"""
+        drift = reconcile_dashboard_job()
+        print(f"✅ Dashboard stats reconciled ({len(drift)} counters repaired)")
+    
+    @app.cli.command('upgrade-db')
+    def upgrade_db():
+        """Create missing tables and indexes on an existing database and backfill derived tables"""
+        create_tables(app)
+    
+    @app.cli.command('rebuild-rollups')
+    def rebuild_rollups():
+        """Rebuild the species stats, daily rollup and map cluster tables from the raw tables"""
+        from model import rebuild_species_stats, rebuild_daily_rollups, rebuild_map_clusters
+        from database import db
+        with app.app_context():
+            rebuild_species_stats()
+            rebuild_daily_rollups()
+            rebuild_map_clusters()
+            db.session.commit()
+        print("✅ Species stats, daily rollups and map clusters rebuilt")
+    
+    @app.cli.command('sync-replicas')
+    def sync_replicas():
+        """Copy the SQLite primary onto the SQLite read replicas (local testing)"""
+        from database import sync_sqlite_replicas
+        synced = sync_sqlite_replicas(app)
+        print(f"✅ Synced replicas: {', '.join(synced)}" if synced else "No SQLite replicas configured")
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -86,11 +144,11 @@ def create_app():
     return app
 
 
-# Create application instance
-app = create_app()
-
-
 if __name__ == '__main__':
+    # The instance is only built when run as a script; importing create_app
+    # (tests, seed.py, benchmark.py, the flask CLI) doesn't start an extra
+    # app with its own activity writer and reconcile task
+    app = create_app()
     with app.app_context():
         create_tables(app)
         # Clear any persisted sessions on startup
@@ -0,0 +1,401 @@
+"""
+Endpoint micro-benchmarks for EcoTrack.
+
+Builds synthetic SQLite databases at several scales on top of seed.py's
+reference data, drives every blueprint endpoint through Flask's test
+client and records p50/p95/p99 latency, SQL statement count and peak
+Python memory per endpoint. Results are written as JSON so runs can be
+compared before and after an optimization.
+
+Usage:
+    python benchmark.py                                  # 10k and 100k rows
+    python benchmark.py --scales 10000,100000,1000000 --output after.json
+    python benchmark.py --reuse --compare before.json --output after.json
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CHUNK_SIZE = 10000
+
+# (name, method, url, body, is_write)
+# Dict bodies go out as JSON for /api/ routes and as form data otherwise;
+# string bodies are sent raw as NDJSON. A `{n}`
+# placeholder in the url or body is replaced with a fresh id counting down
+# from the scale, so destructive cases hit a different row on every call.
+BENCH_CASES = [
+    ('species.list', 'GET', '/api/species', None, False),
+    ('species.list_land', 'GET', '/api/species?category=land', None, False),
+    ('species.detail', 'GET', '/api/species/1', None, False),
+    ('species.search', 'GET', '/api/species/search?q=turtle', None, False),
+    ('species.suggest', 'GET', '/api/species/suggest?q=turtel', None, False),
+    ('locations.list', 'GET', '/api/locations', None, False),
+    ('locations.detail', 'GET', '/api/locations/1', None, False),
+    ('sightings.list', 'GET', '/api/sightings', None, False),
+    ('sightings.list_species', 'GET', '/api/sightings?species_id=1&status=verified', None, False),
+    ('sightings.detail', 'GET', '/api/sightings/1', None, False),
+    ('reports.list', 'GET', '/api/reports', None, False),
+    ('reports.list_filtered', 'GET', '/api/reports?location_id=1&status=pending&severity=Critical', None, False),
+    ('reports.detail', 'GET', '/api/reports/1', None, False),
+    ('reports.categories', 'GET', '/api/reports/categories', None, False),
+    ('reports.severity', 'GET', '/api/reports/severity', None, False),
+    ('dashboard.stats', 'GET', '/api/dashboard/stats', None, False),
+    ('dashboard.sightings_by_location', 'GET', '/api/dashboard/sightings-by-location?category=land', None, False),
+    ('dashboard.reports_by_type', 'GET', '/api/dashboard/reports-by-type', None, False),
+    ('dashboard.reports_by_type_range', 'GET', f'/api/dashboard/reports-by-type?from={date.today() - timedelta(days=90)}', None, False),
+    ('locations.severity', 'GET', '/api/locations/severity', None, False),
+    ('locations.bbox', 'GET', '/api/locations?bbox=120.9,13.7,121.2,14.0', None, False),
+    ('map.clusters', 'GET', '/api/map/clusters?zoom=8&bbox=120.0,13.0,122.0,15.0', None, False),
+    ('reports.near', 'GET', '/api/reports?near=13.7565,121.0583&radius_km=25', None, False),
+    ('reports.search', 'GET', '/api/reports/search?q=water', None, False),
+    ('dashboard.summary', 'GET', '/api/dashboard/summary', None, False),
+    ('admin.reports', 'GET', '/api/admin/reports', None, False),
+    ('admin.report_detail', 'GET', '/api/admin/reports/1', None, False),
+    ('admin.users', 'GET', '/api/admin/users', None, False),
+    ('admin.sightings', 'GET', '/api/admin/sightings', None, False),
+    ('admin.reports_export', 'GET', '/api/admin/reports?stream=1', None, False),
+    ('admin.sightings_export', 'GET', '/api/admin/sightings?stream=1', None, False),
+    ('admin.metrics', 'GET', '/api/admin/metrics', None, False),
+    ('admin.debug', 'GET', '/api/admin/debug', None, False),
+    ('pages.index', 'GET', '/', None, False),
+    ('pages.map', 'GET', '/map', None, False),
+    ('pages.species', 'GET', '/species', None, False),
+    ('pages.dashboard', 'GET', '/dashboard', None, False),
+    ('pages.about', 'GET', '/about', None, False),
+    ('pages.resources', 'GET', '/resources', None, False),
+    ('pages.submission_report', 'GET', '/submission-report', None, False),
+    ('pages.admin', 'GET', '/admin', None, False),
+    ('pages.admin_login', 'GET', '/admin/login', None, False),
+    ('pages.login', 'GET', '/login', None, False),
+    ('pages.login_admin_redirect', 'GET', '/login/admin', None, False),
+    ('auth.user_login', 'POST', '/user_login', {'username': 'admin', 'password': 'admin123'}, True),
+    ('auth.admin_login', 'POST', '/admin_login', {'username': 'admin', 'password': 'admin123'}, True),
+    ('auth.user_register', 'POST', '/user_register', {
+        'full_name': 'Bench User', 'username': 'bench{n}',
+        'password': 'bench123', 'confirm_password': 'bench123'
+    }, True),
+    ('auth.login_post', 'POST', '/login', {}, True),
+    ('auth.logout', 'GET', '/logout', None, True),
+    ('sightings.create', 'POST', '/api/sightings', {
+        'species_id': 1, 'location_id': 1, 'number_observed': 2,
+        'observer_name': 'Bench Observer', 'observer_contact': '09170000000'
+    }, True),
+    ('sightings.bulk_create', 'POST', '/api/sightings/bulk', '\n'.join(
+        json.dumps({'species_id': 1 + i % 20, 'location_id': 1 + i % 34, 'number_observed': 1,
+                    'observer_name': 'Bench Observer', 'observer_contact': '09170000000'})
+        for i in range(200)
+    ), True),
+    ('sightings.update_status', 'PUT', '/api/sightings/2', {'verification_status': 'verified'}, True),
+    ('reports.create', 'POST', '/api/reports', {
+        'location_id': 1, 'report_type': 'pollution', 'severity': 'High',
+        'title': 'Benchmark report', 'description': 'Synthetic benchmark report',
+        'reporter_name': 'Bench', 'reporter_contact': 'bench@example.com',
+        'report_date': date.today().isoformat()
+    }, True),
+    ('reports.update_status', 'PUT', '/api/reports/2', {'status': 'in_progress'}, True),
+    ('admin.update_report', 'PUT', '/api/admin/reports/3', {'status': 'in_progress'}, True),
+    ('admin.verify_sighting', 'PUT', '/api/admin/sightings/3/verify', {'status': 'verified'}, True),
+    ('admin.refresh_stats', 'POST', '/api/admin/species/refresh-stats', None, True),
+    ('admin.reconcile_dashboard', 'POST', '/api/admin/dashboard/reconcile', None, True),
+    ('admin.delete_sighting', 'DELETE', '/api/admin/sightings/{n}', None, True),
+    ('admin.delete_report', 'DELETE', '/api/admin/reports/{n}', None, True),
+    ('admin.delete_user', 'DELETE', '/api/admin/users/2', None, True),
+]
+
+# Read cases behind the response cache. The cases above run with the cache
+# off so they measure the real query path; these run again with it on and
+# are reported as "<name>[cached]".
+CACHED_CASES = [
+    'species.list', 'species.detail', 'species.search', 'locations.list',
+    'locations.severity', 'map.clusters', 'reports.categories', 'pages.species'
+]
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def build_app(db_path):
+    """Create an app bound to the given SQLite file, with the response cache off"""
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    from app import create_app
+    from caching import response_cache
+    app = create_app()
+    app.config['TESTING'] = True
+    response_cache.max_entries = 0
+    return app
+
+
+def populate(app, scale, seed_value=42):
+    """Create tables, seed reference data and insert `scale` sightings and reports"""
+    import seed
+    from database import db
+    from model import (Location, Species, Sighting, EnvironmentalReport, rebuild_species_stats,
+                       rebuild_daily_rollups, rebuild_map_clusters, refresh_all_species_statistics)
+
+    rng = random.Random(seed_value)
+    with app.app_context():
+        db.create_all()
+        seed.seed_admin_user()
+        seed.seed_locations()
+        seed.seed_categories()
+        seed.seed_severity()
+        seed.seed_species()
+
+        location_ids = [l.location_id for l in Location.query.all()]
+        species_ids = [s.species_id for s in Species.query.all()]
+        today = date.today()
+        now = datetime.utcnow()
+
+        for start in range(0, scale, CHUNK_SIZE):
+            count = min(CHUNK_SIZE, scale - start)
+            sightings = []
+            reports = []
+            for _ in range(count):
+                sample = rng.choice(seed.SAMPLE_SIGHTINGS)
+                sightings.append({
+                    'species_id': rng.choice(species_ids),
+                    'location_id': rng.choice(location_ids),
+                    'sighting_date': today - timedelta(days=rng.randint(0, 730)),
+                    'number_observed': rng.randint(1, 20),
+                    'observer_name': sample['observer_name'],
+                    'observer_contact': sample['observer_contact'],
+                    'verification_status': rng.choice(['pending', 'verified', 'verified', 'rejected']),
+                    'notes': sample['notes'],
+                    'created_at': now - timedelta(seconds=rng.randint(0, 730 * 86400))
+                })
+                template = rng.choice(seed.SAMPLE_REPORTS)
+                reports.append({
+                    'location_id': rng.choice(location_ids),
+                    'report_type': template['report_type'],
+                    'severity': template['severity'],
+                    'status': rng.choice(['pending', 'in_progress', 'completed', 'closed']),
+                    'title': template['title'],
+                    'description': template['description'],
+                    'reporter_name': template['reporter_name'],
+                    'reporter_contact': template['reporter_contact'],
+                    'report_date': today - timedelta(days=rng.randint(0, 730)),
+                    'created_at': now,
+                    'updated_at': now
+                })
+            db.session.execute(Sighting.__table__.insert(), sightings)
+            db.session.execute(EnvironmentalReport.__table__.insert(), reports)
+            db.session.commit()
+
+        # Derived tables and counters the write paths normally maintain
+        rebuild_species_stats()
+        rebuild_daily_rollups()
+        rebuild_map_clusters()
+        refresh_all_species_statistics()
+        counts = dict(db.session.query(
+            EnvironmentalReport.location_id, db.func.count(EnvironmentalReport.report_id)
+        ).group_by(EnvironmentalReport.location_id).all())
+        for location in Location.query.all():
+            location.total_reports = counts.get(location.location_id, 0)
+        db.session.commit()
+
+
+def uncovered_endpoints(app):
+    """Endpoints registered on the app that no benchmark case exercises"""
+    covered = set()
+    adapter = app.url_map.bind('localhost')
+    for _, method, url, _, _ in BENCH_CASES:
+        try:
+            endpoint, _ = adapter.match(_fill(url, 1).split('?')[0], method=method)
+            covered.add(endpoint)
+        except Exception:
+            pass
+    return sorted(
+        rule.endpoint for rule in app.url_map.iter_rules()
+        if rule.endpoint not in covered and rule.endpoint != 'static'
+    )
+
+
+def _fill(value, n):
+    """Substitute the `{n}` placeholder in a url or body"""
+    if isinstance(value, dict):
+        return {key: _fill(item, n) for key, item in value.items()}
+    if isinstance(value, str):
+        return value.replace('{n}', str(n))
+    return value
+
+
+def login_admin(client):
+    with client.session_transaction() as sess:
+        sess['user_id'] = 1
+        sess['username'] = 'admin'
+        sess['user_role'] = 'admin'
+
+
+def run_case(client, method, url, body, iterations, warmup, ids):
+    """Time a single endpoint; returns latency stats, query count and peak memory"""
+    method_call = getattr(client, method.lower())
+    body_key = 'json' if url.startswith('/api/') else 'data'
+
+    def call():
+        n = next(ids)
+        if isinstance(body, str):
+            kwargs = {'data': body, 'content_type': 'application/x-ndjson'}
+        else:
+            kwargs = {body_key: _fill(body, n)} if body is not None else {}
+        return method_call(_fill(url, n), **kwargs)
+
+    for _ in range(warmup):
+        call()
+
+    latencies = []
+    status = None
+    queries = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = call()
+        response.get_data()
+        latencies.append((time.perf_counter() - started) * 1000)
+        status = response.status_code
+        queries = int(response.headers.get('X-DB-Queries', 0))
+
+    # Memory is measured on a separate request so tracing overhead does not skew latency
+    tracemalloc.start()
+    response = call()
+    response.get_data()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'status': status,
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'queries': queries,
+        'peak_memory_kb': round(peak / 1024, 1),
+        'response_bytes': len(response.get_data())
+    }
+
+
+def run_scale(scale, args):
+    db_path = os.path.join(args.db_dir, f'bench_{scale}.sqlite')
+    fresh = not (args.reuse and os.path.exists(db_path))
+    if fresh and os.path.exists(db_path):
+        os.remove(db_path)
+
+    app = build_app(db_path)
+    if fresh:
+        print(f"[BENCH] Building synthetic database with {scale} sightings and reports...")
+        started = time.perf_counter()
+        populate(app, scale)
+        print(f"        [OK] Built in {time.perf_counter() - started:.1f}s -> {db_path}")
+
+    missing = uncovered_endpoints(app)
+    if missing:
+        print(f"        [WARN] Endpoints without a benchmark case: {', '.join(missing)}")
+
+    client = app.test_client()
+    ids = itertools.count(scale, -1)
+
+    from caching import response_cache
+    cached_cases = [
+        (f'{name}[cached]', method, url, body, is_write)
+        for name, method, url, body, is_write in BENCH_CASES if name in CACHED_CASES
+    ]
+
+    results = []
+    for cases, cache_entries in ((BENCH_CASES, 0), (cached_cases, 256)):
+        response_cache.max_entries = cache_entries
+        response_cache.clear()
+        for name, method, url, body, is_write in cases:
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            iterations = args.write_iterations if is_write else args.iterations
+            warmup = 0 if is_write else args.warmup
+            login_admin(client)
+            result = run_case(client, method, url, body, iterations, warmup, ids)
+            result.update({'name': name, 'method': method, 'url': url, 'scale': scale})
+            results.append(result)
+            print(f"        {name:<36} p50={result['p50_ms']:>9.2f}ms p95={result['p95_ms']:>9.2f}ms "
+                  f"p99={result['p99_ms']:>9.2f}ms queries={result['queries']:>5} "
+                  f"peak={result['peak_memory_kb']:>10.1f}KB status={result['status']}")
+    response_cache.max_entries = 0
+    return results
+
+
+def compare(baseline_path, results):
+    """Print p50/p95 and query-count deltas against a previous JSON run"""
+    with open(baseline_path) as fh:
+        baseline = {(r['scale'], r['name']): r for r in json.load(fh)['results']}
+
+    print("\n[COMPARE] against", baseline_path)
+    for result in results:
+        old = baseline.get((result['scale'], result['name']))
+        if not old:
+            continue
+        def delta(key):
+            if not old[key]:
+                return 'n/a'
+            return f"{(result[key] - old[key]) / old[key] * 100:+.1f}%"
+        print(f"  {result['scale']:>8} {result['name']:<36} p50 {delta('p50_ms'):>8}  p95 {delta('p95_ms'):>8}  "
+              f"queries {old['queries']} -> {result['queries']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EcoTrack endpoint micro-benchmarks')
+    parser.add_argument('--scales', default='10000,100000',
+                        help='comma-separated sighting/report counts, e.g. 10000,100000,1000000')
+    parser.add_argument('--iterations', type=int, default=30, help='timed requests per read endpoint')
+    parser.add_argument('--write-iterations', type=int, default=10, help='timed requests per write endpoint')
+    parser.add_argument('--warmup', type=int, default=3, help='untimed requests before timing reads')
+    parser.add_argument('--only', action='append', help='only run cases whose name starts with this prefix')
+    parser.add_argument('--db-dir', default=os.path.join(BASE_DIR, 'db'), help='where synthetic databases are kept')
+    parser.add_argument('--reuse', action='store_true', help='reuse an existing synthetic database for a scale')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--compare', help='previous JSON results to compare against')
+    args = parser.parse_args()
+
+    os.makedirs(args.db_dir, exist_ok=True)
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+
+    results = []
+    for scale in scales:
+        results.extend(run_scale(scale, args))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scales': scales,
+            'iterations': args.iterations,
+            'write_iterations': args.write_iterations
+        },
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\n[OK] Results written to {args.output}")
+    else:
+        print(json.dumps(report['meta'], indent=2))
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == '__main__':
+    main()
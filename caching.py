@@ -0,0 +1,252 @@
+# FILE: caching.py
+# Per-table data versions, HTTP conditional GET (ETag / Last-Modified) and
+# an in-process response cache
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timezone
+from functools import wraps
+from flask import current_app, g, has_request_context, make_response, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class TableVersions:
+    """
+    Per-table change counters and modification times, kept in the
+    table_versions table. A table's row is bumped inside the commit of a
+    transaction that wrote to it, so every process sharing the database
+    (other app workers, seed.py, flask CLI commands) sees the new version
+    exactly when the data changes. A request reads all rows once, from the
+    same database (primary or replica) its data comes from.
+    """
+
+    def read(self):
+        """{table: (version, modified_at)}, memoized for the current request"""
+        if has_request_context() and 'table_versions' in g:
+            return g.table_versions
+        from database import db
+        from model import TableVersion
+        versions = {
+            name: (version, modified_at)
+            for name, version, modified_at in db.session.execute(
+                db.select(TableVersion.table_name, TableVersion.version, TableVersion.modified_at)
+            )
+        }
+        if has_request_context():
+            g.table_versions = versions
+        return versions
+
+    def validators(self, tables, extra=None):
+        """
+        Strong ETag and Last-Modified for a representation built from
+        `tables`. Last-Modified is None while any of them has never been
+        written since versions were first tracked.
+        """
+        versions = self.read()
+        entries = [(table, *versions.get(table, (0, None))) for table in tables]
+        raw = '|'.join([
+            *(f'{table}:{version}:{modified.isoformat() if modified else ""}' for table, version, modified in entries),
+            extra or ''
+        ])
+        modified = [modified for _, _, modified in entries]
+        last_modified = None if None in modified else max(modified).replace(tzinfo=timezone.utc)
+        return hashlib.sha1(raw.encode()).hexdigest(), last_modified
+
+
+class ResponseCache:
+    """
+    Bounded LRU of rendered responses with a TTL. Each entry records the
+    tables it was built from and their versions (from table_versions) at
+    the time; an entry whose tables have moved on, including through
+    another process's writes, is treated as a miss. Commits in this process
+    also drop entries for the tables they wrote so memory is released promptly.
+    """
+
+    def __init__(self, max_entries=256, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry['version'] != version or entry['expires'] <= time.monotonic()):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return entry
+
+    def set(self, key, version, tables, body, mimetype):
+        with self._lock:
+            self._entries[key] = {
+                'version': version,
+                'tables': frozenset(tables),
+                'expires': time.monotonic() + self.ttl,
+                'body': body,
+                'mimetype': mimetype
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def invalidate(self, tables):
+        tables = set(tables)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry['tables'] & tables]
+            for key in stale:
+                del self._entries[key]
+            self._counters['invalidations'] += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hit_ratio': round(self._counters['hits'] / lookups, 3) if lookups else None
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            for key in self._counters:
+                self._counters[key] = 0
+
+
+# Process-wide registries read by the conditional() and cached() views
+table_versions = TableVersions()
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get('RESPONSE_CACHE_SIZE', '256')),
+    ttl=int(os.environ.get('RESPONSE_CACHE_TTL', '300'))
+)
+
+
+def _after_execute(conn, clauseelement, multiparams, params, execution_options, result):
+    # INSERT/UPDATE/DELETE constructs: ORM flushes, mapper-event counters, bulk statements
+    if getattr(clauseelement, 'is_dml', False) and clauseelement.table.name != 'table_versions':
+        conn.info.setdefault('changed_tables', set()).add(clauseelement.table.name)
+
+
+def _commit(conn):
+    # Runs just before the DBAPI commit, so the bump commits with the writes
+    tables = conn.info.pop('changed_tables', None)
+    if tables:
+        from model import bump_table_versions
+        bump_table_versions(conn, tables)
+        response_cache.invalidate(tables)
+
+
+def _rollback(conn):
+    conn.info.pop('changed_tables', None)
+
+
+def conditional(*tables, daily=False):
+    """
+    Serve a read view with a strong ETag and Last-Modified derived from the
+    versions of `tables` (every table the response is built from). When the
+    client's If-None-Match / If-Modified-Since still matches, answer 304
+    before the view runs, so only the version lookup queries the database.
+    Last-Modified is left out while it is unknown. Validators
+    are taken before the view, so a concurrent commit can only make the next
+    request miss, never serve stale data. `daily` folds today's date in for
+    views whose output depends on it.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag, last_modified = table_versions.validators(
+                tables, extra=date.today().isoformat() if daily else None
+            )
+
+            if request.if_none_match:
+                fresh = request.if_none_match.contains(etag)
+            else:
+                # HTTP dates have whole seconds, so a change in the same second
+                # as the client's date can't be ruled out: only an earlier
+                # second is fresh
+                fresh = (request.if_modified_since is not None and last_modified is not None
+                         and last_modified.replace(microsecond=0) < request.if_modified_since)
+
+            if fresh:
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            # Let browsers keep the body but revalidate on every use
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
+
+def _cache_key():
+    """Endpoint plus view args and query args, order-normalized"""
+    args = tuple(sorted(request.args.items(multi=True)))
+    view_args = tuple(sorted((request.view_args or {}).items()))
+    return (request.endpoint, view_args, args)
+
+
+def cached(*tables):
+    """
+    Keep the rendered 200 response of a read view in the response cache,
+    keyed by endpoint and normalized arguments. Only for views whose output
+    depends on nothing but `tables` and the request arguments (no session).
+    Goes inside @conditional so a 304 is still answered first.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if response_cache.max_entries <= 0:
+                return view(*args, **kwargs)
+
+            key = _cache_key()
+            # Versions are read before the view runs, like conditional()
+            version, _ = table_versions.validators(tables)
+            entry = response_cache.get(key, version)
+            if entry is not None:
+                return current_app.response_class(entry['body'], mimetype=entry['mimetype'])
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.direct_passthrough:
+                response_cache.set(key, version, tables, response.get_data(), response.mimetype)
+            return response
+        return wrapper
+    return decorator
+
+
+def init_caching(app):
+    """
+    Hook engine events that bump table versions and drop cached responses on
+    commit, and create the table_versions table if the database predates it
+    (every commit that writes needs it)
+    """
+    from database import db
+    from model import TableVersion
+    if not event.contains(Engine, 'after_execute', _after_execute):
+        event.listen(Engine, 'after_execute', _after_execute)
+        event.listen(Engine, 'commit', _commit)
+        event.listen(Engine, 'rollback', _rollback)
+    with app.app_context():
+        TableVersion.__table__.create(db.engine, checkfirst=True)
+    return table_versions
@@ -3,10 +3,50 @@
 # Database Configuration and Connection
 
 import os
+import random
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from flask import current_app, g, has_app_context, request, session
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool, SingletonThreadPool, StaticPool
+from metrics import TimedQueuePool
+
+# Bind keys of the read replicas configured from DATABASE_REPLICA_URLS
+REPLICA_BIND_PREFIX = 'replica_'
+# Blueprints whose GET requests may be served from a read replica
+READ_REPLICA_BLUEPRINTS = {
+    'api_species', 'api_locations', 'api_reports', 'api_sightings', 'api_dashboard', 'api_map'
+}
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to the replica picked for the request
+    (g.read_replica) and flushes, DML and everything else to the primary.
+    The first write in a request keeps the rest of it on the primary, so
+    it reads its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if has_app_context() and bind is None:
+            if self._flushing or getattr(clause, 'is_dml', False):
+                g.read_replica = None
+                g.primary_write = True
+            elif g.get('read_replica'):
+                return self._db.engines[g.read_replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
 
 # Initialize SQLAlchemy instance
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+# Worker threads for independent read queries (see run_concurrently)
+QUERY_WORKERS = int(os.environ.get('DB_QUERY_WORKERS', '4'))
+_query_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix='db-query')
 
 
 def build_sqlalchemy_uri_from_env():
@@ -35,20 +75,242 @@ def build_sqlalchemy_uri_from_env():
     return f'sqlite:///{sqlite_path}'
 
 
+def build_engine_options_from_env(uri):
+    """
+    Connection-pool options for `uri` from DB_POOL_* env vars. Server
+    databases default to pre-ping and a 30 minute recycle so connections
+    the server has dropped are replaced instead of failing a request.
+    In-memory SQLite keeps Flask-SQLAlchemy's single shared connection.
+    """
+    url = make_url(uri)
+    is_sqlite = url.get_backend_name() == 'sqlite'
+    if is_sqlite and url.database in (None, '', ':memory:'):
+        return {}
+
+    return {
+        'poolclass': TimedQueuePool,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', '10')),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', '-1' if is_sqlite else '1800')),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '0' if is_sqlite else '1') == '1'
+    }
+
+
 def init_db(app):
 
     app.config.setdefault('SQLALCHEMY_DATABASE_URI', build_sqlalchemy_uri_from_env())
     app.config.setdefault('SQLALCHEMY_TRACK_MODIFICATIONS', False)
-    # optional engine options from env (JSON string not required)
+    # optional engine options from env (individual DB_POOL_* vars, no JSON)
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS', build_engine_options_from_env(app.config['SQLALCHEMY_DATABASE_URI'])
+    )
+    # optional read replicas: comma-separated URIs, bound as replica_0, replica_1, ...
+    binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+    replica_urls = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    for i, url in enumerate(replica_urls):
+        binds.setdefault(f'{REPLICA_BIND_PREFIX}{i}', {'url': url, **build_engine_options_from_env(url)})
     db.init_app(app)
     return db
 
 
+def replica_keys(app):
+    return sorted(key for key in app.config.get('SQLALCHEMY_BINDS', {}) if key.startswith(REPLICA_BIND_PREFIX))
+
+
+def init_read_replicas(app):
+    """
+    Route GET requests of the read-only API blueprints to a random replica.
+    A client that wrote within READ_REPLICA_STICKY_SECONDS (tracked in its
+    session), or sends X-Read-Primary: 1, reads from the primary instead.
+    Does nothing when no replica is configured.
+    """
+    replicas = replica_keys(app)
+    app.config.setdefault('READ_REPLICA_STICKY_SECONDS', float(os.environ.get('READ_REPLICA_STICKY_SECONDS', '5')))
+    if not replicas:
+        return []
+    sticky_seconds = app.config['READ_REPLICA_STICKY_SECONDS']
+
+    @app.before_request
+    def choose_read_replica():
+        if (request.method in ('GET', 'HEAD')
+                and request.blueprint in READ_REPLICA_BLUEPRINTS
+                and request.headers.get('X-Read-Primary') != '1'
+                and session.get('read_primary_until', 0) <= time.time()):
+            g.read_replica = random.choice(replicas)
+
+    @app.after_request
+    def stick_to_primary(response):
+        wrote = request.method not in ('GET', 'HEAD', 'OPTIONS') or g.get('primary_write')
+        if wrote and response.status_code < 400 and sticky_seconds > 0:
+            session['read_primary_until'] = time.time() + sticky_seconds
+        return response
+
+    return replicas
+
+
+@contextmanager
+def primary_reads():
+    """Read from the primary inside the block, e.g. to check a row before creating it"""
+    replica = g.pop('read_replica', None)
+    try:
+        yield
+    finally:
+        if replica and not g.get('primary_write'):
+            g.read_replica = replica
+
+
+def sync_sqlite_replicas(app):
+    """Copy a SQLite primary onto SQLite replicas with the backup API (for trying replicas locally)"""
+    synced = []
+    with app.app_context():
+        primary = db.engines[None]
+        if primary.dialect.name != 'sqlite':
+            return synced
+        for key in replica_keys(app):
+            replica = db.engines[key]
+            if replica.dialect.name != 'sqlite':
+                continue
+            replica.dispose()
+            source = sqlite3.connect(primary.url.database)
+            target = sqlite3.connect(replica.url.database)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+            synced.append(key)
+    return synced
+
+
+def pool_status():
+    """Live size, idle, checked-out and overflow counts of each engine's pool (app context)"""
+    status = {}
+    for key, engine in db.engines.items():
+        pool = engine.pool
+        entry = {'pool': type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            entry.update({
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': pool.overflow(),
+                'timeout': pool.timeout()
+            })
+        status[key or 'default'] = entry
+    return status
+
+
 def create_tables(app):
 
     with app.app_context():
         db.create_all()
         print("✅ Database tables created successfully!")
+        added = upgrade_columns()
+        if added:
+            print(f"✅ Added missing columns: {', '.join(added)}")
+        created = upgrade_indexes()
+        if created:
+            print(f"✅ Added missing indexes: {', '.join(created)}")
+        from search import ensure_search_indexes
+        with db.engine.begin() as connection:
+            created = ensure_search_indexes(connection)
+        if created:
+            print(f"✅ Added search indexes: {', '.join(created)}")
+        from sqlalchemy.exc import IntegrityError
+        from model import backfill_derived_tables
+        try:
+            rebuilt = backfill_derived_tables()
+            db.session.commit()
+        except IntegrityError:
+            # Another process recorded the same backfill first
+            db.session.rollback()
+            rebuilt = []
+        if rebuilt:
+            print(f"✅ Backfilled derived tables: {', '.join(rebuilt)}")
+
+
+def upgrade_columns():
+    """
+    Add model-declared nullable columns that are missing from existing
+    tables (create_all() never alters a table it didn't create). Must run
+    inside an app context; returns the created columns as table.column.
+    """
+    from sqlalchemy import inspect, text
+    
+    inspector = inspect(db.engine)
+    added = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable or column.primary_key:
+                continue
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as connection:
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            added.append(f'{table.name}.{column.name}')
+    return added
+
+
+def upgrade_indexes():
+    """
+    Create model-declared indexes that are missing from existing tables.
+    create_all() only indexes tables it creates itself, so databases made
+    before an index was declared need this (works on SQLite and MySQL).
+    Must run inside an app context; returns the names of created indexes.
+    """
+    from sqlalchemy import inspect
+    
+    inspector = inspect(db.engine)
+    created = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=db.engine)
+                created.append(index.name)
+    return created
+
+
+def run_concurrently(*jobs):
+    """
+    Run independent zero-argument callables in parallel and return their
+    results in order. Each job gets its own app context, so its own session
+    and pooled connection; jobs must not share ORM objects with the caller.
+    SQL counters recorded by the jobs are added to the current request's.
+    A StaticPool (in-memory SQLite) shares one connection between threads
+    and a SingletonThreadPool opens a separate one, and for in-memory SQLite
+    a separate database, per thread; with either the jobs run one after
+    another on the caller's session instead.
+    """
+    app = current_app._get_current_object()
+    track = has_app_context() and 'sql_metrics' in g
+    replica = g.get('read_replica') if has_app_context() else None
+    
+    engine = db.engines[replica] if replica else db.engine
+    if isinstance(engine.pool, (StaticPool, SingletonThreadPool)):
+        return [job() for job in jobs]
+
+    def call(job):
+        with app.app_context():
+            g.read_replica = replica
+            if track:
+                g.sql_metrics = {'queries': 0, 'rows': 0, 'db_time': 0.0}
+            return job(), g.get('sql_metrics')
+
+    futures = [_query_executor.submit(call, job) for job in jobs]
+    results = []
+    for future in futures:
+        result, stats = future.result()
+        if track and stats:
+            for key, value in stats.items():
+                g.sql_metrics[key] += value
+        results.append(result)
+    return results
 
 
 def drop_tables(app):
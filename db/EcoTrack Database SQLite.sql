@@ -39,12 +39,14 @@ CREATE TABLE locations (
     longitude NUMERIC(10, 7) NOT NULL,
     severity_level VARCHAR(8) NOT NULL CHECK (severity_level IN ('Critical', 'High', 'Medium', 'Low')),
     total_reports INTEGER DEFAULT 0,
+    grid_cell INTEGER,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_locations_severity ON locations(severity_level);
 CREATE INDEX idx_locations_coordinates ON locations(latitude, longitude);
+CREATE INDEX idx_locations_grid_cell ON locations(grid_cell);
 
 -- TABLE 3: SIGHTINGS
 CREATE TABLE sightings (
@@ -65,6 +67,9 @@ CREATE TABLE sightings (
 CREATE INDEX idx_sightings_date ON sightings(sighting_date);
 CREATE INDEX idx_sightings_species ON sightings(species_id);
 CREATE INDEX idx_sightings_location ON sightings(location_id);
+CREATE INDEX idx_sightings_species_status_date ON sightings(species_id, verification_status, sighting_date);
+CREATE INDEX idx_sightings_date_created ON sightings(sighting_date, created_at, sighting_id);
+CREATE INDEX idx_sightings_created ON sightings(created_at, sighting_id);
 
 -- TABLE 4: REPORT_CATEGORIES
 CREATE TABLE report_categories (
@@ -104,6 +109,8 @@ CREATE TABLE environmental_reports (
 CREATE INDEX idx_reports_type ON environmental_reports(report_type);
 CREATE INDEX idx_reports_status ON environmental_reports(status);
 CREATE INDEX idx_reports_severity ON environmental_reports(severity);
+CREATE INDEX idx_reports_location_status_severity ON environmental_reports(location_id, status, severity);
+CREATE INDEX idx_reports_date ON environmental_reports(report_date, report_id);
 
 -- TABLE 7: USERS
 CREATE TABLE users (
@@ -0,0 +1,164 @@
+# FILE: geo.py
+# Spatial grid index and bounding-box / radius filters over locations
+
+import math
+from sqlalchemy import and_, or_
+
+# Grid cell size in degrees (0.1 deg is about 11 km at the equator)
+GRID_DEGREES = 0.1
+GRID_COLUMNS = int(round(360 / GRID_DEGREES))
+# Above this many grid rows a bbox is filtered on latitude/longitude alone
+MAX_GRID_ROWS = 200
+EARTH_RADIUS_KM = 6371.0088
+MAX_RADIUS_KM = 500
+
+# Map clusters: one grid level per zoom, 4x4 cells per 256px map tile
+CLUSTER_MAX_ZOOM = 14
+CLUSTER_CELLS_PER_TILE_LOG2 = 2
+
+
+def _grid_row(lat):
+    return int(math.floor((float(lat) + 90) / GRID_DEGREES))
+
+
+def _grid_col(lon):
+    return min(int(math.floor((float(lon) + 180) / GRID_DEGREES)), GRID_COLUMNS - 1)
+
+
+def grid_cell(lat, lon):
+    """Integer id of the grid cell containing a point (row-major, so one row is a contiguous range)"""
+    if lat is None or lon is None:
+        return None
+    return _grid_row(lat) * GRID_COLUMNS + _grid_col(lon)
+
+
+def cluster_zoom(zoom):
+    """Grid level used for a map zoom (levels stop at CLUSTER_MAX_ZOOM)"""
+    return max(0, min(int(zoom), CLUSTER_MAX_ZOOM))
+
+
+def cluster_cell_size(zoom):
+    """Cluster cell edge in degrees at a map zoom"""
+    return 360.0 / 2 ** (cluster_zoom(zoom) + CLUSTER_CELLS_PER_TILE_LOG2)
+
+
+def cluster_cell(lat, lon, zoom):
+    """(row, col) of the cluster cell containing a point at a map zoom"""
+    size = cluster_cell_size(zoom)
+    rows, cols = int(round(180 / size)), int(round(360 / size))
+    row = min(int(math.floor((float(lat) + 90) / size)), rows - 1)
+    col = min(int(math.floor((float(lon) + 180) / size)), cols - 1)
+    return row, col
+
+
+def cluster_cells(lat, lon):
+    """[(zoom, row, col)] of the cells containing a point, one per grid level"""
+    return [(zoom, *cluster_cell(lat, lon, zoom)) for zoom in range(CLUSTER_MAX_ZOOM + 1)]
+
+
+def _floats(value, message):
+    try:
+        return [float(part) for part in value.split(',')]
+    except ValueError:
+        raise ValueError(message)
+
+
+def parse_bbox(value):
+    """
+    Parse 'west,south,east,north' in degrees (Leaflet's toBBoxString order)
+    into (south, west, north, east); raises ValueError if malformed
+    """
+    parts = _floats(value, 'bbox must be west,south,east,north')
+    if len(parts) != 4:
+        raise ValueError('bbox must be west,south,east,north')
+    west, south, east, north = parts
+    if not (-90 <= south <= north <= 90) or not (-180 <= west <= east <= 180):
+        raise ValueError('bbox must be west,south,east,north within valid coordinates')
+    return south, west, north, east
+
+
+def parse_near(value, radius_km):
+    """Parse 'lat,lon' and a radius into (lat, lon, radius_km); raises ValueError if malformed"""
+    parts = _floats(value, 'near must be lat,lon')
+    if len(parts) != 2:
+        raise ValueError('near must be lat,lon')
+    lat, lon = parts
+    if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+        raise ValueError('near must be lat,lon within valid coordinates')
+    radius_km = _floats(str(radius_km), 'radius_km must be a number')[0]
+    if not 0 < radius_km <= MAX_RADIUS_KM:
+        raise ValueError(f'radius_km must be between 0 and {MAX_RADIUS_KM}')
+    return lat, lon, radius_km
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (float(lat1), float(lon1), float(lat2), float(lon2)))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def radius_bbox(lat, lon, radius_km):
+    """Smallest (south, west, north, east) box containing the circle, clamped to valid coordinates"""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(lat))
+    dlon = 180 if cos_lat < 1e-6 else min(180, dlat / cos_lat)
+    return max(-90, lat - dlat), max(-180, lon - dlon), min(90, lat + dlat), min(180, lon + dlon)
+
+
+def bbox_clause(lat_column, lon_column, cell_column, bbox):
+    """
+    WHERE clause for points inside `bbox`. Grid-cell ranges (one per grid
+    row) let the cell index narrow the scan; the exact coordinate test
+    follows. Rows whose cell hasn't been backfilled yet still match on
+    coordinates alone.
+    """
+    south, west, north, east = bbox
+    exact = and_(lat_column.between(south, north), lon_column.between(west, east))
+
+    first_row, last_row = _grid_row(south), _grid_row(north)
+    if last_row - first_row >= MAX_GRID_ROWS:
+        return exact
+    first_col, last_col = _grid_col(west), _grid_col(east)
+    ranges = [
+        cell_column.between(row * GRID_COLUMNS + first_col, row * GRID_COLUMNS + last_col)
+        for row in range(first_row, last_row + 1)
+    ]
+    return and_(or_(*ranges, cell_column.is_(None)), exact)
+
+
+def location_ids_in_area(bbox=None, near=None):
+    """
+    Ids of locations inside `bbox` and/or within `near` = (lat, lon,
+    radius_km). Candidates come from the grid index; the radius is then
+    checked exactly with the haversine distance.
+    """
+    from model import Location
+
+    query = Location.query.with_entities(Location.location_id, Location.latitude, Location.longitude)
+    if bbox:
+        query = query.filter(bbox_clause(Location.latitude, Location.longitude, Location.grid_cell, bbox))
+    if near:
+        lat, lon, radius_km = near
+        query = query.filter(bbox_clause(
+            Location.latitude, Location.longitude, Location.grid_cell, radius_bbox(lat, lon, radius_km)
+        ))
+        return [
+            row.location_id for row in query
+            if haversine_km(lat, lon, row.latitude, row.longitude) <= radius_km
+        ]
+    return [row.location_id for row in query]
+
+
+def area_from_request(args):
+    """
+    Read bbox= and near=&radius_km= from request args. Returns None when
+    neither is given, otherwise the list of matching location ids; raises
+    ValueError with a client-facing message if the parameters are malformed.
+    """
+    bbox = args.get('bbox')
+    near = args.get('near')
+    if not bbox and not near:
+        return None
+    bbox = parse_bbox(bbox) if bbox else None
+    near = parse_near(near, args.get('radius_km', 10)) if near else None
+    return location_ids_in_area(bbox=bbox, near=near)
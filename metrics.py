@@ -0,0 +1,230 @@
+# FILE: metrics.py
+# Per-request SQL instrumentation and per-endpoint aggregates
+
+import threading
+import time
+from flask import g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class EndpointMetrics:
+    """Thread-safe per-endpoint totals of requests, statements, rows and timings"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, queries, rows, db_ms, total_ms):
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, {
+                'requests': 0,
+                'queries': 0,
+                'rows': 0,
+                'db_time_ms': 0.0,
+                'total_time_ms': 0.0,
+                'max_queries': 0,
+                'max_total_time_ms': 0.0
+            })
+            entry['requests'] += 1
+            entry['queries'] += queries
+            entry['rows'] += rows
+            entry['db_time_ms'] += db_ms
+            entry['total_time_ms'] += total_ms
+            entry['max_queries'] = max(entry['max_queries'], queries)
+            entry['max_total_time_ms'] = max(entry['max_total_time_ms'], total_ms)
+
+    def snapshot(self):
+        """Return aggregates with per-request averages, busiest endpoints first"""
+        with self._lock:
+            items = [(name, dict(entry)) for name, entry in self._endpoints.items()]
+
+        data = []
+        for name, entry in items:
+            requests = entry['requests'] or 1
+            data.append({
+                'endpoint': name,
+                'requests': entry['requests'],
+                'queries': entry['queries'],
+                'rows': entry['rows'],
+                'db_time_ms': round(entry['db_time_ms'], 3),
+                'total_time_ms': round(entry['total_time_ms'], 3),
+                'avg_queries': round(entry['queries'] / requests, 2),
+                'avg_db_time_ms': round(entry['db_time_ms'] / requests, 3),
+                'avg_total_time_ms': round(entry['total_time_ms'] / requests, 3),
+                'max_queries': entry['max_queries'],
+                'max_total_time_ms': round(entry['max_total_time_ms'], 3)
+            })
+        data.sort(key=lambda e: e['db_time_ms'], reverse=True)
+        return data
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+class PoolMetrics:
+    """
+    Thread-safe connection-pool counters: checkouts, how long callers
+    waited to get a connection, timeouts, and connections in use (now and
+    peak) across every pool in the process
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            in_use = getattr(self, '_counters', {}).get('in_use', 0)
+            self._counters = {
+                'checkouts': 0,
+                'connects': 0,
+                'invalidations': 0,
+                'timeouts': 0,
+                'waits': 0,
+                'wait_time_ms': 0.0,
+                'max_wait_ms': 0.0,
+                'in_use': in_use,
+                'max_in_use': in_use
+            }
+
+    def record_wait(self, wait_ms, timed_out=False):
+        with self._lock:
+            self._counters['waits'] += 1
+            self._counters['wait_time_ms'] += wait_ms
+            self._counters['max_wait_ms'] = max(self._counters['max_wait_ms'], wait_ms)
+            if timed_out:
+                self._counters['timeouts'] += 1
+
+    def count(self, key, amount=1):
+        with self._lock:
+            self._counters[key] += amount
+            if key == 'in_use':
+                self._counters['max_in_use'] = max(self._counters['max_in_use'], self._counters['in_use'])
+
+    def snapshot(self):
+        with self._lock:
+            data = dict(self._counters)
+        data['avg_wait_ms'] = round(data['wait_time_ms'] / data['waits'], 3) if data['waits'] else None
+        data['wait_time_ms'] = round(data['wait_time_ms'], 3)
+        data['max_wait_ms'] = round(data['max_wait_ms'], 3)
+        return data
+
+
+# Process-wide registries read by /api/admin/metrics
+endpoint_metrics = EndpointMetrics()
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection (including timeouts)"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_wait((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        pool_metrics.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+
+def _pool_connect(dbapi_connection, connection_record):
+    pool_metrics.count('connects')
+
+
+def _pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.count('checkouts')
+    pool_metrics.count('in_use')
+
+
+def _pool_checkin(dbapi_connection, connection_record):
+    pool_metrics.count('in_use', -1)
+
+
+def _pool_invalidate(dbapi_connection, connection_record, exception):
+    # Includes connections found dead by pool_pre_ping
+    pool_metrics.count('invalidations')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_app_context() and 'sql_metrics' in g:
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not has_app_context() or 'sql_metrics' not in g:
+        return
+    starts = conn.info.get('query_start')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = g.sql_metrics
+    stats['queries'] += 1
+    stats['db_time'] += elapsed
+    # DBAPI rowcount: affected rows for DML, fetched rows on drivers that report it (-1 otherwise)
+    if cursor.rowcount and cursor.rowcount > 0:
+        stats['rows'] += cursor.rowcount
+
+
+def current_request_metrics():
+    """Statement count, rows and DB time (ms) recorded so far for this request"""
+    stats = g.get('sql_metrics') or {'queries': 0, 'rows': 0, 'db_time': 0.0}
+    return {
+        'queries': stats['queries'],
+        'rows': stats['rows'],
+        'db_time_ms': stats['db_time'] * 1000
+    }
+
+
+def init_metrics(app):
+    """Hook engine, pool and request callbacks that feed the per-endpoint and pool metrics"""
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Pool, 'connect', _pool_connect)
+        event.listen(Pool, 'checkout', _pool_checkout)
+        event.listen(Pool, 'checkin', _pool_checkin)
+        event.listen(Pool, 'invalidate', _pool_invalidate)
+
+    @app.before_request
+    def start_sql_metrics():
+        g.sql_metrics = {'queries': 0, 'rows': 0, 'db_time': 0.0}
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_sql_metrics(response):
+        if 'sql_metrics' not in g:
+            return response
+
+        endpoint = request.endpoint or 'unmatched'
+        if response.is_streamed:
+            # The body and its queries run after this hook, so the headers
+            # can't carry the totals; record them once the response closes
+            sql_metrics, started = g.sql_metrics, g.request_started
+
+            def record_streamed():
+                endpoint_metrics.record(endpoint, sql_metrics['queries'], sql_metrics['rows'],
+                                        sql_metrics['db_time'] * 1000, (time.perf_counter() - started) * 1000)
+
+            response.call_on_close(record_streamed)
+            return response
+
+        stats = current_request_metrics()
+        total_ms = (time.perf_counter() - g.request_started) * 1000
+
+        response.headers['X-DB-Queries'] = str(stats['queries'])
+        response.headers['Server-Timing'] = (
+            f'db;dur={stats["db_time_ms"]:.2f};desc="{stats["queries"]} queries", '
+            f'app;dur={total_ms:.2f}'
+        )
+
+        endpoint_metrics.record(endpoint, stats['queries'], stats['rows'], stats['db_time_ms'], total_ms)
+        return response
+
+    return endpoint_metrics
@@ -1,15 +1,26 @@
 from database import db  # Import db from database.py
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from geo import grid_cell, cluster_cells
+import search  # noqa: F401 - builds the full-text indexes along with the tables
 
 # SPECIES MODEL
 
 class Species(db.Model):
     __tablename__ = 'species'
+    __table_args__ = (
+        db.Index('idx_species_category', 'category'),
+        db.Index('idx_species_type', 'species_type'),
+        db.Index('idx_conservation_status', 'conservation_status'),
+    )
     
     species_id = db.Column(db.Integer, primary_key=True)
     common_name = db.Column(db.String(100), nullable=False)
     scientific_name = db.Column(db.String(150), nullable=False)
-    category = db.Column(db.Enum('land', 'water'), nullable=False)
+    category = db.column_property(db.Column(db.Enum('land', 'water'), nullable=False), active_history=True)
     species_type = db.Column(db.String(50))  # bird, mammal, reptile, fish
     conservation_status = db.Column(db.String(50))
     status_trend = db.Column(db.Enum('stable', 'increasing', 'decreasing', 'unknown'))
@@ -25,17 +36,9 @@ class Species(db.Model):
     sightings = db.relationship('Sighting', backref='species', lazy=True, cascade='all, delete-orphan')
     
     def update_statistics(self):
-        """Update species statistics based on verified sightings"""
-        from sqlalchemy import func
-        
-        # Get verified sightings for this species
-        verified_sightings = Sighting.query.filter_by(
-            species_id=self.species_id,
-            verification_status='verified'
-        ).all()
-        
-        # Calculate total observed count
-        total_observed = sum(s.number_observed or 1 for s in verified_sightings)
+        """Update species statistics from the maintained species_stats row"""
+        stats = SpeciesStats.query.get(self.species_id)
+        total_observed = stats.total_observed if stats else 0
         
         # Update total sightings estimate
         if total_observed > 0:
@@ -49,56 +52,54 @@ class Species(db.Model):
         self.updated_at = datetime.utcnow()
     
     def _calculate_trend(self):
-        """Calculate population trend based on sighting patterns"""
-        from sqlalchemy import func
-        
+        """Calculate population trend from the per-day verified sighting buckets"""
         now = datetime.utcnow().date()
         thirty_days_ago = now - timedelta(days=30)
         sixty_days_ago = now - timedelta(days=60)
         
-        # Count verified sightings in recent period (last 30 days)
-        recent_sightings = Sighting.query.filter(
-            Sighting.species_id == self.species_id,
-            Sighting.verification_status == 'verified',
-            Sighting.sighting_date >= thirty_days_ago
-        ).count()
-        
-        # Count verified sightings in previous period (30-60 days ago)
-        previous_sightings = Sighting.query.filter(
-            Sighting.species_id == self.species_id,
-            Sighting.verification_status == 'verified',
-            Sighting.sighting_date >= sixty_days_ago,
-            Sighting.sighting_date < thirty_days_ago
-        ).count()
-        
-        # Determine trend
+        # Recent period (last 30 days) vs previous period (30-60 days ago)
+        recent_sightings, previous_sightings = db.session.query(
+            db.func.sum(db.case(
+                (SpeciesDailyStats.stat_date >= thirty_days_ago, SpeciesDailyStats.verified_count),
+                else_=0
+            )),
+            db.func.sum(db.case(
+                (SpeciesDailyStats.stat_date < thirty_days_ago, SpeciesDailyStats.verified_count),
+                else_=0
+            ))
+        ).filter(
+            SpeciesDailyStats.species_id == self.species_id,
+            SpeciesDailyStats.stat_date >= sixty_days_ago
+        ).one()
+        self.status_trend = self.trend_from_counts(recent_sightings or 0, previous_sightings or 0)
+    
+    @staticmethod
+    def trend_from_counts(recent_sightings, previous_sightings):
+        """Map recent (last 30 days) vs previous (30-60 days) sighting counts to a trend"""
         if recent_sightings == 0 and previous_sightings == 0:
-            self.status_trend = 'unknown'
+            return 'unknown'
         elif recent_sightings > previous_sightings:
-            self.status_trend = 'increasing'
+            return 'increasing'
         elif recent_sightings < previous_sightings:
-            self.status_trend = 'decreasing'
-        else:
-            self.status_trend = 'stable'
+            return 'decreasing'
+        return 'stable'
     
     def get_verified_sighting_count(self):
         """Get the count of verified sightings for this species"""
-        return Sighting.query.filter_by(
-            species_id=self.species_id,
-            verification_status='verified'
-        ).count()
+        return load_species_stats([self.species_id]).get(self.species_id, (0, 0))[0]
     
     def get_total_observed(self):
         """Get total number of animals observed from verified sightings"""
-        verified_sightings = Sighting.query.filter_by(
-            species_id=self.species_id,
-            verification_status='verified'
-        ).all()
-        return sum(s.number_observed or 1 for s in verified_sightings)
+        return load_species_stats([self.species_id]).get(self.species_id, (0, 0))[1]
     
-    def to_dict(self):
-        verified_count = self.get_verified_sighting_count()
-        total_observed = self.get_total_observed()
+    def to_dict(self, stats=None):
+        """
+        Serialize species. `stats` is an optional (verified_count, total_observed)
+        tuple from load_species_stats(); when omitted the counts are queried.
+        """
+        if stats is None:
+            stats = load_species_stats([self.species_id]).get(self.species_id, (0, 0))
+        verified_count, total_observed = stats
         
         # Dynamic sightings estimate based on actual data
         if verified_count > 0:
@@ -127,6 +128,16 @@ class Species(db.Model):
         return f'<Species {self.common_name}>'
 
 
+def observed_count(number_observed):
+    """Animals a verified sighting counts for: number_observed, with missing or 0 counted as 1"""
+    return number_observed or 1
+
+
+def observed_count_sql(column):
+    """SQL form of observed_count()"""
+    return db.func.coalesce(db.func.nullif(column, 0), 1)
+
+
 # Helper function to update species statistics
 def update_species_stats(species_id):
     """Update statistics for a specific species"""
@@ -138,6 +149,89 @@ def update_species_stats(species_id):
     return False
 
 
+def refresh_all_species_statistics():
+    """
+    Recompute total_sightings_estimate and status_trend for every species
+    set-based: one grouped query with conditional aggregation over verified
+    sightings, then one executemany UPDATE. Returns the number of species.
+    """
+    now = datetime.utcnow().date()
+    thirty_days_ago = now - timedelta(days=30)
+    sixty_days_ago = now - timedelta(days=60)
+    
+    rows = db.session.query(
+        Species.species_id,
+        db.func.sum(db.case(
+            (Sighting.sighting_id.isnot(None), observed_count_sql(Sighting.number_observed)),
+            else_=0
+        )),
+        db.func.sum(db.case((Sighting.sighting_date >= thirty_days_ago, 1), else_=0)),
+        db.func.sum(db.case(
+            (db.and_(Sighting.sighting_date >= sixty_days_ago, Sighting.sighting_date < thirty_days_ago), 1),
+            else_=0
+        ))
+    ).outerjoin(Sighting, db.and_(
+        Sighting.species_id == Species.species_id,
+        Sighting.verification_status == 'verified'
+    )).group_by(Species.species_id).all()
+    
+    if not rows:
+        return 0
+    
+    updated_at = datetime.utcnow()
+    params = [
+        {
+            'b_species_id': species_id,
+            'b_estimate': str(int(total)) if total else 'No verified sightings',
+            'b_trend': Species.trend_from_counts(recent or 0, previous or 0),
+            'b_updated_at': updated_at,
+        }
+        for species_id, total, recent, previous in rows
+    ]
+    
+    table = Species.__table__
+    db.session.execute(
+        table.update()
+        .where(table.c.species_id == db.bindparam('b_species_id'))
+        .values(
+            total_sightings_estimate=db.bindparam('b_estimate'),
+            status_trend=db.bindparam('b_trend'),
+            updated_at=db.bindparam('b_updated_at')
+        ),
+        params
+    )
+    return len(params)
+
+
+def load_species_stats(species_ids):
+    """
+    Load verified sighting count and total observed for a batch of species
+    from the species_stats table in one query.
+    Returns {species_id: (verified_count, total_observed)}; species without
+    verified sightings are left out.
+    """
+    species_ids = list(species_ids)
+    if not species_ids:
+        return {}
+    
+    rows = db.session.query(
+        SpeciesStats.species_id,
+        SpeciesStats.verified_count,
+        SpeciesStats.total_observed
+    ).filter(
+        SpeciesStats.species_id.in_(species_ids),
+        SpeciesStats.verified_count > 0
+    ).all()
+    
+    return {species_id: (count, total) for species_id, count, total in rows}
+
+
+def species_list_to_dict(species_list):
+    """Serialize a list of species using one batched stats query"""
+    stats = load_species_stats(s.species_id for s in species_list)
+    return [s.to_dict(stats=stats.get(s.species_id, (0, 0))) for s in species_list]
+
+
 # REPORT CATEGORY MODEL
 
 class ReportCategory(db.Model):
@@ -184,14 +278,21 @@ class ReportSeverity(db.Model):
 
 class Location(db.Model):
     __tablename__ = 'locations'
+    __table_args__ = (
+        db.Index('idx_locations_severity', 'severity_level'),
+        db.Index('idx_locations_coordinates', 'latitude', 'longitude'),
+        db.Index('idx_locations_grid_cell', 'grid_cell'),
+    )
     
     location_id = db.Column(db.Integer, primary_key=True)
     city_name = db.Column(db.String(100), nullable=False)
     location_type = db.Column(db.Enum('city', 'municipality'), nullable=False)
-    latitude = db.Column(db.Numeric(10, 7), nullable=False)
-    longitude = db.Column(db.Numeric(10, 7), nullable=False)
+    latitude = db.column_property(db.Column(db.Numeric(10, 7), nullable=False), active_history=True)
+    longitude = db.column_property(db.Column(db.Numeric(10, 7), nullable=False), active_history=True)
     severity_level = db.Column(db.Enum('Low', 'Medium', 'High', 'Critical'), nullable=False)
     total_reports = db.Column(db.Integer, default=0)
+    # Spatial grid cell of (latitude, longitude), see geo.grid_cell; kept in step by a mapper event
+    grid_cell = db.Column(db.Integer)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -214,28 +315,51 @@ class Location(db.Model):
         return f'<Location {self.city_name}>'
 
 
+@event.listens_for(Location, 'before_insert')
+@event.listens_for(Location, 'before_update')
+def _set_location_grid_cell(mapper, connection, target):
+    target.grid_cell = grid_cell(target.latitude, target.longitude)
+
+
 
 # SIGHTING MODEL
 
 class Sighting(db.Model):
     __tablename__ = 'sightings'
+    __table_args__ = (
+        # Per-species verified lookups and trend windows
+        db.Index('idx_sightings_species_status_date', 'species_id', 'verification_status', 'sighting_date'),
+        db.Index('idx_sightings_location', 'location_id'),
+        # Keyset order of /api/sightings and /api/admin/sightings
+        db.Index('idx_sightings_date_created', 'sighting_date', 'created_at', 'sighting_id'),
+        db.Index('idx_sightings_created', 'created_at', 'sighting_id'),
+    )
     
     sighting_id = db.Column(db.Integer, primary_key=True)
-    species_id = db.Column(db.Integer, db.ForeignKey('species.species_id'), nullable=False)
-    location_id = db.Column(db.Integer, db.ForeignKey('locations.location_id'), nullable=False)
-    sighting_date = db.Column(db.Date, nullable=False, default=datetime.utcnow)
-    number_observed = db.Column(db.Integer, default=1)
+    species_id = db.column_property(db.Column(db.Integer, db.ForeignKey('species.species_id'), nullable=False), active_history=True)
+    location_id = db.column_property(db.Column(db.Integer, db.ForeignKey('locations.location_id'), nullable=False), active_history=True)
+    sighting_date = db.column_property(db.Column(db.Date, nullable=False, default=datetime.utcnow), active_history=True)
+    number_observed = db.column_property(db.Column(db.Integer, default=1), active_history=True)
     observer_name = db.Column(db.String(100))
     observer_contact = db.Column(db.String(100))
-    verification_status = db.Column(db.Enum('pending', 'verified', 'rejected'), default='pending')
+    verification_status = db.column_property(db.Column(db.Enum('pending', 'verified', 'rejected'), default='pending'), active_history=True)
     notes = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
-    def to_dict(self):
+    def to_dict(self, species_data=None, location_data=None):
+        """
+        Serialize sighting. List endpoints pass pre-serialized species/location
+        dicts (see sighting_list_to_dict) to avoid lazy loads per row.
+        """
+        if species_data is None:
+            species_data = self.species.to_dict() if self.species else None
+        if location_data is None:
+            location_data = self.location.to_dict() if self.location else None
+        
         return {
             'sighting_id': self.sighting_id,
-            'species': self.species.to_dict() if self.species else None,
-            'location': self.location.to_dict() if self.location else None,
+            'species': species_data,
+            'location': location_data,
             'sighting_date': self.sighting_date.isoformat(),
             'number_observed': self.number_observed,
             'observer_name': self.observer_name,
@@ -249,22 +373,291 @@ class Sighting(db.Model):
         return f'<Sighting {self.sighting_id} - {self.species.common_name if self.species else "Unknown"}>'
 
 
+def sighting_list_to_dict(sightings):
+    """
+    Serialize a list of sightings with batched loads: one query for species,
+    one for their stats and one for locations, no matter how many rows.
+    Each species/location is serialized once and shared across rows.
+    """
+    species_ids = {s.species_id for s in sightings}
+    location_ids = {s.location_id for s in sightings}
+    
+    species_data = {}
+    if species_ids:
+        species_list = Species.query.filter(Species.species_id.in_(species_ids)).all()
+        stats = load_species_stats(species_ids)
+        species_data = {
+            sp.species_id: sp.to_dict(stats=stats.get(sp.species_id, (0, 0)))
+            for sp in species_list
+        }
+    
+    location_data = {}
+    if location_ids:
+        locations = Location.query.filter(Location.location_id.in_(location_ids)).all()
+        location_data = {loc.location_id: loc.to_dict() for loc in locations}
+    
+    return [
+        s.to_dict(
+            species_data=species_data.get(s.species_id),
+            location_data=location_data.get(s.location_id)
+        )
+        for s in sightings
+    ]
+
+
+
+# SPECIES STATISTICS MODELS
+# Maintained incrementally by the Sighting mapper events below so that
+# reading or updating a species' stats never rescans its sightings.
+
+class SpeciesStats(db.Model):
+    __tablename__ = 'species_stats'
+    
+    species_id = db.Column(db.Integer, db.ForeignKey('species.species_id', ondelete='CASCADE'), primary_key=True)
+    verified_count = db.Column(db.Integer, nullable=False, default=0)
+    total_observed = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<SpeciesStats {self.species_id}: {self.verified_count}>'
+
+
+class SpeciesDailyStats(db.Model):
+    __tablename__ = 'species_daily_stats'
+    
+    species_id = db.Column(db.Integer, db.ForeignKey('species.species_id', ondelete='CASCADE'), primary_key=True)
+    stat_date = db.Column(db.Date, primary_key=True)
+    verified_count = db.Column(db.Integer, nullable=False, default=0)
+    total_observed = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<SpeciesDailyStats {self.species_id} {self.stat_date}: {self.verified_count}>'
+
+
+def _attr_value(target, attr, old=False):
+    """
+    Current value of a mapped attribute, or its pre-flush value when old=True.
+    Columns read with old=True are mapped with active_history, otherwise
+    setting one on an expired instance would leave no old value to read.
+    """
+    if old:
+        history = inspect(target).attrs[attr].history
+        if history.deleted:
+            return history.deleted[0]
+    return getattr(target, attr)
+
+
+def _verified_contribution(target, old=False):
+    """(species_id, stat_date, observed) a sighting adds to the stats, or None if not verified"""
+    if _attr_value(target, 'verification_status', old) != 'verified':
+        return None
+    sighting_date = _attr_value(target, 'sighting_date', old)
+    if isinstance(sighting_date, datetime):
+        sighting_date = sighting_date.date()
+    return (
+        _attr_value(target, 'species_id', old),
+        sighting_date or date.today(),
+        observed_count(_attr_value(target, 'number_observed', old))
+    )
+
+
+# Rows per multi-row upsert, well under SQLite's bound-parameter limit
+UPSERT_CHUNK_ROWS = 500
+
+
+def _upsert(connection, table, rows, key_columns, updates):
+    """
+    INSERT `rows`; where a row's key already exists, apply `updates` to the
+    existing row instead, atomically (SQLite/PostgreSQL ON CONFLICT, MySQL
+    ON DUPLICATE KEY), so concurrent first writes to a new key can't collide.
+    Other databases get a per-row UPDATE, then INSERT if nothing matched.
+    `updates(new)` maps columns to their update expressions, where
+    `new[column]` is the value the conflicting row would have inserted.
+    """
+    if 'updated_at' in table.c:
+        now = datetime.utcnow()
+        rows = [{**row, 'updated_at': now} for row in rows]
+    
+    dialect = connection.dialect.name
+    for start in range(0, len(rows), UPSERT_CHUNK_ROWS):
+        chunk = rows[start:start + UPSERT_CHUNK_ROWS]
+        if dialect in ('sqlite', 'postgresql'):
+            insert = sqlite_insert if dialect == 'sqlite' else postgresql_insert
+            statement = insert(table).values(chunk)
+            set_ = updates(statement.excluded)
+            if 'updated_at' in table.c:
+                set_['updated_at'] = statement.excluded.updated_at
+            connection.execute(statement.on_conflict_do_update(index_elements=key_columns, set_=set_))
+        elif dialect in ('mysql', 'mariadb'):
+            statement = mysql_insert(table).values(chunk)
+            set_ = updates(statement.inserted)
+            if 'updated_at' in table.c:
+                set_['updated_at'] = statement.inserted.updated_at
+            connection.execute(statement.on_duplicate_key_update(set_))
+        else:
+            for row in chunk:
+                set_ = updates(row)
+                if 'updated_at' in table.c:
+                    set_['updated_at'] = row['updated_at']
+                where = [table.c[key] == row[key] for key in key_columns]
+                if connection.execute(table.update().where(*where).values(set_)).rowcount == 0:
+                    connection.execute(table.insert().values(row))
+
+
+def _add_to_counters(connection, table, keys, deltas):
+    """Add `deltas` to the counters of the row matching `keys`, creating it (clamped at 0) if missing"""
+    _upsert(
+        connection, table,
+        [{**keys, **{column: max(delta, 0) for column, delta in deltas.items()}}],
+        list(keys),
+        lambda new: {column: table.c[column] + delta for column, delta in deltas.items()}
+    )
+
+
+def _add_many_to_counters(connection, table, key_columns, rows):
+    """Add the non-negative counters of many `rows` (keys plus counts) to their rows in one statement per chunk"""
+    if not rows:
+        return
+    counters = [column for column in rows[0] if column not in key_columns]
+    _upsert(
+        connection, table, rows, key_columns,
+        lambda new: {column: table.c[column] + new[column] for column in counters}
+    )
+
+
+def _apply_stats_delta(connection, contribution, sign):
+    """Add (sign=1) or remove (sign=-1) one verified sighting from the stats tables"""
+    species_id, stat_date, observed = contribution
+    deltas = {'verified_count': sign, 'total_observed': sign * observed}
+    
+    _add_to_counters(connection, SpeciesStats.__table__, {'species_id': species_id}, deltas)
+    _add_to_counters(connection, SpeciesDailyStats.__table__,
+                     {'species_id': species_id, 'stat_date': stat_date}, deltas)
+
+
+def _refresh_species_summary(connection, species_id):
+    """
+    Recompute a species' total_sightings_estimate and status_trend from the
+    maintained stats tables on `connection`, so they change in the same
+    flush as the sighting (the rules of Species.update_statistics())
+    """
+    now = datetime.utcnow().date()
+    thirty_days_ago = now - timedelta(days=30)
+    sixty_days_ago = now - timedelta(days=60)
+    stats = SpeciesStats.__table__
+    daily = SpeciesDailyStats.__table__
+    
+    total_observed = db.select(stats.c.total_observed).where(stats.c.species_id == species_id).scalar_subquery()
+    total, recent, previous = connection.execute(db.select(
+        total_observed,
+        db.func.sum(db.case((daily.c.stat_date >= thirty_days_ago, daily.c.verified_count), else_=0)),
+        db.func.sum(db.case((daily.c.stat_date < thirty_days_ago, daily.c.verified_count), else_=0))
+    ).where(daily.c.species_id == species_id, daily.c.stat_date >= sixty_days_ago)).one()
+    
+    table = Species.__table__
+    connection.execute(table.update().where(table.c.species_id == species_id).values(
+        total_sightings_estimate=str(total) if total and total > 0 else 'No verified sightings',
+        status_trend=Species.trend_from_counts(recent or 0, previous or 0),
+        updated_at=datetime.utcnow()
+    ))
+
+
+@event.listens_for(Sighting, 'after_insert')
+def _sighting_inserted(mapper, connection, target):
+    contribution = _verified_contribution(target)
+    if contribution:
+        _apply_stats_delta(connection, contribution, 1)
+        _refresh_species_summary(connection, contribution[0])
+
+
+@event.listens_for(Sighting, 'after_update')
+def _sighting_updated(mapper, connection, target):
+    old = _verified_contribution(target, old=True)
+    new = _verified_contribution(target)
+    if old == new:
+        return
+    if old:
+        _apply_stats_delta(connection, old, -1)
+    if new:
+        _apply_stats_delta(connection, new, 1)
+    for species_id in {contribution[0] for contribution in (old, new) if contribution}:
+        _refresh_species_summary(connection, species_id)
+
+
+@event.listens_for(Sighting, 'after_delete')
+def _sighting_deleted(mapper, connection, target):
+    contribution = _verified_contribution(target, old=True)
+    if contribution:
+        _apply_stats_delta(connection, contribution, -1)
+        _refresh_species_summary(connection, contribution[0])
+
+
+@event.listens_for(Species, 'after_delete')
+def _species_deleted(mapper, connection, target):
+    # SQLite does not enforce ON DELETE CASCADE unless foreign keys are enabled
+    for table in (SpeciesDailyStats.__table__, SpeciesStats.__table__):
+        connection.execute(table.delete().where(table.c.species_id == target.species_id))
+
+
+def rebuild_species_stats():
+    """
+    Rebuild species_stats and species_daily_stats from the sightings table.
+    Used to backfill existing databases and to repair drift after bulk
+    operations that bypass the ORM events.
+    """
+    verified = Sighting.verification_status == 'verified'
+    observed = db.func.sum(observed_count_sql(Sighting.number_observed))
+    
+    SpeciesDailyStats.query.delete()
+    SpeciesStats.query.delete()
+    
+    daily_rows = db.session.query(
+        Sighting.species_id, Sighting.sighting_date,
+        db.func.count(Sighting.sighting_id), observed
+    ).filter(verified).group_by(Sighting.species_id, Sighting.sighting_date).all()
+    
+    totals = {}
+    daily = []
+    for species_id, stat_date, count, total in daily_rows:
+        daily.append({'species_id': species_id, 'stat_date': stat_date,
+                      'verified_count': count, 'total_observed': int(total or 0)})
+        species_count, species_total = totals.get(species_id, (0, 0))
+        totals[species_id] = (species_count + count, species_total + int(total or 0))
+    
+    if daily:
+        db.session.execute(SpeciesDailyStats.__table__.insert(), daily)
+    if totals:
+        db.session.execute(SpeciesStats.__table__.insert(), [
+            {'species_id': species_id, 'verified_count': count, 'total_observed': total,
+             'updated_at': datetime.utcnow()}
+            for species_id, (count, total) in totals.items()
+        ])
+    return len(totals)
+
 
 # ENVIRONMENTAL REPORT MODEL
 
 class EnvironmentalReport(db.Model):
     __tablename__ = 'environmental_reports'
+    __table_args__ = (
+        # Filters of /api/reports, and its keyset order
+        db.Index('idx_reports_location_status_severity', 'location_id', 'status', 'severity'),
+        db.Index('idx_reports_date', 'report_date', 'report_id'),
+        db.Index('idx_reports_type', 'report_type'),
+        db.Index('idx_reports_status', 'status'),
+        db.Index('idx_reports_severity', 'severity'),
+    )
     
     report_id = db.Column(db.Integer, primary_key=True)
-    location_id = db.Column(db.Integer, db.ForeignKey('locations.location_id'), nullable=False)
-    report_type = db.Column(db.Enum('pollution', 'deforestation', 'waste_dumping', 'wildlife_incident', 'other'), nullable=False)
-    severity = db.Column(db.Enum('Low', 'Medium', 'High', 'Critical'), nullable=False)
-    status = db.Column(db.Enum('pending', 'in_progress', 'completed', 'closed'), default='pending')
+    location_id = db.column_property(db.Column(db.Integer, db.ForeignKey('locations.location_id'), nullable=False), active_history=True)
+    report_type = db.column_property(db.Column(db.Enum('pollution', 'deforestation', 'waste_dumping', 'wildlife_incident', 'other'), nullable=False), active_history=True)
+    severity = db.column_property(db.Column(db.Enum('Low', 'Medium', 'High', 'Critical'), nullable=False), active_history=True)
+    status = db.column_property(db.Column(db.Enum('pending', 'in_progress', 'completed', 'closed'), default='pending'), active_history=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
     reporter_name = db.Column(db.String(100))
     reporter_contact = db.Column(db.String(100))
-    report_date = db.Column(db.Date, nullable=False)
+    report_date = db.column_property(db.Column(db.Date, nullable=False), active_history=True)
     resolution_date = db.Column(db.Date)
     photo_url = db.Column(db.String(255))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -295,6 +688,9 @@ class EnvironmentalReport(db.Model):
 
 class User(db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('idx_users_role', 'user_role'),
+    )
     
     user_id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False)
@@ -325,6 +721,10 @@ class User(db.Model):
 
 class ActivityLog(db.Model):
     __tablename__ = 'activity_log'
+    __table_args__ = (
+        db.Index('idx_activity_user', 'user_id'),
+        db.Index('idx_activity_date', 'created_at'),
+    )
     
     log_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.user_id', ondelete='SET NULL'))
@@ -384,4 +784,557 @@ class DashboardStats(db.Model):
         }
     
     def __repr__(self):
-        return f'<DashboardStats {self.stat_date}>'
\ No newline at end of file
+        return f'<DashboardStats {self.stat_date}>'
+
+
+def compute_dashboard_counts():
+    """
+    Compute every DashboardStats counter in one round trip: one conditional
+    aggregate (SUM(CASE ...)) per table, cross-joined into a single row.
+    Returns a dict keyed by DashboardStats column name.
+    """
+    def count_if(condition):
+        return db.func.coalesce(db.func.sum(db.case((condition, 1), else_=0)), 0)
+    
+    reports = db.session.query(
+        db.func.count(EnvironmentalReport.report_id).label('total_reports'),
+        count_if(EnvironmentalReport.status == 'pending').label('pending_reports'),
+        count_if(EnvironmentalReport.status == 'completed').label('completed_reports'),
+        count_if(EnvironmentalReport.severity == 'Critical').label('critical_reports')
+    ).subquery()
+    sightings = db.session.query(
+        db.func.count(Sighting.sighting_id).label('total_sightings'),
+        count_if(Sighting.verification_status == 'verified').label('verified_sightings')
+    ).subquery()
+    species = db.session.query(
+        count_if(Species.category == 'land').label('land_species_count'),
+        count_if(Species.category == 'water').label('water_species_count')
+    ).subquery()
+    
+    # Each subquery is a single row, so joining them on TRUE yields one row
+    row = db.session.query(reports, sightings, species).select_from(reports) \
+        .join(sightings, db.true()).join(species, db.true()).one()
+    return {key: int(value or 0) for key, value in row._mapping.items()}
+
+
+# DASHBOARD STATISTICS MAINTENANCE
+# Today's DashboardStats row is kept current by applying counter deltas from
+# mapper events; when no row exists yet, the dashboard computes a fresh one.
+
+def _report_counters(target, old=False):
+    status = _attr_value(target, 'status', old)
+    return {
+        'total_reports': 1,
+        'pending_reports': int(status == 'pending'),
+        'completed_reports': int(status == 'completed'),
+        'critical_reports': int(_attr_value(target, 'severity', old) == 'Critical')
+    }
+
+
+def _sighting_counters(target, old=False):
+    return {
+        'total_sightings': 1,
+        'verified_sightings': int(_attr_value(target, 'verification_status', old) == 'verified')
+    }
+
+
+def _species_counters(target, old=False):
+    category = _attr_value(target, 'category', old)
+    return {
+        'land_species_count': int(category == 'land'),
+        'water_species_count': int(category == 'water')
+    }
+
+
+def apply_dashboard_delta(connection, delta, stat_date=None):
+    """Add counter deltas to the DashboardStats row for stat_date (today by default)"""
+    delta = {key: value for key, value in delta.items() if value}
+    if not delta:
+        return
+    table = DashboardStats.__table__
+    connection.execute(
+        table.update()
+        .where(table.c.stat_date == (stat_date or date.today()))
+        .values(**{key: db.func.coalesce(table.c[key], 0) + value for key, value in delta.items()})
+    )
+
+
+def _track_dashboard_counters(model, counters):
+    """Register insert/update/delete mapper events applying `counters` deltas"""
+    @event.listens_for(model, 'after_insert')
+    def inserted(mapper, connection, target):
+        apply_dashboard_delta(connection, counters(target))
+    
+    @event.listens_for(model, 'after_update')
+    def updated(mapper, connection, target):
+        old = counters(target, old=True)
+        new = counters(target)
+        apply_dashboard_delta(connection, {key: new[key] - old[key] for key in new})
+    
+    @event.listens_for(model, 'after_delete')
+    def deleted(mapper, connection, target):
+        apply_dashboard_delta(connection, {key: -value for key, value in counters(target, old=True).items()})
+
+
+_track_dashboard_counters(EnvironmentalReport, _report_counters)
+_track_dashboard_counters(Sighting, _sighting_counters)
+_track_dashboard_counters(Species, _species_counters)
+
+
+def reconcile_dashboard_stats(stat_date=None):
+    """
+    Compare the cached DashboardStats row with a real aggregate and repair
+    any drift (e.g. from bulk statements that bypass the mapper events).
+    Returns {counter: {'cached': n, 'actual': m}} for repaired counters;
+    the caller commits.
+    """
+    stats = DashboardStats.query.filter_by(stat_date=stat_date or date.today()).first()
+    if not stats:
+        return {}
+    
+    drift = {}
+    for key, actual in compute_dashboard_counts().items():
+        cached = getattr(stats, key)
+        if cached != actual:
+            drift[key] = {'cached': cached, 'actual': actual}
+            setattr(stats, key, actual)
+    return drift
+
+
+# DAILY ROLLUP MODELS
+# Per-day counts behind the dashboard charts, so time-ranged chart queries
+# read rollup rows instead of scanning the raw reports/sightings tables.
+
+class ReportDailyRollup(db.Model):
+    __tablename__ = 'report_daily_rollup'
+    
+    stat_date = db.Column(db.Date, primary_key=True)
+    location_id = db.Column(db.Integer, db.ForeignKey('locations.location_id', ondelete='CASCADE'), primary_key=True)
+    report_type = db.Column(db.Enum('pollution', 'deforestation', 'waste_dumping', 'wildlife_incident', 'other'), primary_key=True)
+    severity = db.Column(db.Enum('Low', 'Medium', 'High', 'Critical'), primary_key=True)
+    report_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<ReportDailyRollup {self.stat_date} {self.location_id} {self.report_type}: {self.report_count}>'
+
+
+class SightingDailyRollup(db.Model):
+    __tablename__ = 'sighting_daily_rollup'
+    
+    stat_date = db.Column(db.Date, primary_key=True)
+    location_id = db.Column(db.Integer, db.ForeignKey('locations.location_id', ondelete='CASCADE'), primary_key=True)
+    species_id = db.Column(db.Integer, db.ForeignKey('species.species_id', ondelete='CASCADE'), primary_key=True)
+    verification_status = db.Column(db.Enum('pending', 'verified', 'rejected'), primary_key=True)
+    sighting_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<SightingDailyRollup {self.stat_date} {self.location_id} {self.species_id}: {self.sighting_count}>'
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _report_rollup_key(target, old=False):
+    return {
+        'stat_date': _as_date(_attr_value(target, 'report_date', old)),
+        'location_id': _attr_value(target, 'location_id', old),
+        'report_type': _attr_value(target, 'report_type', old),
+        'severity': _attr_value(target, 'severity', old)
+    }
+
+
+def _sighting_rollup_key(target, old=False):
+    return {
+        'stat_date': _as_date(_attr_value(target, 'sighting_date', old)) or date.today(),
+        'location_id': _attr_value(target, 'location_id', old),
+        'species_id': _attr_value(target, 'species_id', old),
+        'verification_status': _attr_value(target, 'verification_status', old) or 'pending'
+    }
+
+
+def _track_rollup(model, table, rollup_key, count_column):
+    """Register insert/update/delete mapper events moving rows between rollup buckets"""
+    @event.listens_for(model, 'after_insert')
+    def inserted(mapper, connection, target):
+        _add_to_counters(connection, table, rollup_key(target), {count_column: 1})
+    
+    @event.listens_for(model, 'after_update')
+    def updated(mapper, connection, target):
+        old = rollup_key(target, old=True)
+        new = rollup_key(target)
+        if old != new:
+            _add_to_counters(connection, table, old, {count_column: -1})
+            _add_to_counters(connection, table, new, {count_column: 1})
+    
+    @event.listens_for(model, 'after_delete')
+    def deleted(mapper, connection, target):
+        _add_to_counters(connection, table, rollup_key(target, old=True), {count_column: -1})
+
+
+_track_rollup(EnvironmentalReport, ReportDailyRollup.__table__, _report_rollup_key, 'report_count')
+_track_rollup(Sighting, SightingDailyRollup.__table__, _sighting_rollup_key, 'sighting_count')
+
+
+def record_bulk_sightings(connection, rows):
+    """
+    Apply the counter changes the mapper events would have made for
+    sightings inserted with executemany, aggregated per counter row so each
+    table gets one upsert. `rows` are the insert params.
+    """
+    buckets = {}
+    for row in rows:
+        key = (row['sighting_date'], row['location_id'], row['species_id'], row['verification_status'])
+        buckets[key] = buckets.get(key, 0) + 1
+    
+    _add_many_to_counters(connection, SightingDailyRollup.__table__, ['stat_date', 'location_id', 'species_id', 'verification_status'], [
+        {'stat_date': stat_date, 'location_id': location_id, 'species_id': species_id,
+         'verification_status': status, 'sighting_count': count}
+        for (stat_date, location_id, species_id, status), count in buckets.items()
+    ])
+    
+    verified = {}
+    for row in rows:
+        if row['verification_status'] == 'verified':
+            counts = verified.setdefault((row['species_id'], row['sighting_date']), [0, 0])
+            counts[0] += 1
+            counts[1] += observed_count(row['number_observed'])
+    species_totals = {}
+    for (species_id, stat_date), (count, observed) in verified.items():
+        totals = species_totals.setdefault(species_id, [0, 0])
+        totals[0] += count
+        totals[1] += observed
+    _add_many_to_counters(connection, SpeciesStats.__table__, ['species_id'], [
+        {'species_id': species_id, 'verified_count': count, 'total_observed': observed}
+        for species_id, (count, observed) in species_totals.items()
+    ])
+    _add_many_to_counters(connection, SpeciesDailyStats.__table__, ['species_id', 'stat_date'], [
+        {'species_id': species_id, 'stat_date': stat_date, 'verified_count': count, 'total_observed': observed}
+        for (species_id, stat_date), (count, observed) in verified.items()
+    ])
+    for species_id in species_totals:
+        _refresh_species_summary(connection, species_id)
+    
+    per_location = {}
+    for row in rows:
+        if row['location_id'] is not None:
+            per_location[row['location_id']] = per_location.get(row['location_id'], 0) + 1
+    locations = Location.__table__
+    cells = {}
+    for location_id, lat, lon in connection.execute(
+        db.select(locations.c.location_id, locations.c.latitude, locations.c.longitude)
+        .where(locations.c.location_id.in_(per_location))
+    ):
+        deltas = _cluster_deltas({'sighting_count': per_location[location_id]}, lat, lon, 1)
+        for zoom, row, col in cluster_cells(lat, lon):
+            cell = cells.setdefault((zoom, row, col), {'zoom': zoom, 'cell_row': row, 'cell_col': col})
+            for column, delta in deltas.items():
+                cell[column] = cell.get(column, 0) + delta
+    _add_many_to_counters(connection, MapClusterCell.__table__, ['zoom', 'cell_row', 'cell_col'], list(cells.values()))
+    
+    apply_dashboard_delta(connection, {
+        'total_sightings': len(rows),
+        'verified_sightings': sum(1 for row in rows if row['verification_status'] == 'verified')
+    })
+
+
+def rebuild_daily_rollups():
+    """Rebuild both rollup tables from the raw tables with two INSERT ... SELECT statements"""
+    ReportDailyRollup.query.delete()
+    SightingDailyRollup.query.delete()
+    
+    report_counts = db.select(
+        EnvironmentalReport.report_date, EnvironmentalReport.location_id,
+        EnvironmentalReport.report_type, EnvironmentalReport.severity,
+        db.func.count(EnvironmentalReport.report_id)
+    ).group_by(
+        EnvironmentalReport.report_date, EnvironmentalReport.location_id,
+        EnvironmentalReport.report_type, EnvironmentalReport.severity
+    )
+    db.session.execute(ReportDailyRollup.__table__.insert().from_select(
+        ['stat_date', 'location_id', 'report_type', 'severity', 'report_count'], report_counts
+    ))
+    
+    sighting_counts = db.select(
+        Sighting.sighting_date, Sighting.location_id, Sighting.species_id,
+        db.func.coalesce(Sighting.verification_status, 'pending'),
+        db.func.count(Sighting.sighting_id)
+    ).group_by(
+        Sighting.sighting_date, Sighting.location_id, Sighting.species_id,
+        db.func.coalesce(Sighting.verification_status, 'pending')
+    )
+    db.session.execute(SightingDailyRollup.__table__.insert().from_select(
+        ['stat_date', 'location_id', 'species_id', 'verification_status', 'sighting_count'], sighting_counts
+    ))
+
+
+# MAP CLUSTER MODEL
+# Report and sighting counts per cell of a hierarchical grid (one level per
+# map zoom, see geo.cluster_cells), so the map reads one row per visible
+# cell. Coordinate sums are stored offset by +90/+180 to stay non-negative.
+
+SEVERITY_COUNT_COLUMNS = {'Low': 'low_count', 'Medium': 'medium_count', 'High': 'high_count', 'Critical': 'critical_count'}
+
+
+class MapClusterCell(db.Model):
+    __tablename__ = 'map_cluster_cells'
+    
+    zoom = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    cell_row = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    cell_col = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    report_count = db.Column(db.Integer, nullable=False, default=0)
+    sighting_count = db.Column(db.Integer, nullable=False, default=0)
+    low_count = db.Column(db.Integer, nullable=False, default=0)
+    medium_count = db.Column(db.Integer, nullable=False, default=0)
+    high_count = db.Column(db.Integer, nullable=False, default=0)
+    critical_count = db.Column(db.Integer, nullable=False, default=0)
+    lat_sum = db.Column(db.Float, nullable=False, default=0)
+    lon_sum = db.Column(db.Float, nullable=False, default=0)
+    
+    @property
+    def item_count(self):
+        return self.report_count + self.sighting_count
+    
+    def severity_counts(self):
+        return {level: getattr(self, column) for level, column in SEVERITY_COUNT_COLUMNS.items()}
+    
+    def dominant_severity(self):
+        """Most frequent report severity in the cell (ties go to the more severe), None without reports"""
+        counts = self.severity_counts()
+        if not any(counts.values()):
+            return None
+        levels = list(SEVERITY_COUNT_COLUMNS)
+        return max(levels, key=lambda level: (counts[level], levels.index(level)))
+    
+    def to_dict(self):
+        items = self.item_count or 1
+        return {
+            'lat': round(self.lat_sum / items - 90, 6),
+            'lon': round(self.lon_sum / items - 180, 6),
+            'count': self.item_count,
+            'report_count': self.report_count,
+            'sighting_count': self.sighting_count,
+            'severity': self.dominant_severity(),
+            'severity_counts': self.severity_counts()
+        }
+    
+    def __repr__(self):
+        return f'<MapClusterCell z{self.zoom} {self.cell_row}/{self.cell_col}: {self.item_count}>'
+
+
+def _cluster_deltas(counts, lat, lon, sign):
+    """Column deltas adding (sign=1) or removing (sign=-1) `counts` items located at lat/lon"""
+    items = counts.get('report_count', 0) + counts.get('sighting_count', 0)
+    deltas = {column: sign * value for column, value in counts.items()}
+    deltas['lat_sum'] = sign * items * (float(lat) + 90)
+    deltas['lon_sum'] = sign * items * (float(lon) + 180)
+    return deltas
+
+
+def _apply_cluster_delta(connection, location_id, counts, sign, coordinates=None):
+    """Add or remove items at a location in every grid level with one multi-row upsert"""
+    if location_id is None:
+        return
+    if coordinates is None:
+        locations = Location.__table__
+        coordinates = connection.execute(
+            db.select(locations.c.latitude, locations.c.longitude).where(locations.c.location_id == location_id)
+        ).first()
+        if coordinates is None:
+            return
+    lat, lon = coordinates
+    deltas = _cluster_deltas(counts, lat, lon, sign)
+    
+    table = MapClusterCell.__table__
+    _upsert(
+        connection, table,
+        [{'zoom': zoom, 'cell_row': row, 'cell_col': col,
+          **{column: max(delta, 0) for column, delta in deltas.items()}}
+         for zoom, row, col in cluster_cells(lat, lon)],
+        ['zoom', 'cell_row', 'cell_col'],
+        lambda new: {column: table.c[column] + delta for column, delta in deltas.items()}
+    )
+
+
+def _report_cluster_key(target, old=False):
+    return _attr_value(target, 'location_id', old), _attr_value(target, 'severity', old)
+
+
+def _report_cluster_counts(severity):
+    return {'report_count': 1, SEVERITY_COUNT_COLUMNS[severity]: 1}
+
+
+@event.listens_for(EnvironmentalReport, 'after_insert')
+def _report_clustered(mapper, connection, target):
+    location_id, severity = _report_cluster_key(target)
+    _apply_cluster_delta(connection, location_id, _report_cluster_counts(severity), 1)
+
+
+@event.listens_for(EnvironmentalReport, 'after_update')
+def _report_reclustered(mapper, connection, target):
+    old = _report_cluster_key(target, old=True)
+    new = _report_cluster_key(target)
+    if old != new:
+        _apply_cluster_delta(connection, old[0], _report_cluster_counts(old[1]), -1)
+        _apply_cluster_delta(connection, new[0], _report_cluster_counts(new[1]), 1)
+
+
+@event.listens_for(EnvironmentalReport, 'after_delete')
+def _report_unclustered(mapper, connection, target):
+    location_id, severity = _report_cluster_key(target, old=True)
+    _apply_cluster_delta(connection, location_id, _report_cluster_counts(severity), -1)
+
+
+@event.listens_for(Sighting, 'after_insert')
+def _sighting_clustered(mapper, connection, target):
+    _apply_cluster_delta(connection, target.location_id, {'sighting_count': 1}, 1)
+
+
+@event.listens_for(Sighting, 'after_update')
+def _sighting_reclustered(mapper, connection, target):
+    old = _attr_value(target, 'location_id', old=True)
+    if old != target.location_id:
+        _apply_cluster_delta(connection, old, {'sighting_count': 1}, -1)
+        _apply_cluster_delta(connection, target.location_id, {'sighting_count': 1}, 1)
+
+
+@event.listens_for(Sighting, 'after_delete')
+def _sighting_unclustered(mapper, connection, target):
+    _apply_cluster_delta(connection, _attr_value(target, 'location_id', old=True), {'sighting_count': 1}, -1)
+
+
+def _location_cluster_counts(connection, location_id):
+    """Everything a location contributes to the clusters, read from the rollups"""
+    reports = ReportDailyRollup.__table__
+    sightings = SightingDailyRollup.__table__
+    counts = {'report_count': 0, 'sighting_count': 0}
+    for severity, count in connection.execute(
+        db.select(reports.c.severity, db.func.sum(reports.c.report_count))
+        .where(reports.c.location_id == location_id).group_by(reports.c.severity)
+    ):
+        counts['report_count'] += int(count or 0)
+        counts[SEVERITY_COUNT_COLUMNS[severity]] = int(count or 0)
+    counts['sighting_count'] = int(connection.execute(
+        db.select(db.func.coalesce(db.func.sum(sightings.c.sighting_count), 0))
+        .where(sightings.c.location_id == location_id)
+    ).scalar())
+    return counts
+
+
+@event.listens_for(Location, 'after_update')
+def _location_moved(mapper, connection, target):
+    old = (_attr_value(target, 'latitude', old=True), _attr_value(target, 'longitude', old=True))
+    new = (target.latitude, target.longitude)
+    if old == new:
+        return
+    counts = _location_cluster_counts(connection, target.location_id)
+    if counts['report_count'] or counts['sighting_count']:
+        _apply_cluster_delta(connection, target.location_id, counts, -1, coordinates=old)
+        _apply_cluster_delta(connection, target.location_id, counts, 1, coordinates=new)
+
+
+def rebuild_map_clusters():
+    """Rebuild map_cluster_cells from per-location report and sighting counts"""
+    MapClusterCell.query.delete()
+    
+    per_location = {}
+    for location_id, severity, count in db.session.query(
+        EnvironmentalReport.location_id, EnvironmentalReport.severity, db.func.count(EnvironmentalReport.report_id)
+    ).group_by(EnvironmentalReport.location_id, EnvironmentalReport.severity):
+        counts = per_location.setdefault(location_id, {'report_count': 0, 'sighting_count': 0})
+        counts['report_count'] += count
+        counts[SEVERITY_COUNT_COLUMNS[severity]] = count
+    for location_id, count in db.session.query(
+        Sighting.location_id, db.func.count(Sighting.sighting_id)
+    ).group_by(Sighting.location_id):
+        per_location.setdefault(location_id, {'report_count': 0, 'sighting_count': 0})['sighting_count'] = count
+    
+    coordinates = {
+        row.location_id: (row.latitude, row.longitude)
+        for row in db.session.query(Location.location_id, Location.latitude, Location.longitude)
+    }
+    cells = {}
+    for location_id, counts in per_location.items():
+        if location_id not in coordinates:
+            continue
+        lat, lon = coordinates[location_id]
+        deltas = _cluster_deltas(counts, lat, lon, 1)
+        for zoom, row, col in cluster_cells(lat, lon):
+            cell = cells.setdefault((zoom, row, col), {'zoom': zoom, 'cell_row': row, 'cell_col': col})
+            for column, delta in deltas.items():
+                cell[column] = cell.get(column, 0) + delta
+    
+    if cells:
+        columns = ['report_count', 'sighting_count', 'lat_sum', 'lon_sum', *SEVERITY_COUNT_COLUMNS.values()]
+        db.session.execute(MapClusterCell.__table__.insert(), [
+            {column: 0 for column in columns} | cell for cell in cells.values()
+        ])
+    return len(cells)
+
+
+# TABLE VERSIONS
+# Per-table change counters behind the HTTP validators and response cache
+# (caching.py), shared by every process using the database.
+
+class TableVersion(db.Model):
+    __tablename__ = 'table_versions'
+    
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    modified_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+def bump_table_versions(connection, tables):
+    """Add one to the version of each of `tables` and stamp it modified now, in the connection's transaction"""
+    table = TableVersion.__table__
+    now = datetime.utcnow()
+    # Sorted, so concurrent commits lock the rows in the same order
+    _upsert(
+        connection, table,
+        [{'table_name': name, 'version': 1, 'modified_at': now} for name in sorted(tables)],
+        ['table_name'],
+        lambda new: {'version': table.c.version + 1, 'modified_at': new['modified_at']}
+    )
+
+
+# MIGRATION MARKERS
+
+class SchemaMigration(db.Model):
+    """One-time data migrations already applied to this database"""
+    __tablename__ = 'schema_migrations'
+    
+    name = db.Column(db.String(100), primary_key=True)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# Derived tables built from their source tables once per database, in order
+DERIVED_TABLE_BACKFILLS = [
+    ('backfill_species_stats', rebuild_species_stats),
+    ('backfill_daily_rollups', rebuild_daily_rollups),
+    ('backfill_map_clusters', rebuild_map_clusters)
+]
+
+
+def backfill_derived_tables():
+    """
+    Rebuild each derived table (species stats, daily rollups, map clusters)
+    whose backfill isn't recorded in schema_migrations yet, and record it,
+    so a database that predates a table gets it built in full once, even
+    if writes already reached it. Also fills missing location grid cells.
+    Returns the names of what was rebuilt; the caller commits.
+    """
+    rebuilt = []
+    missing_cells = Location.query.filter(Location.grid_cell.is_(None)).all()
+    for location in missing_cells:
+        location.grid_cell = grid_cell(location.latitude, location.longitude)
+    if missing_cells:
+        db.session.flush()
+        rebuilt.append('location_grid')
+    
+    applied = set(db.session.scalars(db.select(SchemaMigration.name)))
+    for name, rebuild in DERIVED_TABLE_BACKFILLS:
+        if name not in applied:
+            rebuild()
+            db.session.add(SchemaMigration(name=name))
+            rebuilt.append(name.removeprefix('backfill_'))
+    return rebuilt
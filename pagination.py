@@ -0,0 +1,140 @@
+# FILE: pagination.py
+# Keyset (cursor) pagination helpers for list endpoints
+
+import base64
+import json
+from datetime import date, datetime
+from sqlalchemy import and_, func, or_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# NULLs in a nullable sort column are ordered as the value for its type. Any
+# constant works as long as the ORDER BY and the cursor predicate agree;
+# ties with real values are broken by the unique last column.
+NULL_SORT_VALUES = {datetime: datetime(1970, 1, 1), date: date(1970, 1, 1)}
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded for the requested ordering"""
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values):
+    """Turn the sort-key values of the last row into an opaque token"""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token, columns):
+    """Turn a token back into sort-key values matching `columns`"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise InvalidCursor('Invalid cursor')
+        return [_decode_value(column, value) for column, value in zip(columns, values)]
+    except InvalidCursor:
+        raise
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def page_size(limit, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Clamp a requested page size to [1, maximum]"""
+    if limit is None:
+        return default
+    return max(1, min(limit, maximum))
+
+
+def _sort_key(column):
+    """
+    The expression to order and compare by. NULL never compares equal or
+    less, so a nullable column is coalesced, otherwise rows with NULL would
+    be skipped once the cursor passes them.
+    """
+    null_value = NULL_SORT_VALUES.get(column.type.python_type)
+    if column.nullable and null_value is not None:
+        return func.coalesce(column, null_value)
+    return column
+
+
+def _sort_value(column, value):
+    if value is None:
+        return NULL_SORT_VALUES.get(column.type.python_type)
+    return value
+
+
+def _order_by(columns):
+    return [_sort_key(column).desc() for column in columns]
+
+
+def _after(columns, values):
+    """WHERE clause selecting rows after `values` for a descending ordering on `columns`"""
+    keys = [_sort_key(column) for column in columns]
+    values = [_sort_value(column, value) for column, value in zip(columns, values)]
+    clauses = []
+    for i, key in enumerate(keys):
+        equal = [keys[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal, key < values[i]))
+    return or_(*clauses)
+
+
+def paginate_keyset(query, columns, cursor=None, limit=None):
+    """
+    Fetch one page of `query` ordered descending by `columns` (the last one
+    must be unique, e.g. the primary key). Rows after the cursor are found
+    with a range predicate, so any page costs the same as the first one.
+    NULLs in nullable date/datetime columns sort as NULL_SORT_VALUES.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    size = page_size(limit)
+
+    if cursor:
+        query = query.filter(_after(columns, decode_cursor(cursor, columns)))
+
+    rows = query.order_by(*_order_by(columns)).limit(size + 1).all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    return rows, next_cursor
+
+
+def iter_keyset_batches(query, columns, batch_size=DEFAULT_PAGE_SIZE * 10):
+    """
+    Walk the whole of `query` in descending key order, yielding lists of at
+    most `batch_size` rows. Each batch is its own bounded query, so memory
+    stays constant and the connection is free for lookups between batches.
+    """
+    cursor = None
+    while True:
+        batch_query = query
+        if cursor is not None:
+            batch_query = batch_query.filter(_after(columns, cursor))
+        rows = batch_query.order_by(*_order_by(columns)).limit(batch_size).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        last = rows[-1]
+        cursor = [getattr(last, column.key) for column in columns]
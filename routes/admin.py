@@ -1,7 +1,12 @@
-from flask import Blueprint, request, jsonify, session
-from datetime import datetime as datetime_module
-from model import User, EnvironmentalReport, ActivityLog, Sighting, Species, update_species_stats
-from database import db
+import time
+from flask import Blueprint, current_app, request, jsonify, session
+from model import User, EnvironmentalReport, Sighting, Species, sighting_list_to_dict, refresh_all_species_statistics, reconcile_dashboard_stats
+from database import db, pool_status
+from activity import log_activity
+from metrics import endpoint_metrics, pool_metrics
+from caching import response_cache
+from pagination import paginate_keyset, iter_keyset_batches, InvalidCursor
+from streaming import wants_ndjson, ndjson_response
 
 api_admin = Blueprint('api_admin', __name__, url_prefix='/api/admin')
 
@@ -33,36 +38,68 @@ def admin_required(f):
     return decorated_function
 
 
+def admin_report_dict(report):
+    """Flat report row used by the admin reports table and export"""
+    return {
+        'report_id': report.report_id,
+        'title': report.title,
+        'description': report.description,
+        'report_type': report.report_type,
+        'severity': report.severity,
+        'reporter_name': report.reporter_name,
+        'reporter_contact': report.reporter_contact,
+        'status': report.status
+    }
+
+
 @api_admin.route('/reports', methods=['GET'])
 def get_admin_reports():
-    """Get all environmental reports for admin dashboard"""
+    """
+    Get environmental reports for admin dashboard, one page at a time
+    Query params: limit (max 500), cursor (from next_cursor; later pages omit stats),
+    stream=1 (or Accept: application/x-ndjson) to export every report as NDJSON
+    """
     # Check admin authorization
     if 'user_id' not in session or session.get('user_role') != 'admin':
         return jsonify({'success': False, 'message': 'Unauthorized'}), 403
     
+    order = [EnvironmentalReport.report_date, EnvironmentalReport.report_id]
+    
+    if wants_ndjson():
+        return ndjson_response(
+            iter_keyset_batches(db.session.query(EnvironmentalReport), order),
+            lambda reports: [admin_report_dict(report) for report in reports]
+        )
+    
     try:
-        reports = db.session.query(EnvironmentalReport).all()
-        
-        reports_data = []
-        for report in reports:
-            reports_data.append({
-                'report_id': report.report_id,
-                'title': report.title,
-                'description': report.description,
-                'report_type': report.report_type,
-                'severity': report.severity,
-                'reporter_name': report.reporter_name,
-                'reporter_contact': report.reporter_contact,
-                'status': report.status
-            })
+        reports, next_cursor = paginate_keyset(
+            db.session.query(EnvironmentalReport),
+            order,
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', type=int)
+        )
         
-        return jsonify({
+        result = {
             'success': True,
-            'reports': reports_data,
-            'stats': {
-                'total': len(reports_data)
+            'reports': [admin_report_dict(report) for report in reports],
+            'next_cursor': next_cursor
+        }
+        
+        # Summary counts cover every report, so only the first page pays for them
+        if not request.args.get('cursor'):
+            total, pending, completed = db.session.query(
+                db.func.count(EnvironmentalReport.report_id),
+                db.func.sum(db.case((EnvironmentalReport.status == 'pending', 1), else_=0)),
+                db.func.sum(db.case((EnvironmentalReport.status == 'completed', 1), else_=0))
+            ).one()
+            result['stats'] = {
+                'total': total,
+                'pending': pending or 0,
+                'completed': completed or 0
             }
-        })
+        return jsonify(result)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
@@ -139,14 +176,7 @@ def update_admin_report(report_id):
         db.session.commit()
         
         # Log activity
-        activity = ActivityLog(
-            user_id=session.get('user_id'),
-            action_type='edit_report',
-            description=f'Edited report #{report_id}',
-            created_at=datetime_module.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(session.get('user_id'), 'edit_report', f'Edited report #{report_id}')
         
         return jsonify({
             'success': True,
@@ -178,14 +208,7 @@ def delete_admin_report(report_id):
         db.session.commit()
         
         # Log activity
-        activity = ActivityLog(
-            user_id=session.get('user_id'),
-            action_type='delete_report',
-            description=f'Deleted report #{report_id}',
-            created_at=datetime_module.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(session.get('user_id'), 'delete_report', f'Deleted report #{report_id}')
         
         return jsonify({
             'success': True,
@@ -198,18 +221,32 @@ def delete_admin_report(report_id):
 
 @api_admin.route('/users', methods=['GET'])
 def get_admin_users():
-    """Get all users for admin dashboard"""
+    """
+    Get users for admin dashboard, newest first, one page at a time
+    Query params: limit (max 500), cursor (from next_cursor; later pages omit stats)
+    """
     # Check admin authorization
     if 'user_id' not in session or session.get('user_role') != 'admin':
         return jsonify({'success': False, 'message': 'Unauthorized'}), 403
     
     try:
-        users = db.session.query(User).all()
-        users_data = [user.to_dict() for user in users]
-        return jsonify({
+        users, next_cursor = paginate_keyset(
+            db.session.query(User),
+            [User.user_id],
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', type=int)
+        )
+        result = {
             'success': True,
-            'data': users_data
-        })
+            'data': [user.to_dict() for user in users],
+            'next_cursor': next_cursor
+        }
+        # The user total is only computed for the first page
+        if not request.args.get('cursor'):
+            result['stats'] = {'total': db.session.query(db.func.count(User.user_id)).scalar()}
+        return jsonify(result)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
@@ -240,14 +277,7 @@ def delete_admin_user(user_id):
         db.session.commit()
         
         # Log activity
-        activity = ActivityLog(
-            user_id=session.get('user_id'),
-            action_type='delete_user',
-            description=f'Deleted user: {username}',
-            created_at=datetime_module.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(session.get('user_id'), 'delete_user', f'Deleted user: {username}')
         
         return jsonify({
             'success': True,
@@ -259,18 +289,51 @@ def delete_admin_user(user_id):
 
 @api_admin.route('/sightings', methods=['GET'])
 def get_admin_sightings():
-    """Get all animal sightings for admin dashboard"""
+    """
+    Get animal sightings for admin dashboard, newest submissions first
+    Query params: limit (max 500), cursor (from next_cursor; later pages omit stats),
+    stream=1 (or Accept: application/x-ndjson) to export every sighting as NDJSON
+    """
     # Check admin authorization
     if 'user_id' not in session or session.get('user_role') != 'admin':
         return jsonify({'success': False, 'message': 'Unauthorized'}), 403
     
+    order = [Sighting.created_at, Sighting.sighting_id]
+    
+    if wants_ndjson():
+        return ndjson_response(
+            iter_keyset_batches(db.session.query(Sighting), order),
+            sighting_list_to_dict
+        )
+    
     try:
-        sightings = db.session.query(Sighting).order_by(Sighting.created_at.desc()).all()
-        sightings_data = [sighting.to_dict() for sighting in sightings]
-        return jsonify({
+        sightings, next_cursor = paginate_keyset(
+            db.session.query(Sighting),
+            order,
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', type=int)
+        )
+        result = {
             'success': True,
-            'data': sightings_data
-        })
+            'data': sighting_list_to_dict(sightings),
+            'next_cursor': next_cursor
+        }
+        
+        # Summary counts cover every sighting, so only the first page pays for them
+        if not request.args.get('cursor'):
+            total, pending, verified = db.session.query(
+                db.func.count(Sighting.sighting_id),
+                db.func.sum(db.case((Sighting.verification_status == 'pending', 1), else_=0)),
+                db.func.sum(db.case((Sighting.verification_status == 'verified', 1), else_=0))
+            ).one()
+            result['stats'] = {
+                'total': total,
+                'pending': pending or 0,
+                'verified': verified or 0
+            }
+        return jsonify(result)
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
@@ -288,24 +351,14 @@ def delete_admin_sighting(sighting_id):
         if not sighting:
             return jsonify({'success': False, 'message': 'Sighting not found'}), 404
         
-        species_id = sighting.species_id  # Store species_id before deletion
         species_name = sighting.species.common_name if sighting.species else 'Unknown'
         
+        # The mapper events update the species statistics in the same commit
         db.session.delete(sighting)
         db.session.commit()
         
-        # Update species statistics after deletion
-        update_species_stats(species_id)
-        
         # Log activity
-        activity = ActivityLog(
-            user_id=session.get('user_id'),
-            action_type='delete_sighting',
-            description=f'Deleted sighting: {species_name}',
-            created_at=datetime_module.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(session.get('user_id'), 'delete_sighting', f'Deleted sighting: {species_name}')
         
         return jsonify({
             'success': True,
@@ -324,28 +377,23 @@ def refresh_all_species_stats():
         return jsonify({'success': False, 'message': 'Unauthorized'}), 403
     
     try:
-        species_list = Species.query.all()
-        updated_count = 0
-        
-        for species in species_list:
-            species.update_statistics()
-            updated_count += 1
+        started = time.perf_counter()
         
+        # One grouped query plus one bulk UPDATE; the maintained stats tables
+        # are repaired separately (flask rebuild-rollups)
+        updated_count = refresh_all_species_statistics()
         db.session.commit()
         
+        duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        
         # Log activity
-        activity = ActivityLog(
-            user_id=session.get('user_id'),
-            action_type='refresh_stats',
-            description=f'Refreshed statistics for {updated_count} species',
-            created_at=datetime_module.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(session.get('user_id'), 'refresh_stats', f'Refreshed statistics for {updated_count} species')
         
         return jsonify({
             'success': True,
-            'message': f'Statistics refreshed for {updated_count} species'
+            'message': f'Statistics refreshed for {updated_count} species',
+            'updated_count': updated_count,
+            'duration_ms': duration_ms
         })
     except Exception as e:
         db.session.rollback()
@@ -375,19 +423,9 @@ def verify_sighting(sighting_id):
         sighting.verification_status = new_status
         db.session.commit()
         
-        # Update species statistics when verification status changes
-        update_species_stats(sighting.species_id)
-        
         # Log activity
         species_name = sighting.species.common_name if sighting.species else 'Unknown'
-        activity = ActivityLog(
-            user_id=session.get('user_id'),
-            action_type='verify_sighting',
-            description=f'Changed sighting #{sighting_id} ({species_name}) from {old_status} to {new_status}',
-            created_at=datetime_module.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(session.get('user_id'), 'verify_sighting', f'Changed sighting #{sighting_id} ({species_name}) from {old_status} to {new_status}')
         
         return jsonify({
             'success': True,
@@ -396,3 +434,53 @@ def verify_sighting(sighting_id):
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@api_admin.route('/dashboard/reconcile', methods=['POST'])
+def reconcile_dashboard():
+    """Recompute today's dashboard counters and repair any drift - admin only"""
+    # Check admin authorization
+    if 'user_id' not in session or session.get('user_role') != 'admin':
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    
+    try:
+        drift = reconcile_dashboard_stats()
+        db.session.commit()
+        return jsonify({
+            'success': True,
+            'message': f'Repaired {len(drift)} dashboard counters',
+            'drift': drift
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@api_admin.route('/metrics', methods=['GET'])
+def get_admin_metrics():
+    """Per-endpoint SQL statement counts, rows and DB time, plus pool, cache, activity log and SQLite write counters - admin only
+    Query params: reset=1 clears the aggregates after reading them
+    """
+    # Check admin authorization
+    if 'user_id' not in session or session.get('user_role') != 'admin':
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    
+    data = endpoint_metrics.snapshot()
+    cache_stats = response_cache.stats()
+    pool_stats = {**pool_metrics.snapshot(), 'engines': pool_status()}
+    writer = current_app.extensions.get('activity_log')
+    sqlite_profile = current_app.extensions.get('sqlite_profile')
+    if request.args.get('reset') == '1':
+        endpoint_metrics.reset()
+        response_cache.reset_stats()
+        pool_metrics.reset()
+    
+    return jsonify({
+        'success': True,
+        'count': len(data),
+        'data': data,
+        'connection_pool': pool_stats,
+        'response_cache': cache_stats,
+        'activity_log': writer.stats() if writer else None,
+        'sqlite': sqlite_profile.stats() if sqlite_profile else None
+    })
@@ -1,7 +1,8 @@
 from flask import Blueprint, render_template, request, jsonify, redirect, url_for, flash, session
 from datetime import datetime, timedelta
-from model import User, ActivityLog
+from model import User
 from database import db
+from activity import log_activity
 
 auth = Blueprint('auth', __name__)
 
@@ -50,14 +51,7 @@ def user_login():
             db.session.commit()
             
             # Log activity
-            activity = ActivityLog(
-                user_id=user.user_id,
-                action_type='User Login',
-                description=f'User {user.username} logged in',
-                created_at=datetime.now()
-            )
-            db.session.add(activity)
-            db.session.commit()
+            log_activity(user.user_id, 'User Login', f'User {user.username} logged in')
         except Exception as log_error:
             # Continue anyway, don't block login
             pass
@@ -117,14 +111,7 @@ def user_register():
         db.session.commit()
         
         # Log activity
-        activity = ActivityLog(
-            user_id=new_user.user_id,
-            action_type='User Registration',
-            description=f'New user {username} registered',
-            created_at=datetime.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(new_user.user_id, 'User Registration', f'New user {username} registered')
         
         return jsonify({
             'success': True,
@@ -163,14 +150,7 @@ def admin_login():
             flash('You do not have admin privileges', 'admin_error')
             
             # Log failed admin login attempt
-            activity = ActivityLog(
-                user_id=user.user_id,
-                action_type='Failed Admin Login',
-                description=f'Non-admin user {username} attempted admin login',
-                created_at=datetime.now()
-            )
-            db.session.add(activity)
-            db.session.commit()
+            log_activity(user.user_id, 'Failed Admin Login', f'Non-admin user {username} attempted admin login')
             
             return render_template('AdminLogin.html')
         
@@ -192,14 +172,7 @@ def admin_login():
         db.session.commit()
         
         # Log admin login
-        activity = ActivityLog(
-            user_id=user.user_id,
-            action_type='Admin Login',
-            description=f'Admin {username} logged in',
-            created_at=datetime.now()
-        )
-        db.session.add(activity)
-        db.session.commit()
+        log_activity(user.user_id, 'Admin Login', f'Admin {username} logged in')
         
         flash(f'Welcome, Admin {user.full_name}!', 'register_success')
         return redirect(url_for('pages.admin_dashboard'))
@@ -218,14 +191,7 @@ def logout():
             username = session.get('username', 'Unknown')
             
             # Log logout activity
-            activity = ActivityLog(
-                user_id=user_id,
-                action_type='User Logout',
-                description=f'User {username} logged out',
-                created_at=datetime.now()
-            )
-            db.session.add(activity)
-            db.session.commit()
+            log_activity(user_id, 'User Logout', f'User {username} logged out')
         
         session.clear()
         flash('You have been logged out', 'register_success')
@@ -1,75 +1,251 @@
 from flask import Blueprint, request, jsonify
-from datetime import date
-from model import DashboardStats, EnvironmentalReport, Sighting, Species, Location
-from database import db
+from sqlalchemy.exc import IntegrityError
+from datetime import date, datetime
+from model import (DashboardStats, EnvironmentalReport, Sighting, Species, Location,
+                   ReportDailyRollup, SightingDailyRollup, compute_dashboard_counts,
+                   reconcile_dashboard_stats)
+from database import db, run_concurrently, primary_reads
+from caching import conditional
 
 api_dashboard = Blueprint('api_dashboard', __name__, url_prefix='/api/dashboard')
 
+# Tables behind each panel, for conditional GET validators
+STATS_TABLES = ('dashboard_stats', 'environmental_reports', 'sightings', 'species')
+SIGHTINGS_CHART_TABLES = ('sighting_daily_rollup', 'locations', 'species')
+REPORTS_CHART_TABLES = ('report_daily_rollup',)
 
-@api_dashboard.route('/stats', methods=['GET'])
-def get_dashboard_stats():
-    """Get dashboard statistics for today"""
+
+def parse_date_range():
+    """Read optional from/to (YYYY-MM-DD, inclusive) query params; raises ValueError if malformed"""
+    start = request.args.get('from')
+    end = request.args.get('to')
+    start = datetime.strptime(start, '%Y-%m-%d').date() if start else None
+    end = datetime.strptime(end, '%Y-%m-%d').date() if end else None
+    return start, end
+
+
+def filter_date_range(query, column, start, end):
+    if start:
+        query = query.filter(column >= start)
+    if end:
+        query = query.filter(column <= end)
+    return query
+
+
+def read_todays_stats():
+    """
+    Read-only half of todays_stats(), safe in a run_concurrently worker:
+    (today's DashboardStats as a dict, None), or (None, freshly computed
+    counters) when today's row doesn't exist yet
+    """
+    stats = DashboardStats.query.filter_by(stat_date=date.today()).first()
+    if stats:
+        return stats.to_dict(), None
+    return None, compute_dashboard_counts()
+
+
+def store_todays_stats(counts):
+    """
+    Create today's DashboardStats row from `counts` on the request's own
+    session and return it as a dict; if another request created it first,
+    that row is returned instead
+    """
     today = date.today()
-    stats = DashboardStats.query.filter_by(stat_date=today).first()
-    
-    if not stats:
-        # Calculate stats if not exists
-        stats = DashboardStats(
-            stat_date=today,
-            total_reports=EnvironmentalReport.query.count(),
-            pending_reports=EnvironmentalReport.query.filter_by(status='pending').count(),
-            completed_reports=EnvironmentalReport.query.filter_by(status='completed').count(),
-            critical_reports=EnvironmentalReport.query.filter_by(severity='Critical').count(),
-            total_sightings=Sighting.query.count(),
-            verified_sightings=Sighting.query.filter_by(verification_status='verified').count(),
-            land_species_count=Species.query.filter_by(category='land').count(),
-            water_species_count=Species.query.filter_by(category='water').count()
-        )
-        db.session.add(stats)
+    # A read replica may lag, so check the primary before creating the row
+    with primary_reads():
+        stats = DashboardStats.query.filter_by(stat_date=today).first()
+        if stats:
+            return stats.to_dict()
+        try:
+            db.session.add(DashboardStats(stat_date=today, **counts))
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return DashboardStats.query.filter_by(stat_date=today).one().to_dict()
+        # Writes committed while the counts were computed found no row
+        # to add their deltas to; count again now that it exists
+        reconcile_dashboard_stats(today)
         db.session.commit()
+        return DashboardStats.query.filter_by(stat_date=today).one().to_dict()
+
+
+def todays_stats():
+    """Today's DashboardStats as a dict, computing and storing the row if missing"""
+    stats, counts = read_todays_stats()
+    return stats or store_todays_stats(counts)
+
+
+def sightings_by_location(category, limit, start=None, end=None):
+    """Top cities by sightings of one species category, from the daily rollups"""
+    count = db.func.sum(SightingDailyRollup.sighting_count)
+    query = db.session.query(
+        Location.city_name,
+        count.label('count')
+    ).join(
+        SightingDailyRollup, SightingDailyRollup.location_id == Location.location_id
+    ).join(
+        Species, Species.species_id == SightingDailyRollup.species_id
+    ).filter(
+        Species.category == category
+    )
+    query = filter_date_range(query, SightingDailyRollup.stat_date, start, end)
+    results = query.group_by(Location.city_name).having(count > 0) \
+        .order_by(db.text('count DESC')).limit(limit).all()
+    return [{'city': r.city_name, 'sightings': int(r.count)} for r in results]
+
+
+def reports_by_type(start=None, end=None):
+    """Report counts per type, from the daily rollups"""
+    count = db.func.sum(ReportDailyRollup.report_count)
+    query = db.session.query(
+        ReportDailyRollup.report_type,
+        count.label('count')
+    )
+    query = filter_date_range(query, ReportDailyRollup.stat_date, start, end)
+    results = query.group_by(ReportDailyRollup.report_type).having(count > 0).all()
+    return [{'type': r.report_type, 'count': int(r.count)} for r in results]
+
+
+def recent_reports(limit):
+    """Newest reports, projected to the columns the dashboard cards show"""
+    results = db.session.query(
+        EnvironmentalReport.report_id,
+        EnvironmentalReport.title,
+        EnvironmentalReport.description,
+        EnvironmentalReport.severity,
+        EnvironmentalReport.status,
+        EnvironmentalReport.reporter_name,
+        EnvironmentalReport.report_date,
+        Location.city_name
+    ).outerjoin(
+        Location, Location.location_id == EnvironmentalReport.location_id
+    ).order_by(
+        EnvironmentalReport.report_date.desc(), EnvironmentalReport.report_id.desc()
+    ).limit(limit).all()
+    return [{
+        'report_id': r.report_id,
+        'title': r.title,
+        'description': r.description,
+        'severity': r.severity,
+        'status': r.status,
+        'reporter_name': r.reporter_name,
+        'report_date': r.report_date.isoformat(),
+        'city_name': r.city_name
+    } for r in results]
+
+
+def recent_sightings(limit):
+    """Newest sightings, projected to the columns the dashboard cards show"""
+    results = db.session.query(
+        Sighting.sighting_id,
+        Sighting.sighting_date,
+        Sighting.observer_name,
+        Sighting.notes,
+        Species.common_name,
+        Species.category,
+        Location.city_name
+    ).outerjoin(
+        Species, Species.species_id == Sighting.species_id
+    ).outerjoin(
+        Location, Location.location_id == Sighting.location_id
+    ).order_by(
+        Sighting.sighting_date.desc(), Sighting.created_at.desc(), Sighting.sighting_id.desc()
+    ).limit(limit).all()
+    return [{
+        'sighting_id': r.sighting_id,
+        'sighting_date': r.sighting_date.isoformat(),
+        'observer_name': r.observer_name,
+        'notes': r.notes,
+        'common_name': r.common_name,
+        'category': r.category,
+        'city_name': r.city_name
+    } for r in results]
+
+
+@api_dashboard.route('/summary', methods=['GET'])
+@conditional(*STATS_TABLES, *SIGHTINGS_CHART_TABLES, *REPORTS_CHART_TABLES, daily=True)
+def get_dashboard_summary():
+    """
+    Everything the dashboard page needs in one response: stat cards, chart
+    aggregates and lean lists of recent reports and sightings. The panels are
+    independent, so they are queried in parallel on separate connections.
+    Query params: limit (chart bars, default 5), recent (list size, default 10),
+    from/to (YYYY-MM-DD, inclusive; applies to the charts)
+    """
+    limit = request.args.get('limit', 5, type=int)
+    recent = min(max(request.args.get('recent', 10, type=int), 1), 100)
+    try:
+        start, end = parse_date_range()
+    except ValueError:
+        return jsonify({'success': False, 'message': 'from/to must be YYYY-MM-DD'}), 400
+    
+    (stats, counts), by_type, land, water, reports, sightings = run_concurrently(
+        read_todays_stats,
+        lambda: reports_by_type(start, end),
+        lambda: sightings_by_location('land', limit, start, end),
+        lambda: sightings_by_location('water', limit, start, end),
+        lambda: recent_reports(recent),
+        lambda: recent_sightings(recent)
+    )
+    # Workers only read; the first request of the day creates the row here
+    stats = stats or store_todays_stats(counts)
     
     return jsonify({
         'success': True,
-        'data': stats.to_dict()
+        'data': {
+            'stats': stats,
+            'reports_by_type': by_type,
+            'sightings_by_location': {'land': land, 'water': water},
+            'recent_reports': reports,
+            'recent_sightings': sightings
+        }
+    })
+
+
+@api_dashboard.route('/stats', methods=['GET'])
+@conditional(*STATS_TABLES, daily=True)
+def get_dashboard_stats():
+    """Get dashboard statistics for today"""
+    return jsonify({
+        'success': True,
+        'data': todays_stats()
     })
 
 
 @api_dashboard.route('/sightings-by-location', methods=['GET'])
+@conditional(*SIGHTINGS_CHART_TABLES)
 def get_sightings_by_location():
-    """Get species sightings count by location for charts"""
+    """
+    Get species sightings count by location for charts, from the daily rollups
+    Query params: category (land/water), limit, from/to (YYYY-MM-DD, inclusive)
+    """
     category = request.args.get('category', 'land')  # 'land' or 'water'
     limit = request.args.get('limit', 10, type=int)
-    
-    # Query to get sightings count per location for specific category
-    results = db.session.query(
-        Location.city_name,
-        db.func.count(Sighting.sighting_id).label('count')
-    ).join(Sighting).join(Species).filter(
-        Species.category == category
-    ).group_by(Location.city_name).order_by(db.text('count DESC')).limit(limit).all()
+    try:
+        start, end = parse_date_range()
+    except ValueError:
+        return jsonify({'success': False, 'message': 'from/to must be YYYY-MM-DD'}), 400
     
     return jsonify({
         'success': True,
         'category': category,
-        'data': [
-            {'city': r.city_name, 'sightings': r.count}
-            for r in results
-        ]
+        'data': sightings_by_location(category, limit, start, end)
     })
 
 
 @api_dashboard.route('/reports-by-type', methods=['GET'])
+@conditional(*REPORTS_CHART_TABLES)
 def get_reports_by_type():
-    """Get environmental reports count by type"""
-    results = db.session.query(
-        EnvironmentalReport.report_type,
-        db.func.count(EnvironmentalReport.report_id).label('count')
-    ).group_by(EnvironmentalReport.report_type).all()
+    """
+    Get environmental reports count by type, from the daily rollups
+    Query params: from/to (YYYY-MM-DD, inclusive)
+    """
+    try:
+        start, end = parse_date_range()
+    except ValueError:
+        return jsonify({'success': False, 'message': 'from/to must be YYYY-MM-DD'}), 400
     
     return jsonify({
         'success': True,
-        'data': [
-            {'type': r.report_type, 'count': r.count}
-            for r in results
-        ]
+        'data': reports_by_type(start, end)
     })
@@ -1,17 +1,49 @@
 from flask import Blueprint, request, jsonify
-from model import Location
+from model import Location, ReportDailyRollup
+from database import db
+from caching import cached, conditional
+from geo import area_from_request
 
 api_locations = Blueprint('api_locations', __name__, url_prefix='/api/locations')
 
+SEVERITY_WEIGHTS = {'Low': 1, 'Medium': 2, 'High': 3, 'Critical': 4}
+
+
+def weighted_severity(severity_counts):
+    """Average severity weight of a location's reports and the level it rounds to (Low with no reports)"""
+    total = sum(severity_counts.values())
+    if not total:
+        return 0.0, 'Low'
+    average = sum(SEVERITY_WEIGHTS[level] * count for level, count in severity_counts.items()) / total
+    if average >= 3.5:
+        return average, 'Critical'
+    if average >= 2.5:
+        return average, 'High'
+    if average >= 1.5:
+        return average, 'Medium'
+    return average, 'Low'
+
 
 @api_locations.route('', methods=['GET'])
+@conditional('locations')
+@cached('locations')
 def get_locations():
-    """Get all locations with optional filtering"""
+    """
+    Get all locations with optional filtering
+    Query params: severity, type, bbox (west,south,east,north), near (lat,lon) with radius_km (default 10)
+    """
     severity = request.args.get('severity')
     location_type = request.args.get('type')
     
+    try:
+        area = area_from_request(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
     query = Location.query
     
+    if area is not None:
+        query = query.filter(Location.location_id.in_(area))
     if severity:
         query = query.filter_by(severity_level=severity)
     if location_type:
@@ -26,6 +58,8 @@ def get_locations():
 
 
 @api_locations.route('/<int:location_id>', methods=['GET'])
+@conditional('locations')
+@cached('locations')
 def get_location_by_id(location_id):
     """Get single location by ID"""
     location = Location.query.get_or_404(location_id)
@@ -33,3 +67,60 @@ def get_location_by_id(location_id):
         'success': True,
         'data': location.to_dict()
     })
+
+
+@api_locations.route('/severity', methods=['GET'])
+@conditional('locations', 'report_daily_rollup')
+@cached('locations', 'report_daily_rollup')
+def get_location_severity():
+    """
+    Per-location report count, severity histogram and weighted severity for
+    the maps, in one grouped query over the daily report rollups
+    Query params: bbox (west,south,east,north), near (lat,lon) with radius_km (default 10)
+    """
+    try:
+        area = area_from_request(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    columns = [
+        db.func.coalesce(db.func.sum(db.case(
+            (ReportDailyRollup.severity == level, ReportDailyRollup.report_count), else_=0
+        )), 0).label(level)
+        for level in SEVERITY_WEIGHTS
+    ]
+    query = db.session.query(
+        Location.location_id,
+        Location.city_name,
+        Location.location_type,
+        Location.latitude,
+        Location.longitude,
+        *columns
+    ).outerjoin(
+        ReportDailyRollup, ReportDailyRollup.location_id == Location.location_id
+    )
+    if area is not None:
+        query = query.filter(Location.location_id.in_(area))
+    rows = query.group_by(Location.location_id).order_by(Location.location_id).all()
+    
+    data = []
+    for row in rows:
+        severity_counts = {level: int(getattr(row, level)) for level in SEVERITY_WEIGHTS}
+        average, severity = weighted_severity(severity_counts)
+        data.append({
+            'location_id': row.location_id,
+            'city_name': row.city_name,
+            'location_type': row.location_type,
+            'latitude': float(row.latitude),
+            'longitude': float(row.longitude),
+            'report_count': sum(severity_counts.values()),
+            'severity_counts': severity_counts,
+            'average_weight': round(average, 2),
+            'severity': severity
+        })
+    
+    return jsonify({
+        'success': True,
+        'count': len(data),
+        'data': data
+    })
@@ -0,0 +1,42 @@
+from flask import Blueprint, request, jsonify
+from model import MapClusterCell
+from caching import cached, conditional
+from geo import parse_bbox, cluster_cell, cluster_cell_size, cluster_zoom
+
+api_map = Blueprint('api_map', __name__, url_prefix='/api/map')
+
+
+@api_map.route('/clusters', methods=['GET'])
+@conditional('map_cluster_cells')
+@cached('map_cluster_cells')
+def get_clusters():
+    """
+    Pre-aggregated report/sighting clusters for the map viewport
+    Query params: zoom (map zoom level, required), bbox (west,south,east,north; default whole map)
+    """
+    zoom = request.args.get('zoom', type=int)
+    if zoom is None:
+        return jsonify({'success': False, 'message': 'zoom is required'}), 400
+    zoom = cluster_zoom(zoom)
+    
+    try:
+        south, west, north, east = parse_bbox(request.args.get('bbox', '-180,-90,180,90'))
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    first_row, first_col = cluster_cell(south, west, zoom)
+    last_row, last_col = cluster_cell(north, east, zoom)
+    cells = MapClusterCell.query.filter(
+        MapClusterCell.zoom == zoom,
+        MapClusterCell.cell_row.between(first_row, last_row),
+        MapClusterCell.cell_col.between(first_col, last_col),
+        (MapClusterCell.report_count + MapClusterCell.sighting_count) > 0
+    ).all()
+    
+    return jsonify({
+        'success': True,
+        'zoom': zoom,
+        'cell_size': cluster_cell_size(zoom),
+        'count': len(cells),
+        'data': [cell.to_dict() for cell in cells]
+    })
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, redirect, url_for, session, flash
 from model import Location, ReportCategory, ReportSeverity, Species
+from caching import cached
 
 pages = Blueprint('pages', __name__)
 
@@ -20,6 +21,7 @@ def map_view():
 
 
 @pages.route('/species')
+@cached('species', 'species_stats')
 def species_view():
     """Species page with all land and water animals from database"""
     land_species = Species.query.filter_by(category='land').all()
@@ -1,25 +1,39 @@
 from flask import Blueprint, request, jsonify
 from datetime import date
-from model import EnvironmentalReport, Location, ReportCategory, ReportSeverity, Sighting, Species, DashboardStats
+from model import EnvironmentalReport, Location, ReportCategory, ReportSeverity
 from database import db
+from pagination import paginate_keyset, InvalidCursor
+from caching import cached, conditional
+from geo import area_from_request
+from search import search_ids, load_ranked
 
 api_reports = Blueprint('api_reports', __name__, url_prefix='/api/reports')
 
 
 @api_reports.route('', methods=['GET'])
+@conditional('environmental_reports', 'locations')
 def get_reports():
     """
-    Get all environmental reports with optional filtering
-    Query params: location_id, type, status, severity
+    Get environmental reports with optional filtering, newest first
+    Query params: location_id, type, status, severity, limit (max 500), cursor (from next_cursor),
+                  bbox (west,south,east,north), near (lat,lon) with radius_km (default 10)
     """
     location_id = request.args.get('location_id')
     report_type = request.args.get('type')
     status = request.args.get('status')
     severity = request.args.get('severity')
     limit = request.args.get('limit', 100, type=int)
+    cursor = request.args.get('cursor')
+    
+    try:
+        area = area_from_request(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     
     query = EnvironmentalReport.query
     
+    if area is not None:
+        query = query.filter(EnvironmentalReport.location_id.in_(area))
     if location_id:
         query = query.filter_by(location_id=location_id)
     if report_type:
@@ -29,8 +43,42 @@ def get_reports():
     if severity:
         query = query.filter_by(severity=severity)
     
-    reports = query.order_by(EnvironmentalReport.report_date.desc()).limit(limit).all()
+    try:
+        reports, next_cursor = paginate_keyset(
+            query,
+            [EnvironmentalReport.report_date, EnvironmentalReport.report_id],
+            cursor=cursor,
+            limit=limit
+        )
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    return jsonify({
+        'success': True,
+        'count': len(reports),
+        'next_cursor': next_cursor,
+        'data': [r.to_dict() for r in reports]
+    })
+
+
+@api_reports.route('/search', methods=['GET'])
+@conditional('environmental_reports', 'locations')
+def search_reports():
+    """
+    Full-text search over report titles and descriptions, best match first
+    Query params: q (every word matched as a prefix), limit (default 50, max 200)
+    """
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', 50, type=int)
+    
+    if not query.strip():
+        return jsonify({
+            'success': False,
+            'message': 'Search query is required'
+        }), 400
     
+    reports = load_ranked(EnvironmentalReport, search_ids('reports', query, limit),
+                          db.joinedload(EnvironmentalReport.location))
     return jsonify({
         'success': True,
         'count': len(reports),
@@ -39,6 +87,7 @@ def get_reports():
 
 
 @api_reports.route('/<int:report_id>', methods=['GET'])
+@conditional('environmental_reports', 'locations')
 def get_report_by_id(report_id):
     """Get single report by ID"""
     report = EnvironmentalReport.query.get_or_404(report_id)
@@ -86,35 +135,8 @@ def create_report():
         
         db.session.commit()
 
-        # Update today's dashboard stats
-        try:
-            today = date.today()
-            stats = DashboardStats.query.filter_by(stat_date=today).first()
-            if stats:
-                stats.total_reports = stats.total_reports + 1
-                if new_report.status == 'pending':
-                    stats.pending_reports = stats.pending_reports + 1
-                if new_report.severity == 'Critical':
-                    stats.critical_reports = stats.critical_reports + 1
-                db.session.commit()
-            else:
-                # Create fresh stats for today
-                stats = DashboardStats(
-                    stat_date=today,
-                    total_reports=EnvironmentalReport.query.count(),
-                    pending_reports=EnvironmentalReport.query.filter_by(status='pending').count(),
-                    completed_reports=EnvironmentalReport.query.filter_by(status='completed').count(),
-                    critical_reports=EnvironmentalReport.query.filter_by(severity='Critical').count(),
-                    total_sightings=Sighting.query.count(),
-                    verified_sightings=Sighting.query.filter_by(verification_status='verified').count(),
-                    land_species_count=Species.query.filter_by(category='land').count(),
-                    water_species_count=Species.query.filter_by(category='water').count()
-                )
-                db.session.add(stats)
-                db.session.commit()
-        except Exception:
-            # Non-fatal: do not block report creation if dashboard update fails
-            db.session.rollback()
+        # Today's DashboardStats counters are updated by the EnvironmentalReport
+        # mapper events in model.py as part of the commit above
 
         return jsonify({
             'success': True,
@@ -172,6 +194,8 @@ def update_report_status(report_id):
 
 
 @api_reports.route('/categories', methods=['GET'])
+@conditional('report_categories')
+@cached('report_categories')
 def get_categories():
     """Get all report categories"""
     categories = ReportCategory.query.all()
@@ -183,6 +207,8 @@ def get_categories():
 
 
 @api_reports.route('/severity', methods=['GET'])
+@conditional('report_severity')
+@cached('report_severity')
 def get_severity():
     """Get all report severity levels"""
     severity_levels = ReportSeverity.query.all()
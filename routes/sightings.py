@@ -1,21 +1,42 @@
+import csv
+import io
+import json
 from flask import Blueprint, request, jsonify
-from model import Sighting, update_species_stats
+from model import Sighting, Species, Location, sighting_list_to_dict, record_bulk_sightings
 from database import db
-from datetime import datetime
+from pagination import paginate_keyset, InvalidCursor
+from geo import area_from_request
+from datetime import date, datetime
 
 api_sightings = Blueprint('api_sightings', __name__, url_prefix='/api/sightings')
 
+BULK_MAX_ROWS = 10000
+BULK_MAX_BYTES = 5 * 1024 * 1024
+BULK_CHUNK_SIZE = 500
+
 
 @api_sightings.route('', methods=['GET'])
 def get_sightings():
-    """Get sightings with optional filtering"""
+    """
+    Get sightings with optional filtering, newest first
+    Query params: species_id, location_id, status, limit (max 500), cursor (from next_cursor),
+                  bbox (west,south,east,north), near (lat,lon) with radius_km (default 10)
+    """
     species_id = request.args.get('species_id')
     location_id = request.args.get('location_id')
     status = request.args.get('status')
     limit = request.args.get('limit', 100, type=int)
+    cursor = request.args.get('cursor')
+    
+    try:
+        area = area_from_request(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     
     query = Sighting.query
     
+    if area is not None:
+        query = query.filter(Sighting.location_id.in_(area))
     if species_id:
         query = query.filter_by(species_id=species_id)
     if location_id:
@@ -23,12 +44,21 @@ def get_sightings():
     if status:
         query = query.filter_by(verification_status=status)
     
-    sightings = query.order_by(Sighting.sighting_date.desc(), Sighting.created_at.desc()).limit(limit).all()
+    try:
+        sightings, next_cursor = paginate_keyset(
+            query,
+            [Sighting.sighting_date, Sighting.created_at, Sighting.sighting_id],
+            cursor=cursor,
+            limit=limit
+        )
+    except InvalidCursor as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     
     return jsonify({
         'success': True,
         'count': len(sightings),
-        'data': [s.to_dict() for s in sightings]
+        'next_cursor': next_cursor,
+        'data': sighting_list_to_dict(sightings)
     })
 
 
@@ -78,9 +108,6 @@ def create_sighting():
         db.session.add(new_sighting)
         db.session.commit()
         
-        # Update species statistics after new sighting
-        update_species_stats(data['species_id'])
-        
         return jsonify({
             'success': True,
             'message': 'Sighting submitted successfully',
@@ -94,6 +121,138 @@ def create_sighting():
             'message': f'Error creating sighting: {str(e)}'
         }), 500
 
+def _parse_bulk_body(max_rows):
+    """
+    Parse an NDJSON or CSV request body into a list of (row_number, dict-or-error),
+    stopping after max_rows + 1 rows so an oversized upload is never parsed in full
+    """
+    text = request.get_data(as_text=True)
+    content_type = (request.mimetype or '').lower()
+    
+    if content_type in ('text/csv', 'application/csv'):
+        reader = csv.DictReader(io.StringIO(text))
+        # Row numbers count data lines, the header is not a row
+        return [(i, {k: v for k, v in row.items() if v not in (None, '')})
+                for i, row in zip(range(1, max_rows + 2), reader)]
+    
+    rows = []
+    for i, line in enumerate(text.splitlines(), start=1):
+        # Blank lines are skipped but still counted, so row numbers are line numbers
+        if not line.strip():
+            continue
+        if len(rows) > max_rows:
+            break
+        try:
+            item = json.loads(line)
+            rows.append((i, item if isinstance(item, dict) else 'Row must be a JSON object'))
+        except ValueError:
+            rows.append((i, 'Invalid JSON'))
+    return rows
+
+
+def _validate_bulk_row(item, species_ids, location_ids):
+    """Return (insert params, None) for a valid row or (None, error message)"""
+    for field in ['species_id', 'location_id', 'observer_name', 'observer_contact']:
+        if item.get(field) in (None, ''):
+            return None, f'Missing required field: {field}'
+    
+    try:
+        species_id = int(item['species_id'])
+        location_id = int(item['location_id'])
+        number_observed = int(item.get('number_observed', 1))
+    except (ValueError, TypeError):
+        return None, 'species_id, location_id and number_observed must be integers'
+    
+    if species_id not in species_ids:
+        return None, f'Unknown species_id: {species_id}'
+    if location_id not in location_ids:
+        return None, f'Unknown location_id: {location_id}'
+    if number_observed < 1:
+        return None, 'number_observed must be at least 1'
+    
+    sighting_date = date.today()
+    if item.get('sighting_date'):
+        try:
+            sighting_date = datetime.strptime(str(item['sighting_date']), '%Y-%m-%d').date()
+        except ValueError:
+            return None, 'sighting_date must be YYYY-MM-DD'
+    
+    return {
+        'species_id': species_id,
+        'location_id': location_id,
+        'sighting_date': sighting_date,
+        'number_observed': number_observed,
+        'observer_name': str(item['observer_name']),
+        'observer_contact': str(item['observer_contact']),
+        'notes': item.get('notes'),
+        # Submissions always start pending until an admin verifies them
+        'verification_status': 'pending',
+        'created_at': datetime.utcnow()
+    }, None
+
+
+@api_sightings.route('/bulk', methods=['POST'])
+def create_sightings_bulk():
+    """
+    Submit many sightings at once as NDJSON (application/x-ndjson) or CSV (text/csv)
+    Invalid rows are reported back individually; valid rows are still inserted.
+    """
+    if request.content_length is not None and request.content_length > BULK_MAX_BYTES:
+        return jsonify({
+            'success': False,
+            'message': f'Request body too large: at most {BULK_MAX_BYTES} bytes'
+        }), 413
+    
+    rows = _parse_bulk_body(BULK_MAX_ROWS)
+    if not rows:
+        return jsonify({'success': False, 'message': 'No rows provided'}), 400
+    if len(rows) > BULK_MAX_ROWS:
+        return jsonify({
+            'success': False,
+            'message': f'Too many rows: at most {BULK_MAX_ROWS} per request'
+        }), 413
+    
+    # Look up valid IDs once instead of per row
+    species_ids = {sid for (sid,) in db.session.query(Species.species_id)}
+    location_ids = {lid for (lid,) in db.session.query(Location.location_id)}
+    
+    errors = []
+    valid = []
+    for row_number, item in rows:
+        if isinstance(item, str):
+            errors.append({'row': row_number, 'message': item})
+            continue
+        params, error = _validate_bulk_row(item, species_ids, location_ids)
+        if error:
+            errors.append({'row': row_number, 'message': error})
+        else:
+            valid.append((row_number, params))
+    
+    inserted = 0
+    table = Sighting.__table__
+    for start in range(0, len(valid), BULK_CHUNK_SIZE):
+        chunk = valid[start:start + BULK_CHUNK_SIZE]
+        try:
+            db.session.execute(table.insert(), [params for _, params in chunk])
+            # executemany bypasses the mapper events that keep counters and rollups current
+            record_bulk_sightings(db.session.connection(), [params for _, params in chunk])
+            db.session.commit()
+            inserted += len(chunk)
+        except Exception as e:
+            db.session.rollback()
+            errors.extend({'row': row_number, 'message': f'Error inserting row: {str(e)}'}
+                          for row_number, _ in chunk)
+    
+    errors.sort(key=lambda e: e['row'])
+    return jsonify({
+        'success': inserted > 0,
+        'message': f'Inserted {inserted} of {len(rows)} sightings',
+        'inserted': inserted,
+        'failed': len(errors),
+        'errors': errors
+    }), 201 if inserted else 400
+
+
 @api_sightings.route('/<int:sighting_id>', methods=['PUT'])
 def update_sighting_status(sighting_id):
     """Update sighting verification status"""
@@ -108,12 +267,10 @@ def update_sighting_status(sighting_id):
                     'message': 'Invalid verification status'
                 }), 400
             
+            # The mapper events update the species statistics in the same commit
             sighting.verification_status = data['verification_status']
             db.session.commit()
             
-            # Update species statistics when verification status changes
-            update_species_stats(sighting.species_id)
-            
             return jsonify({
                 'success': True,
                 'message': 'Sighting status updated',
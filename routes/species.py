@@ -1,10 +1,14 @@
 from flask import Blueprint, request, jsonify
-from model import Species
+from model import Species, species_list_to_dict
+from caching import cached, conditional
+from search import search_ids, load_ranked, suggest_species
 
 api_species = Blueprint('api_species', __name__, url_prefix='/api/species')
 
 
 @api_species.route('', methods=['GET'])
+@conditional('species', 'species_stats')
+@cached('species', 'species_stats')
 def get_species():
     """
     Get all species with optional filtering
@@ -24,11 +28,13 @@ def get_species():
     return jsonify({
         'success': True,
         'count': len(species_list),
-        'data': [s.to_dict() for s in species_list]
+        'data': species_list_to_dict(species_list)
     })
 
 
 @api_species.route('/<int:species_id>', methods=['GET'])
+@conditional('species', 'species_stats')
+@cached('species', 'species_stats')
 def get_species_by_id(species_id):
     """Get single species by ID"""
     species = Species.query.get_or_404(species_id)
@@ -38,24 +44,59 @@ def get_species_by_id(species_id):
     })
 
 
+@api_species.route('/suggest', methods=['GET'])
+def suggest_species_names():
+    """
+    Typo-tolerant autocomplete over common and scientific names, served
+    from an in-memory trigram index (no query unless species changed)
+    Query params: q, limit (default 10, max 25)
+    """
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', 10, type=int)
+    
+    if not query.strip():
+        return jsonify({
+            'success': False,
+            'message': 'Search query is required'
+        }), 400
+    
+    suggestions = suggest_species(query, limit)
+    return jsonify({
+        'success': True,
+        'count': len(suggestions),
+        'data': [
+            {
+                'species_id': species_id,
+                'common_name': common_name,
+                'scientific_name': scientific_name,
+                'score': score
+            }
+            for score, species_id, common_name, scientific_name in suggestions
+        ]
+    })
+
+
 @api_species.route('/search', methods=['GET'])
+@conditional('species', 'species_stats')
+@cached('species', 'species_stats')
 def search_species():
-    """Search species by common or scientific name"""
+    """
+    Full-text search over species names and descriptions, best match first
+    Query params: q (every word matched as a prefix), limit (default 50, max 200)
+    """
     query = request.args.get('q', '')
+    limit = request.args.get('limit', 50, type=int)
     
-    if not query:
+    if not query.strip():
         return jsonify({
             'success': False,
             'message': 'Search query is required'
         }), 400
     
-    species_list = Species.query.filter(
-        (Species.common_name.ilike(f'%{query}%')) | 
-        (Species.scientific_name.ilike(f'%{query}%'))
-    ).all()
+    species_list = load_ranked(Species, search_ids('species', query, limit))
     
     return jsonify({
         'success': True,
         'count': len(species_list),
-        'data': [s.to_dict() for s in species_list]
+        'data': species_list_to_dict(species_list)
     })
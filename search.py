@@ -0,0 +1,322 @@
+# FILE: search.py
+# Full-text search over species and reports (SQLite FTS5 / MySQL FULLTEXT)
+# and an in-memory trigram index for typo-tolerant species name suggestions
+
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from database import db
+
+MAX_SEARCH_RESULTS = 200
+MAX_SUGGESTIONS = 25
+# Share of the query's trigrams a name must contain to be suggested
+SUGGEST_MIN_SCORE = 0.3
+# Seconds the species name index is trusted before the species version is checked again
+NAME_INDEX_RECHECK_SECONDS = 2.0
+
+
+class SearchIndex:
+    """A full-text index over some text columns of one table"""
+
+    def __init__(self, name, table, key, columns, weights):
+        self.name = name
+        self.table = table
+        self.key = key
+        self.columns = columns
+        # Relative bm25 weight per column on SQLite (name matches rank above descriptions)
+        self.weights = weights
+
+    @property
+    def fts_table(self):
+        return f'{self.table}_fts'
+
+    def sqlite_ddl(self):
+        columns = ', '.join(self.columns)
+        new_values = ', '.join(f'new.{column}' for column in self.columns)
+        old_values = ', '.join(f'old.{column}' for column in self.columns)
+        fts = self.fts_table
+        # External-content FTS5 table kept in step by triggers, so every write
+        # path (ORM, Core bulk statements, raw SQL) updates the index
+        return [
+            # Triggers left over from an FTS table dropped by hand
+            *[f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ('ai', 'ad', 'au')],
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{self.table}', "
+            f"content_rowid='{self.key}', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {self.table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{self.key}, {new_values}); END",
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {self.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{self.key}, {old_values}); END",
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {self.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{self.key}, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{self.key}, {new_values}); END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"
+        ]
+
+    def mysql_ddl(self):
+        return [f"ALTER TABLE {self.table} ADD FULLTEXT INDEX {self.name} ({', '.join(self.columns)})"]
+
+
+SEARCH_INDEXES = {
+    'species': SearchIndex('ft_species_search', 'species', 'species_id',
+                           ['common_name', 'scientific_name', 'description'], [10.0, 10.0, 1.0]),
+    'reports': SearchIndex('ft_reports_search', 'environmental_reports', 'report_id',
+                           ['title', 'description'], [5.0, 1.0]),
+}
+
+# Indexes found missing at query time in this process (searches fall back to LIKE)
+_unavailable = set()
+
+
+def search_terms(q):
+    """Lower-cased word tokens of a query string"""
+    return re.findall(r'\w+', (q or '').lower())
+
+
+def ensure_search_indexes(connection):
+    """
+    Create the full-text indexes that are missing on this database (FTS5
+    tables and triggers on SQLite, FULLTEXT indexes on MySQL) and fill them
+    from the existing rows. Other dialects are left to the LIKE fallback.
+    Returns the names of the indexes created.
+    """
+    dialect = connection.dialect.name
+    created = []
+    for index in SEARCH_INDEXES.values():
+        if dialect == 'sqlite':
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {'name': index.fts_table}
+            ).first()
+            statements = index.sqlite_ddl()
+        elif dialect == 'mysql':
+            exists = connection.execute(
+                text("SELECT 1 FROM information_schema.statistics WHERE table_schema = DATABASE() "
+                     "AND table_name = :table AND index_name = :name"),
+                {'table': index.table, 'name': index.name}
+            ).first()
+            statements = index.mysql_ddl()
+        else:
+            continue
+        if exists:
+            continue
+        try:
+            for statement in statements:
+                connection.exec_driver_sql(statement)
+        except DBAPIError as e:
+            # e.g. SQLite built without FTS5
+            print(f"⚠️  Could not create search index {index.name}: {e.orig}")
+            continue
+        _unavailable.discard(index.name)
+        created.append(index.name)
+    return created
+
+
+def _drop_search_indexes(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        for index in SEARCH_INDEXES.values():
+            connection.exec_driver_sql(f'DROP TABLE IF EXISTS {index.fts_table}')
+
+
+def _create_search_indexes(target, connection, **kw):
+    ensure_search_indexes(connection)
+
+
+# Build the indexes along with the tables, drop them before the tables go
+event.listen(db.metadata, 'after_create', _create_search_indexes)
+event.listen(db.metadata, 'before_drop', _drop_search_indexes)
+
+
+_mysql_min_token_size = None
+
+
+def mysql_min_token_size():
+    """InnoDB's innodb_ft_min_token_size (read once): shorter words are never indexed"""
+    global _mysql_min_token_size
+    if _mysql_min_token_size is None:
+        _mysql_min_token_size = int(db.session.execute(text('SELECT @@innodb_ft_min_token_size')).scalar())
+    return _mysql_min_token_size
+
+
+def _fulltext_ids(index, terms, limit):
+    """Ranked primary keys from the full-text index; raises DBAPIError if it is unavailable"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # Each term as a quoted prefix query, all terms required
+        match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+        weights = ', '.join(str(weight) for weight in index.weights)
+        rows = db.session.execute(text(
+            f'SELECT rowid FROM {index.fts_table} WHERE {index.fts_table} MATCH :match '
+            f'ORDER BY bm25({index.fts_table}, {weights}) LIMIT :limit'
+        ), {'match': match, 'limit': limit})
+    elif dialect == 'mysql':
+        # A required term shorter than the minimum token size matches
+        # nothing, so leave those out; with none left, scan instead
+        indexed = [term for term in terms if len(term) >= mysql_min_token_size()]
+        if not indexed:
+            return _like_ids(index, terms, limit)
+        match = ' '.join(f'+{term}*' for term in indexed)
+        columns = ', '.join(index.columns)
+        rows = db.session.execute(text(
+            f'SELECT {index.key} FROM {index.table} '
+            f'WHERE MATCH({columns}) AGAINST (:match IN BOOLEAN MODE) '
+            f'ORDER BY MATCH({columns}) AGAINST (:match IN BOOLEAN MODE) DESC LIMIT :limit'
+        ), {'match': match, 'limit': limit})
+    else:
+        raise NotImplementedError(dialect)
+    return [row[0] for row in rows]
+
+
+def _like_ids(index, terms, limit):
+    """Fallback without a full-text index: every term must appear in one of the columns"""
+    table = db.metadata.tables[index.table]
+    key = table.c[index.key]
+    query = db.select(key)
+    for term in terms:
+        query = query.where(db.or_(*[table.c[column].ilike(f'%{term}%') for column in index.columns]))
+    return list(db.session.execute(query.order_by(key).limit(limit)).scalars())
+
+
+def search_ids(kind, q, limit=50):
+    """
+    Primary keys of the rows of `kind` ('species' or 'reports') matching
+    every word of `q` as a prefix, best match first
+    """
+    index = SEARCH_INDEXES[kind]
+    terms = search_terms(q)
+    if not terms:
+        return []
+    limit = max(1, min(limit, MAX_SEARCH_RESULTS))
+
+    if index.name not in _unavailable:
+        try:
+            return _fulltext_ids(index, terms, limit)
+        except (DBAPIError, NotImplementedError):
+            _unavailable.add(index.name)
+    return _like_ids(index, terms, limit)
+
+
+def load_ranked(model, ids, *options):
+    """
+    Fetch `model` rows by primary key, keeping the order of `ids`.
+    `options` are loader options, e.g. db.joinedload() for what the caller serializes.
+    """
+    if not ids:
+        return []
+    key = model.__mapper__.primary_key[0]
+    rows = {getattr(row, key.key): row for row in model.query.options(*options).filter(key.in_(ids))}
+    return [rows[i] for i in ids if i in rows]
+
+
+def normalize_name(value):
+    """Lower-case, strip diacritics and punctuation, collapse whitespace"""
+    value = unicodedata.normalize('NFKD', value or '')
+    value = ''.join(char for char in value if not unicodedata.combining(char))
+    return ' '.join(re.findall(r'\w+', value.lower()))
+
+
+def trigrams(value, partial=False):
+    """
+    Trigrams of each word padded like pg_trgm ('  w', ' wo', 'wor', 'ord',
+    'rd '). With `partial` the last word may still be being typed, so its
+    end isn't padded.
+    """
+    grams = set()
+    words = value.split()
+    for i, word in enumerate(words):
+        padded = f'  {word}' if partial and i == len(words) - 1 else f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NameIndex:
+    """
+    Trigram index over species common and scientific names. A query is
+    scored against each name by the share of its trigrams the name
+    contains, so misspellings and partial words still match; ties go to
+    word-prefix matches and then to the closer overall match (Jaccard).
+    """
+
+    def __init__(self, rows):
+        # rows: (species_id, common_name, scientific_name)
+        self.entries = []
+        self.postings = {}
+        for species_id, common_name, scientific_name in rows:
+            for name in (common_name, scientific_name):
+                normalized = normalize_name(name)
+                if not normalized:
+                    continue
+                grams = trigrams(normalized)
+                position = len(self.entries)
+                self.entries.append((species_id, common_name, scientific_name, normalized, len(grams)))
+                for gram in grams:
+                    self.postings.setdefault(gram, []).append(position)
+
+    def suggest(self, q, limit=10):
+        """[(score, species_id, common_name, scientific_name)] best first, one per species"""
+        query = normalize_name(q)
+        grams = trigrams(query, partial=True)
+        if not grams:
+            return []
+
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+
+        best = {}
+        for position, count in shared.items():
+            species_id, common_name, scientific_name, normalized, size = self.entries[position]
+            score = count / len(grams)
+            if score < SUGGEST_MIN_SCORE:
+                continue
+            prefix = normalized.startswith(query) or f' {query}' in normalized
+            similarity = count / (len(grams) + size - count)
+            key = (score, prefix, similarity)
+            if species_id not in best or key > best[species_id][0]:
+                best[species_id] = (key, common_name, scientific_name)
+
+        ranked = sorted(best.items(), key=lambda item: (
+            -item[1][0][0], not item[1][0][1], -item[1][0][2], item[1][1]
+        ))
+        return [
+            (round(key[0], 3), species_id, common_name, scientific_name)
+            for species_id, (key, common_name, scientific_name) in ranked[:limit]
+        ]
+
+
+_name_index = None
+_name_index_version = None
+_name_index_checked = 0.0
+_name_index_lock = threading.Lock()
+
+
+def species_name_index():
+    """
+    The process-wide species NameIndex, rebuilt from the database only when
+    the species table has changed since it was built (tracked through the
+    table versions in caching.py). The version is looked up at most every
+    NAME_INDEX_RECHECK_SECONDS, so typing a name doesn't query per keystroke.
+    """
+    global _name_index, _name_index_version, _name_index_checked
+    from caching import table_versions
+    from model import Species
+
+    if _name_index is not None and time.monotonic() - _name_index_checked < NAME_INDEX_RECHECK_SECONDS:
+        return _name_index
+    version, _ = table_versions.validators(('species',))
+    with _name_index_lock:
+        if _name_index is None or _name_index_version != version:
+            rows = db.session.query(Species.species_id, Species.common_name, Species.scientific_name).all()
+            _name_index = NameIndex(rows)
+            _name_index_version = version
+        _name_index_checked = time.monotonic()
+    return _name_index
+
+
+def suggest_species(q, limit=10):
+    """Top `limit` fuzzy matches for a partly typed or misspelled species name"""
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+    return species_name_index().suggest(q, limit)
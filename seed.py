@@ -2,8 +2,8 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import app
-from model import Location, ReportCategory, ReportSeverity, Species, EnvironmentalReport, Sighting, User
+from app import create_app
+from model import Location, ReportCategory, ReportSeverity, Species, EnvironmentalReport, Sighting, User, rebuild_species_stats, rebuild_daily_rollups, rebuild_map_clusters
 from database import db, create_tables
 from datetime import date, timedelta
 import random
@@ -799,6 +799,7 @@ def seed_admin_user():
 
 def main():
     """Run all seeding operations"""
+    app = create_app()
     with app.app_context():
         print("=" * 70)
         print("[SEED] MASTER SEED - EcoTrack Database Initialization")
@@ -841,11 +842,16 @@ def main():
         print("\n[5/7] Seeding Sample Animal Sightings (10 sightings with real animal names)...")
         sight_inserted = seed_sightings()
         print(f"      [OK] Sample Sightings - Inserted: {sight_inserted}")
+        rebuild_species_stats()
+        db.session.commit()
 
         # Seed Sample Reports
         print("\n[6/7] Seeding Sample Environmental Reports (10 test reports)...")
         rep_inserted = seed_sample_reports()
         print(f"      [OK] Sample Reports - Inserted: {rep_inserted}")
+        rebuild_daily_rollups()
+        rebuild_map_clusters()
+        db.session.commit()
 
         print("\n" + "=" * 70)
         print("[SUCCESS] SEEDING COMPLETE!")
@@ -0,0 +1,132 @@
+# FILE: sqlite_profile.py
+# SQLite concurrency profile: connection pragmas (WAL, busy timeout, mmap,
+# cache) and in-process serialization of write transactions
+
+import os
+import sqlite3
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+# Statements that make pysqlite open a write transaction (or write outright)
+WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'CREATE', 'DROP', 'ALTER')
+
+
+class SQLiteProfile:
+    """
+    Applies the pragmas to every new SQLite connection and, if enabled,
+    lets one write transaction at a time into SQLite per process. A
+    connection takes the write lock at its first write statement and
+    gives it back once its transaction has ended (seen at its next
+    statement) or it returns to the pool, so threads queue here instead
+    of failing on SQLite's file lock. Other processes are handled by WAL
+    plus busy_timeout. A writer that can't get the lock within
+    `lock_timeout` seconds goes ahead without it and relies on
+    busy_timeout as well.
+    """
+
+    def __init__(self, wal=True, synchronous='NORMAL', busy_timeout_ms=5000,
+                 mmap_size=256 * 1024 * 1024, cache_size_kb=64 * 1024, serialize_writes=True):
+        self.pragmas = []
+        if wal:
+            self.pragmas.append('PRAGMA journal_mode=WAL')
+        self.pragmas += [
+            f'PRAGMA synchronous={synchronous}',
+            f'PRAGMA busy_timeout={int(busy_timeout_ms)}',
+            f'PRAGMA mmap_size={int(mmap_size)}',
+            # Negative cache_size is in KiB rather than pages
+            f'PRAGMA cache_size={-int(cache_size_kb)}'
+        ]
+        self.serialize_writes = serialize_writes
+        self.lock_timeout = busy_timeout_ms / 1000
+        self._write_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        self._counters = {'write_transactions': 0, 'lock_wait_ms': 0.0, 'max_lock_wait_ms': 0.0, 'lock_timeouts': 0}
+
+    def apply_pragmas(self, dbapi_connection):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in self.pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    def acquire(self, info):
+        """Take the write lock for the connection owning `info` unless it already holds it"""
+        if info.get('sqlite_write_lock') or info.get('sqlite_write_unlocked'):
+            return
+        started = time.perf_counter()
+        acquired = self._write_lock.acquire(timeout=self.lock_timeout)
+        wait_ms = (time.perf_counter() - started) * 1000
+        with self._counter_lock:
+            self._counters['write_transactions'] += 1
+            self._counters['lock_wait_ms'] += wait_ms
+            self._counters['max_lock_wait_ms'] = max(self._counters['max_lock_wait_ms'], wait_ms)
+            if not acquired:
+                self._counters['lock_timeouts'] += 1
+        info['sqlite_write_lock' if acquired else 'sqlite_write_unlocked'] = True
+
+    def release(self, info):
+        info.pop('sqlite_write_unlocked', None)
+        if info.pop('sqlite_write_lock', None):
+            self._write_lock.release()
+
+    def stats(self):
+        with self._counter_lock:
+            data = dict(self._counters)
+        data['lock_wait_ms'] = round(data['lock_wait_ms'], 3)
+        data['max_lock_wait_ms'] = round(data['max_lock_wait_ms'], 3)
+        data['serialize_writes'] = self.serialize_writes
+        data['pragmas'] = self.pragmas
+        return data
+
+
+# Set by init_sqlite_profile(); the listeners below do nothing until then
+_profile = None
+
+
+def _connect(dbapi_connection, connection_record):
+    if _profile is not None and isinstance(dbapi_connection, sqlite3.Connection):
+        _profile.apply_pragmas(dbapi_connection)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _profile is None or not _profile.serialize_writes or conn.dialect.name != 'sqlite':
+        return
+    # Engine commit/rollback events fire before the DBAPI call, so the end
+    # of the previous transaction is detected here instead
+    if not cursor.connection.in_transaction:
+        _profile.release(conn.info)
+    if statement.lstrip()[:7].upper().startswith(WRITE_PREFIXES):
+        _profile.acquire(conn.info)
+
+
+def _checkin(dbapi_connection, connection_record):
+    if _profile is not None:
+        _profile.release(connection_record.info)
+
+
+def init_sqlite_profile(app):
+    """
+    Apply the SQLite concurrency profile to SQLite engines (SQLITE_PROFILE=0
+    turns it off). Must run before the first connection is opened.
+    """
+    global _profile
+    if os.environ.get('SQLITE_PROFILE', '1') == '0':
+        return None
+    _profile = SQLiteProfile(
+        wal=os.environ.get('SQLITE_WAL', '1') == '1',
+        synchronous=os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        busy_timeout_ms=int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000')),
+        mmap_size=int(os.environ.get('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))),
+        cache_size_kb=int(os.environ.get('SQLITE_CACHE_SIZE_KB', str(64 * 1024))),
+        serialize_writes=os.environ.get('SQLITE_SERIALIZE_WRITES', '1') == '1'
+    )
+    if not event.contains(Engine, 'connect', _connect):
+        event.listen(Engine, 'connect', _connect)
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Pool, 'checkin', _checkin)
+    app.extensions['sqlite_profile'] = _profile
+    return _profile
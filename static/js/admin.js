@@ -1,6 +1,8 @@
 let currentReportId = null;
 let newStatus = null;
 let pendingChanges = {};
+// Cursor for the next page of each admin list (null once everything is loaded)
+let nextCursors = { reports: null, sightings: null, users: null };
 
 console.log('Admin.js loaded - checking session...');
 
@@ -9,8 +11,30 @@ document.addEventListener('DOMContentLoaded', function() {
     loadReports();
 });
 
-function loadReports() {
-    fetch('/api/admin/reports', {
+// Build a list URL, continuing from the stored cursor when appending a page
+function pageUrl(baseUrl, listName, append) {
+    if (append && nextCursors[listName]) {
+        return `${baseUrl}?cursor=${encodeURIComponent(nextCursors[listName])}`;
+    }
+    return baseUrl;
+}
+
+// Show a "Load more" button under a table while more pages are available
+function updateLoadMore(listName, tbodyId, loader) {
+    let button = document.getElementById(`load-more-${listName}`);
+    if (!button) {
+        button = document.createElement('button');
+        button.id = `load-more-${listName}`;
+        button.className = 'load-more-button';
+        button.textContent = 'Load more';
+        button.addEventListener('click', () => loader(true));
+        document.getElementById(tbodyId).closest('table').insertAdjacentElement('afterend', button);
+    }
+    button.style.display = nextCursors[listName] ? '' : 'none';
+}
+
+function loadReports(append = false) {
+    fetch(pageUrl('/api/admin/reports', 'reports', append), {
         credentials: 'include'
     })
         .then(response => {
@@ -30,8 +54,10 @@ function loadReports() {
             console.log('Reports data:', data);
             if (!data) return;
             if (data.reports) {
-                displayReports(data.reports);
-                updateStats(data.reports);
+                nextCursors.reports = data.next_cursor || null;
+                displayReports(data.reports, append);
+                if (data.stats) updateStats(data.stats);
+                updateLoadMore('reports', 'reports-tbody', loadReports);
             } else if (!data.success) {
                 console.error('Error:', data.message);
                 alert('Error: ' + data.message);
@@ -43,29 +69,22 @@ function loadReports() {
         });
 }
 
-function updateStats(reports) {
-    let pending = 0;
-    let completed = 0;
-    
-    reports.forEach(report => {
-        if (report.status === 'pending') pending++;
-        else if (report.status === 'completed') completed++;
-    });
-    
-    document.getElementById('total-reports').textContent = reports.length;
-    document.getElementById('pending-reports').textContent = pending;
-    document.getElementById('approved-reports').textContent = completed;
+function updateStats(stats) {
+    // Counts come from the server so they cover every page, not just the loaded ones
+    document.getElementById('total-reports').textContent = stats.total;
+    document.getElementById('pending-reports').textContent = stats.pending;
+    document.getElementById('approved-reports').textContent = stats.completed;
 }
 
-function displayReports(reports) {
+function displayReports(reports, append = false) {
     const tbody = document.getElementById('reports-tbody');
     
-    if (reports.length === 0) {
+    if (reports.length === 0 && !append) {
         tbody.innerHTML = '<tr><td colspan="7" style="text-align: center;">No reports submitted yet</td></tr>';
         return;
     }
     
-    tbody.innerHTML = reports.map(report => `
+    const rows = reports.map(report => `
         <tr id="report-row-${report.report_id}">
             <td>#${report.report_id}</td>
             <td>${report.title}</td>
@@ -81,6 +100,12 @@ function displayReports(reports) {
             </td>
         </tr>
     `).join('');
+    
+    if (append) {
+        tbody.insertAdjacentHTML('beforeend', rows);
+    } else {
+        tbody.innerHTML = rows;
+    }
 }
 
 function getStatusButtons(reportId, status) {
@@ -307,8 +332,8 @@ function switchTab(tabName) {
 }
 
 // Load animal sightings
-function loadSightings() {
-    fetch('/api/admin/sightings', {
+function loadSightings(append = false) {
+    fetch(pageUrl('/api/admin/sightings', 'sightings', append), {
         credentials: 'include'
     })
         .then(response => {
@@ -325,8 +350,10 @@ function loadSightings() {
         .then(data => {
             if (!data) return;
             if (data.success && data.data) {
-                displaySightings(data.data);
-                updateSightingStats(data.data);
+                nextCursors.sightings = data.next_cursor || null;
+                displaySightings(data.data, append);
+                if (data.stats) updateSightingStats(data.stats);
+                updateLoadMore('sightings', 'sightings-tbody', loadSightings);
             } else {
                 console.error('Error:', data.message);
             }
@@ -337,15 +364,15 @@ function loadSightings() {
         });
 }
 
-function displaySightings(sightings) {
+function displaySightings(sightings, append = false) {
     const tbody = document.getElementById('sightings-tbody');
     
-    if (!sightings || sightings.length === 0) {
+    if ((!sightings || sightings.length === 0) && !append) {
         tbody.innerHTML = '<tr><td colspan="7" style="text-align: center;">No sightings submitted yet</td></tr>';
         return;
     }
     
-    tbody.innerHTML = sightings.map(sighting => `
+    const rows = sightings.map(sighting => `
         <tr id="sighting-row-${sighting.sighting_id}">
             <td>${sighting.sighting_id}</td>
             <td>${sighting.species?.common_name || 'Unknown'}</td>
@@ -365,6 +392,12 @@ function displaySightings(sightings) {
             </td>
         </tr>
     `).join('');
+    
+    if (append) {
+        tbody.insertAdjacentHTML('beforeend', rows);
+    } else {
+        tbody.innerHTML = rows;
+    }
 }
 
 function getSightingStatusButtons(sightingId, currentStatus) {
@@ -415,21 +448,10 @@ function changeSightingStatus(sightingId, newStatus) {
     });
 }
 
-function updateSightingStats(sightings) {
-    let pending = 0;
-    let verified = 0;
-    
-    sightings.forEach(sighting => {
-        if (sighting.verification_status === 'verified') {
-            verified++;
-        } else if (sighting.verification_status === 'pending') {
-            pending++;
-        }
-    });
-    
-    document.getElementById('total-sightings').textContent = sightings.length;
-    document.getElementById('pending-sightings').textContent = pending;
-    document.getElementById('verified-sightings').textContent = verified;
+function updateSightingStats(stats) {
+    document.getElementById('total-sightings').textContent = stats.total;
+    document.getElementById('pending-sightings').textContent = stats.pending;
+    document.getElementById('verified-sightings').textContent = stats.verified;
 }
 
 function deleteSighting(sightingId) {
@@ -457,8 +479,8 @@ function deleteSighting(sightingId) {
 }
 
 // Load users
-function loadUsers() {
-    fetch('/api/admin/users', {
+function loadUsers(append = false) {
+    fetch(pageUrl('/api/admin/users', 'users', append), {
         credentials: 'include'
     })
         .then(response => {
@@ -475,8 +497,10 @@ function loadUsers() {
         .then(data => {
             if (!data) return;
             if (data.success && data.data) {
-                displayUsers(data.data);
-                updateUserStats(data.data);
+                nextCursors.users = data.next_cursor || null;
+                displayUsers(data.data, append);
+                if (data.stats) updateUserStats(data.stats);
+                updateLoadMore('users', 'users-tbody', loadUsers);
             } else {
                 console.error('Error:', data.message);
             }
@@ -487,15 +511,15 @@ function loadUsers() {
         });
 }
 
-function displayUsers(users) {
+function displayUsers(users, append = false) {
     const tbody = document.getElementById('users-tbody');
     
-    if (!users || users.length === 0) {
+    if ((!users || users.length === 0) && !append) {
         tbody.innerHTML = '<tr><td colspan="6" style="text-align: center;">No users found</td></tr>';
         return;
     }
     
-    tbody.innerHTML = users.map(user => `
+    const rows = users.map(user => `
         <tr>
             <td>${user.user_id}</td>
             <td>${user.username}</td>
@@ -507,10 +531,16 @@ function displayUsers(users) {
             </td>
         </tr>
     `).join('');
+    
+    if (append) {
+        tbody.insertAdjacentHTML('beforeend', rows);
+    } else {
+        tbody.innerHTML = rows;
+    }
 }
 
-function updateUserStats(users) {
-    document.getElementById('total-users').textContent = users.length;
+function updateUserStats(stats) {
+    document.getElementById('total-users').textContent = stats.total;
 }
 
 function deleteUser(userId) {
@@ -7,23 +7,44 @@ document.addEventListener('DOMContentLoaded', function() {
     userIdDisplay.innerHTML = `<span class="font-bold">Status:</span> Dashboard Ready`;
   }
 
-  // Load all dashboard data
-  loadCategoryDistribution();
-  loadSightingsByLocation('land');
-  loadSightingsByLocation('water');
-  loadReports();
-  loadAnimalSightings();
-  loadDashboardStats();
+  // Load all dashboard data in one request
+  loadDashboardSummary();
 });
 
-// Category Distribution Chart - Report Types
-async function loadCategoryDistribution() {
+async function loadDashboardSummary() {
   try {
-    const response = await fetch('/api/dashboard/reports-by-type');
+    const response = await fetch('/api/dashboard/summary?limit=5&recent=10');
     const result = await response.json();
 
+    if (!result.success) {
+      throw new Error(result.message || 'Failed to load dashboard');
+    }
+
+    const data = result.data;
+    renderCategoryDistribution(data.reports_by_type);
+    renderSightingsByLocation('land', data.sightings_by_location.land);
+    renderSightingsByLocation('water', data.sightings_by_location.water);
+    renderReports(data.recent_reports);
+    renderAnimalSightings(data.recent_sightings);
+    renderDashboardStats(data.stats);
+  } catch (error) {
+    console.error('Error loading dashboard summary:', error);
+    const reportsList = document.getElementById('reports-list');
+    if (reportsList) {
+      reportsList.innerHTML = '<p class="text-red-500 text-center text-sm col-span-full">Error loading reports</p>';
+    }
+    const sightingsList = document.getElementById('sightings-list');
+    if (sightingsList) {
+      sightingsList.innerHTML = '<p class="text-red-500 text-center text-sm col-span-full">Error loading sightings</p>';
+    }
+  }
+}
+
+// Category Distribution Chart - Report Types
+function renderCategoryDistribution(items) {
+  try {
     const pieCtx = document.getElementById("categoryDistributionChart");
-    if (!pieCtx || !result.success || !result.data.length) {
+    if (!pieCtx || !items || !items.length) {
       console.log('No category data available');
       return;
     }
@@ -36,12 +57,12 @@ async function loadCategoryDistribution() {
       'other': '#6b7280'
     };
 
-    const labels = result.data.map(item => {
+    const labels = items.map(item => {
       const name = item.type.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
       return `${name}: ${item.count}`;
     });
-    const data = result.data.map(item => item.count);
-    const backgroundColors = result.data.map(item => colors[item.type] || '#6dd9e8');
+    const data = items.map(item => item.count);
+    const backgroundColors = items.map(item => colors[item.type] || '#6dd9e8');
 
     new Chart(pieCtx.getContext("2d"), {
       type: "doughnut",
@@ -81,21 +102,18 @@ async function loadCategoryDistribution() {
 }
 
 // Load Sightings by Location (Land or Water)
-async function loadSightingsByLocation(category) {
+function renderSightingsByLocation(category, items) {
   try {
-    const response = await fetch(`/api/dashboard/sightings-by-location?category=${category}&limit=5`);
-    const result = await response.json();
-
     const chartId = category === 'land' ? 'landSightingsChart' : 'waterSightingsChart';
     const ctx = document.getElementById(chartId);
     
     if (!ctx) return;
 
-    const labels = result.data && result.data.length > 0 
-      ? result.data.map(item => item.city) 
+    const labels = items && items.length > 0 
+      ? items.map(item => item.city) 
       : ['No data'];
-    const data = result.data && result.data.length > 0 
-      ? result.data.map(item => item.sightings) 
+    const data = items && items.length > 0 
+      ? items.map(item => item.sightings) 
       : [0];
     const maxValue = Math.max(...data, 10);
 
@@ -141,13 +159,9 @@ async function loadSightingsByLocation(category) {
 }
 
 // Load Dashboard Stats
-async function loadDashboardStats() {
+function renderDashboardStats(stats) {
   try {
-    const response = await fetch('/api/dashboard/stats');
-    const result = await response.json();
-
-    if (result.success && result.data) {
-      const stats = result.data;
+    if (stats) {
       
       // Update stat cards
       const statCards = document.querySelectorAll('.grid.grid-cols-2 .p-4');
@@ -183,15 +197,12 @@ function getStatusColor(status) {
   return colors[status] || 'bg-gray-100 text-gray-800';
 }
 
-async function loadReports() {
+function renderReports(reports) {
   try {
-    const response = await fetch('/api/reports?limit=10');
-    const result = await response.json();
-
     const reportsList = document.getElementById('reports-list');
     
-    if (result.success && result.data && result.data.length > 0) {
-      reportsList.innerHTML = result.data.map(report => `
+    if (reports && reports.length > 0) {
+      reportsList.innerHTML = reports.map(report => `
         <div class="p-4 border border-gray-200 rounded-lg hover:shadow-lg transition">
           <div class="flex justify-between items-start mb-2">
             <h4 class="font-semibold text-gray-800">${report.title}</h4>
@@ -199,7 +210,7 @@ async function loadReports() {
           </div>
           <p class="text-sm text-gray-600 mb-3 line-clamp-2">${report.description}</p>
           <div class="flex justify-between items-center text-xs">
-            <span class="text-gray-500"><strong>Location:</strong> ${report.location?.city_name || 'Unknown'}</span>
+            <span class="text-gray-500"><strong>Location:</strong> ${report.city_name || 'Unknown'}</span>
             <span class="px-2 py-1 rounded text-xs font-medium ${getStatusColor(report.status)}">${report.status}</span>
           </div>
           <div class="mt-2 text-xs text-gray-400">
@@ -219,25 +230,20 @@ async function loadReports() {
   }
 }
 
-async function loadAnimalSightings() {
+function renderAnimalSightings(sightings) {
   try {
-    const response = await fetch('/api/sightings');
-    const result = await response.json();
-
     const sightingsList = document.getElementById('sightings-list');
     
-    if (result.success && result.data && result.data.length > 0) {
-      // Display only the first 10 sightings
-      const displaySightings = result.data.slice(0, 10);
-      sightingsList.innerHTML = displaySightings.map(sighting => `
+    if (sightings && sightings.length > 0) {
+      sightingsList.innerHTML = sightings.map(sighting => `
         <div class="p-4 border border-gray-200 rounded-lg hover:shadow-lg transition">
           <div class="flex justify-between items-start mb-2">
-            <h4 class="font-semibold text-gray-800">${sighting.species?.common_name || 'Unknown Species'}</h4>
-            <span class="text-xs font-medium px-2 py-1 rounded bg-blue-100 text-blue-800">${sighting.species?.category || 'Unknown'}</span>
+            <h4 class="font-semibold text-gray-800">${sighting.common_name || 'Unknown Species'}</h4>
+            <span class="text-xs font-medium px-2 py-1 rounded bg-blue-100 text-blue-800">${sighting.category || 'Unknown'}</span>
           </div>
           <p class="text-sm text-gray-600 mb-3">${sighting.notes || 'No details provided'}</p>
           <div class="grid grid-cols-2 gap-2 text-xs">
-            <span class="text-gray-500"><strong>Location:</strong> ${sighting.location?.city_name || 'Unknown'}</span>
+            <span class="text-gray-500"><strong>Location:</strong> ${sighting.city_name || 'Unknown'}</span>
             <span class="text-gray-500"><strong>Date:</strong> ${new Date(sighting.sighting_date).toLocaleDateString()}</span>
           </div>
           <div class="mt-2 text-xs text-gray-400">
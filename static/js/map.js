@@ -19,87 +19,59 @@ document.addEventListener("DOMContentLoaded", () => {
 
   const BATANGAS_CENTER = [13.8595, 120.978];
   const INITIAL_ZOOM = 10;
+  // Below this zoom the map shows server-side clusters instead of one pin per location
+  const CLUSTER_BELOW_ZOOM = INITIAL_ZOOM;
   let map;
   let markerGroup = new L.LayerGroup();
+  let viewportRequest = 0;
+
+  // Current viewport as west,south,east,north, clamped to valid coordinates
+  function viewportBBox() {
+    const bounds = map.getBounds();
+    const clamp = (value, limit) => Math.max(-limit, Math.min(limit, value)).toFixed(5);
+    return [
+      clamp(bounds.getWest(), 180),
+      clamp(bounds.getSouth(), 90),
+      clamp(bounds.getEast(), 180),
+      clamp(bounds.getNorth(), 90)
+    ].join(',');
+  }
+
+  // Load only what is inside the viewport: clusters when zoomed out, locations otherwise
+  async function loadViewport() {
+    const requestId = ++viewportRequest;
+    const zoom = map.getZoom();
+    const clustered = zoom < CLUSTER_BELOW_ZOOM;
+    const url = clustered
+      ? `/api/map/clusters?zoom=${zoom}&bbox=${viewportBBox()}`
+      : `/api/locations/severity?bbox=${viewportBBox()}`;
 
-  // Load locations from API
-  async function loadLocations() {
     try {
-      const response = await fetch('/api/locations');
+      const response = await fetch(url);
       const result = await response.json();
-      
-      if (result.success && result.data) {
-        // Fetch all reports to calculate severity
-        const reportsResponse = await fetch('/api/reports');
-        const reportsData = await reportsResponse.json();
-        
-        const reportsByLocation = {};
-        
-        // Organize reports by location
-        if (reportsData.success && reportsData.data) {
-          reportsData.data.forEach(report => {
-            const locationId = report.location?.location_id;
-            if (locationId) {
-              if (!reportsByLocation[locationId]) {
-                reportsByLocation[locationId] = [];
-              }
-              reportsByLocation[locationId].push(report);
-            }
-          });
-        }
-        
-        // Calculate severity for each location
-        BATANGAS_LGUS = result.data.map(location => {
-          const reports = reportsByLocation[location.location_id] || [];
-          const severity = calculateSeverity(reports);
-          
-          return {
-            city: location.city_name,
-            lat: parseFloat(location.latitude),
-            lon: parseFloat(location.longitude),
-            severity: severity,
-            total: reports.length,
-            location_id: location.location_id
-          };
-        });
-        
+
+      // A newer pan/zoom has started; drop this response
+      if (requestId !== viewportRequest || !result.success || !result.data) {
+        return;
+      }
+
+      markerGroup.clearLayers();
+      if (clustered) {
+        plotClusters(result.data);
+      } else {
+        BATANGAS_LGUS = result.data.map(location => ({
+          city: location.city_name,
+          lat: parseFloat(location.latitude),
+          lon: parseFloat(location.longitude),
+          severity: location.severity,
+          total: location.report_count,
+          location_id: location.location_id
+        }));
         plotAllMarkers();
       }
+      applyFilter(severityFilter.value);
     } catch (error) {
-      console.error('Error loading locations:', error);
-    }
-  }
-
-  // Calculate severity based on reports
-  function calculateSeverity(reports) {
-    if (reports.length === 0) {
-      return 'Low'; // No reports = Low severity
-    }
-    
-    const severityWeights = {
-      'Critical': 4,
-      'High': 3,
-      'Medium': 2,
-      'Low': 1
-    };
-    
-    let totalWeight = 0;
-    reports.forEach(report => {
-      const weight = severityWeights[report.severity] || 1;
-      totalWeight += weight;
-    });
-    
-    const averageWeight = totalWeight / reports.length;
-    
-    // Determine severity based on average weight
-    if (averageWeight >= 3.5) {
-      return 'Critical';
-    } else if (averageWeight >= 2.5) {
-      return 'High';
-    } else if (averageWeight >= 1.5) {
-      return 'Medium';
-    } else {
-      return 'Low';
+      console.error('Error loading map data:', error);
     }
   }
 
@@ -113,8 +85,9 @@ document.addEventListener("DOMContentLoaded", () => {
 
     markerGroup.addTo(map);
 
-    // Load locations from database
-    loadLocations();
+    // Load map data for the viewport, and again after every pan/zoom
+    map.on("moveend", loadViewport);
+    loadViewport();
   }
 
   function getCustomIcon(severity) {
@@ -151,6 +124,31 @@ document.addEventListener("DOMContentLoaded", () => {
     });
   }
 
+  function getClusterIcon(cluster) {
+    const display = SEVERITY_DISPLAY[cluster.severity];
+    const color = display ? display.color : "#3f51b5";
+    const size = Math.min(56, 26 + Math.round(Math.log10(cluster.count + 1) * 12));
+    return L.divIcon({
+      className: "cluster-bubble-wrapper",
+      html: `<div class="cluster-bubble" style="background-color: ${color}">${cluster.count}</div>`,
+      iconSize: [size, size],
+      iconAnchor: [size / 2, size / 2],
+    });
+  }
+
+  function plotClusters(clusters) {
+    clusters.forEach((cluster) => {
+      const marker = L.marker([cluster.lat, cluster.lon], { icon: getClusterIcon(cluster) })
+        .bindTooltip(`Reports: ${cluster.report_count} · Sightings: ${cluster.sighting_count}`)
+        .on("click", () => {
+          map.setView([cluster.lat, cluster.lon], Math.min(map.getZoom() + 2, CLUSTER_BELOW_ZOOM));
+        });
+      marker.severity = cluster.severity;
+
+      markerGroup.addLayer(marker);
+    });
+  }
+
   function createPopupContent(lgu) {
     const display = SEVERITY_DISPLAY[lgu.severity];
     return `
@@ -205,5 +203,4 @@ document.addEventListener("DOMContentLoaded", () => {
   });
 
   initializeMap();
-  applyFilter(severityFilter.value);
 });
@@ -70,6 +70,58 @@ async function loadSpecies() {
   }
 }
 
+// Typo-tolerant species lookup: suggestions pick the matching option in the select
+function setupSpeciesSuggest() {
+  const searchInput = document.getElementById('species-search');
+  const suggestionList = document.getElementById('species-suggestions');
+  const speciesSelect = document.getElementById('species');
+  if (!searchInput || !suggestionList || !speciesSelect) return;
+
+  let debounceTimer = null;
+  let latestQuery = '';
+
+  function hideSuggestions() {
+    suggestionList.innerHTML = '';
+    suggestionList.classList.add('hidden');
+  }
+
+  searchInput.addEventListener('input', function() {
+    clearTimeout(debounceTimer);
+    const query = searchInput.value.trim();
+    if (query.length < 2) {
+      hideSuggestions();
+      return;
+    }
+    debounceTimer = setTimeout(async function() {
+      latestQuery = query;
+      try {
+        const response = await fetch(`/api/species/suggest?q=${encodeURIComponent(query)}&limit=8`);
+        const data = await response.json();
+        // Ignore answers to queries the user has already typed past
+        if (query !== latestQuery || !data.success) return;
+
+        suggestionList.innerHTML = '';
+        data.data.forEach(species => {
+          const item = document.createElement('li');
+          item.textContent = `${species.common_name} (${species.scientific_name})`;
+          item.addEventListener('mousedown', function(event) {
+            event.preventDefault();
+            speciesSelect.value = String(species.species_id);
+            searchInput.value = species.common_name;
+            hideSuggestions();
+          });
+          suggestionList.appendChild(item);
+        });
+        suggestionList.classList.toggle('hidden', data.data.length === 0);
+      } catch (error) {
+        console.error('Error fetching species suggestions:', error);
+      }
+    }, 150);
+  });
+
+  searchInput.addEventListener('blur', hideSuggestions);
+}
+
 // Helper function to show messages
 function showMessage(message, type = 'success') {
   const messageBox = document.getElementById('message-box');
@@ -123,6 +175,7 @@ document.addEventListener('DOMContentLoaded', function() {
   // Load data on page load
   loadLocations();
   loadSpecies();
+  setupSpeciesSuggest();
   
   // Set today's date as default for sighting date
   const today = new Date().toISOString().split('T')[0];
@@ -0,0 +1,29 @@
+# FILE: streaming.py
+# Newline-delimited JSON streaming for large list endpoints
+
+import json
+from flask import Response, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def wants_ndjson():
+    """True when the client asked for NDJSON via ?stream=1 or the Accept header"""
+    if request.args.get('stream') == '1':
+        return True
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def ndjson_response(batches, serialize_batch):
+    """
+    Stream one JSON object per line. `batches` yields lists of rows and
+    `serialize_batch` turns a list of rows into a list of dicts, so only one
+    batch is held in memory at a time.
+    """
+    def generate():
+        for batch in batches:
+            for item in serialize_batch(batch):
+                yield json.dumps(item, separators=(',', ':')) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
@@ -0,0 +1,53 @@
+# FILE: tasks.py
+# Periodic background maintenance jobs
+
+import os
+import threading
+import traceback
+
+
+def run_periodically(app, name, interval, job):
+    """
+    Run `job()` inside an app context every `interval` seconds on a daemon
+    thread. Returns the threading.Event that stops the loop when set.
+    """
+    stop = threading.Event()
+
+    def loop():
+        from database import db
+        while not stop.wait(interval):
+            with app.app_context():
+                try:
+                    job()
+                except Exception:
+                    db.session.rollback()
+                    print(f"⚠️  Background job {name} failed:")
+                    traceback.print_exc()
+                finally:
+                    db.session.remove()
+
+    thread = threading.Thread(target=loop, name=name, daemon=True)
+    thread.start()
+    return stop
+
+
+def reconcile_dashboard_job():
+    """Repair drift between today's DashboardStats counters and the real tables"""
+    from database import db
+    from model import reconcile_dashboard_stats
+    drift = reconcile_dashboard_stats()
+    db.session.commit()
+    if drift:
+        print(f"⚠️  Repaired dashboard stats drift: {drift}")
+    return drift
+
+
+def init_tasks(app):
+    """Start the periodic jobs enabled through environment variables"""
+    stops = {}
+    # Seconds between dashboard stats reconciliations (0 disables it)
+    interval = float(os.environ.get('DASHBOARD_RECONCILE_INTERVAL', '300') or 0)
+    if interval > 0:
+        stops['dashboard-reconcile'] = run_periodically(app, 'dashboard-reconcile', interval, reconcile_dashboard_job)
+    app.extensions['ecotrack_tasks'] = stops
+    return stops
@@ -0,0 +1,102 @@
+# FILE: tests/conftest.py
+# Shared fixtures: the app on an in-memory SQLite database
+
+import os
+import sys
+
+# Configure before the app modules are imported (some read these at import time)
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['ACTIVITY_LOG_ASYNC'] = '0'
+os.environ['DASHBOARD_RECONCILE_INTERVAL'] = '0'
+os.environ.pop('DATABASE_REPLICA_URLS', None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+from app import create_app
+from database import db, create_tables
+
+
+@pytest.fixture(scope='session')
+def app():
+    flask_app = create_app()
+    flask_app.config['TESTING'] = True
+    create_tables(flask_app)
+    return flask_app
+
+
+@pytest.fixture
+def app_context(app):
+    with app.app_context():
+        yield
+        db.session.remove()
+
+
+@pytest.fixture
+def derived_tables_rebuilt(app):
+    """Rebuild every derived table from the base tables so a test starts consistent"""
+    from model import (rebuild_species_stats, rebuild_daily_rollups, rebuild_map_clusters,
+                       reconcile_dashboard_stats, refresh_all_species_statistics)
+    with app.app_context():
+        rebuild_species_stats()
+        rebuild_daily_rollups()
+        rebuild_map_clusters()
+        refresh_all_species_statistics()
+        reconcile_dashboard_stats()
+        db.session.commit()
+
+
+@pytest.fixture
+def reference_rows(app):
+    """Three fresh species and locations; returns (species_ids, location_ids)"""
+    from model import Location, Species
+    with app.app_context():
+        species = [Species(common_name=f'Test species {i}', scientific_name=f'Testus species{i}',
+                           category='land' if i % 2 else 'water', species_type='bird')
+                   for i in range(3)]
+        locations = [Location(city_name=f'Test city {i}', location_type='city', severity_level='Low',
+                              latitude=13.6 + i * 0.4, longitude=120.9 + i * 0.3)
+                     for i in range(3)]
+        db.session.add_all(species + locations)
+        db.session.commit()
+        return [s.species_id for s in species], [l.location_id for l in locations]
+
+
+@pytest.fixture
+def admin_client(app):
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['user_role'] = 'admin'
+        session['username'] = 'admin'
+    return client
+
+
+class QueryCounter:
+    """Counts statements sent to the database while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_queries(app):
+    with app.app_context():
+        engine = db.engine
+    return lambda: QueryCounter(engine)
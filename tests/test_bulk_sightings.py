@@ -0,0 +1,82 @@
+# FILE: tests/test_bulk_sightings.py
+# POST /api/sightings/bulk: per-row errors, size caps and derived counters
+
+import json
+from database import db
+from model import (MapClusterCell, Sighting, SightingDailyRollup, rebuild_daily_rollups,
+                   rebuild_map_clusters, reconcile_dashboard_stats)
+from routes.sightings import BULK_MAX_BYTES, BULK_MAX_ROWS
+
+
+def counters_snapshot():
+    return (
+        sorted((r.stat_date, r.location_id, r.species_id, r.verification_status, r.sighting_count)
+               for r in SightingDailyRollup.query if r.sighting_count),
+        sorted((r.zoom, r.cell_row, r.cell_col, r.sighting_count, r.report_count,
+                round(r.lat_sum, 6), round(r.lon_sum, 6))
+               for r in MapClusterCell.query if r.sighting_count or r.report_count)
+    )
+
+
+def post_ndjson(client, body):
+    return client.post('/api/sightings/bulk', data=body, content_type='application/x-ndjson')
+
+
+def test_bulk_reports_errors_by_line_and_keeps_counters_consistent(app, admin_client, derived_tables_rebuilt,
+                                                                 reference_rows):
+    species_ids, location_ids = reference_rows
+    # Create today's dashboard row so the bulk deltas have somewhere to go
+    assert admin_client.get('/api/dashboard/stats').status_code == 200
+
+    def row(i, **fields):
+        return json.dumps({'species_id': species_ids[i % 3], 'location_id': location_ids[i % 3],
+                           'observer_name': 'Bulk', 'observer_contact': 'bulk@example.com',
+                           'sighting_date': f'2026-0{1 + i % 3}-1{i % 10}', **fields})
+
+    lines = [
+        row(0),
+        '',
+        row(1, number_observed=4),
+        'not json',
+        row(2, species_id=999999),
+        '',
+        row(3, number_observed=0),
+        '[1, 2]',
+        row(4, sighting_date='yesterday'),
+        row(5)
+    ]
+    with app.app_context():
+        before = Sighting.query.count()
+
+    response = post_ndjson(admin_client, '\n'.join(lines))
+    data = response.get_json()
+
+    assert response.status_code == 201, data
+    assert data['inserted'] == 3
+    # Rows are numbered by line in the uploaded file, blank lines included
+    assert [(e['row'], e['message'].split(':')[0]) for e in data['errors']] == [
+        (4, 'Invalid JSON'),
+        (5, 'Unknown species_id'),
+        (7, 'number_observed must be at least 1'),
+        (8, 'Row must be a JSON object'),
+        (9, 'sighting_date must be YYYY-MM-DD')
+    ]
+
+    with app.app_context():
+        assert Sighting.query.count() == before + 3
+        maintained = counters_snapshot()
+        assert reconcile_dashboard_stats() == {}
+        rebuild_daily_rollups()
+        rebuild_map_clusters()
+        db.session.commit()
+        assert maintained == counters_snapshot()
+
+
+def test_bulk_rejects_oversized_uploads(admin_client):
+    response = post_ndjson(admin_client, ' ' * (BULK_MAX_BYTES + 1))
+    assert response.status_code == 413
+    assert 'too large' in response.get_json()['message']
+
+    response = post_ndjson(admin_client, '{}\n' * (BULK_MAX_ROWS + 1))
+    assert response.status_code == 413
+    assert 'Too many rows' in response.get_json()['message']
@@ -0,0 +1,112 @@
+# FILE: tests/test_daily_rollups.py
+# report_daily_rollup and sighting_daily_rollup, kept by mapper-event and
+# bulk deltas, must equal a GROUP BY over the base tables
+
+import json
+from datetime import date
+from database import db
+from model import EnvironmentalReport, ReportDailyRollup, Sighting, SightingDailyRollup
+
+
+def rollup_rows():
+    return (
+        sorted((r.stat_date, r.location_id, r.report_type, r.severity, r.report_count)
+               for r in ReportDailyRollup.query if r.report_count),
+        sorted((r.stat_date, r.location_id, r.species_id, r.verification_status, r.sighting_count)
+               for r in SightingDailyRollup.query if r.sighting_count)
+    )
+
+
+def grouped_rows():
+    reports = db.session.execute(
+        db.select(EnvironmentalReport.report_date, EnvironmentalReport.location_id,
+                  EnvironmentalReport.report_type, EnvironmentalReport.severity,
+                  db.func.count(EnvironmentalReport.report_id))
+        .group_by(EnvironmentalReport.report_date, EnvironmentalReport.location_id,
+                  EnvironmentalReport.report_type, EnvironmentalReport.severity)
+    )
+    status = db.func.coalesce(Sighting.verification_status, 'pending')
+    sightings = db.session.execute(
+        db.select(Sighting.sighting_date, Sighting.location_id, Sighting.species_id, status,
+                  db.func.count(Sighting.sighting_id))
+        .group_by(Sighting.sighting_date, Sighting.location_id, Sighting.species_id, status)
+    )
+    return sorted(tuple(row) for row in reports), sorted(tuple(row) for row in sightings)
+
+
+def create_report(client, location_id, report_date, severity='High'):
+    response = client.post('/api/reports', json={
+        'location_id': location_id, 'report_type': 'pollution', 'severity': severity,
+        'title': 'Test report', 'description': 'Rollup test',
+        'reporter_name': 'Tester', 'reporter_contact': 'rollup@example.com',
+        'report_date': report_date
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']['report_id']
+
+
+def create_sighting(client, species_id, location_id, sighting_date):
+    response = client.post('/api/sightings', json={
+        'species_id': species_id, 'location_id': location_id, 'sighting_date': sighting_date,
+        'observer_name': 'Tester', 'observer_contact': 'rollup@example.com'
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']['sighting_id']
+
+
+def test_rollups_match_group_by_after_writes(app, admin_client, derived_tables_rebuilt, reference_rows):
+    species_ids, location_ids = reference_rows
+
+    # Single writes
+    reports = [create_report(admin_client, location_ids[i % 3], f'2026-03-0{1 + i % 2}',
+                             severity=('High', 'Low')[i % 2]) for i in range(4)]
+    sightings = [create_sighting(admin_client, species_ids[i % 3], location_ids[i % 2], f'2026-03-0{1 + i % 2}')
+                 for i in range(4)]
+
+    # A bulk insert, several rows landing in the same rollup row
+    lines = [json.dumps({'species_id': species_ids[i % 2], 'location_id': location_ids[0],
+                         'observer_name': 'Bulk', 'observer_contact': 'rollup@example.com',
+                         'sighting_date': '2026-03-01'}) for i in range(5)]
+    response = admin_client.post('/api/sightings/bulk', data='\n'.join(lines),
+                                 content_type='application/x-ndjson')
+    assert response.status_code == 201, response.get_json()
+    assert response.get_json()['inserted'] == 5
+
+    with app.app_context():
+        assert rollup_rows() == grouped_rows()
+        bulk_ids = [s.sighting_id for s in Sighting.query.filter_by(observer_name='Bulk',
+                                                                      observer_contact='rollup@example.com')]
+
+    # Status changes, including on bulk-inserted rows
+    for sighting_id, status in [(sightings[0], 'verified'), (sightings[1], 'rejected'),
+                                (bulk_ids[0], 'verified'), (bulk_ids[1], 'rejected')]:
+        response = admin_client.put(f'/api/admin/sightings/{sighting_id}/verify', json={'status': status})
+        assert response.status_code == 200
+    assert admin_client.put(f'/api/admin/sightings/{sightings[0]}/verify',
+                            json={'status': 'pending'}).status_code == 200
+    assert admin_client.put(f'/api/admin/reports/{reports[0]}',
+                            json={'severity': 'Critical', 'report_type': 'other'}).status_code == 200
+    assert admin_client.put(f'/api/admin/reports/{reports[1]}', json={'status': 'completed'}).status_code == 200
+
+    with app.app_context():
+        assert rollup_rows() == grouped_rows()
+
+    # Moves between dates and locations, which the API does not expose
+    with app.app_context():
+        report = db.session.get(EnvironmentalReport, reports[2])
+        report.report_date = date(2026, 3, 9)
+        report.location_id = location_ids[1]
+        sighting = db.session.get(Sighting, sightings[2])
+        sighting.sighting_date = date(2026, 3, 9)
+        sighting.location_id = location_ids[2]
+        sighting.species_id = species_ids[0]
+        db.session.commit()
+        assert rollup_rows() == grouped_rows()
+
+    # Deletes
+    assert admin_client.delete(f'/api/admin/reports/{reports[3]}').status_code == 200
+    for sighting_id in (sightings[1], bulk_ids[0], bulk_ids[2]):
+        assert admin_client.delete(f'/api/admin/sightings/{sighting_id}').status_code == 200
+
+    with app.app_context():
+        assert rollup_rows() == grouped_rows()
@@ -0,0 +1,86 @@
+# FILE: tests/test_dashboard_stats.py
+# Today's DashboardStats counters, kept by mapper-event deltas, must never
+# drift from a real count
+
+from datetime import date
+import routes.dashboard
+from database import db
+from model import DashboardStats, reconcile_dashboard_stats
+
+
+def create_report(client, location_id, severity='High'):
+    response = client.post('/api/reports', json={
+        'location_id': location_id, 'report_type': 'pollution', 'severity': severity,
+        'title': 'Test report', 'description': 'Dashboard counter test',
+        'reporter_name': 'Tester', 'reporter_contact': 'tester@example.com',
+        'report_date': date.today().isoformat()
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']['report_id']
+
+
+def create_sighting(client, species_id, location_id):
+    response = client.post('/api/sightings', json={
+        'species_id': species_id, 'location_id': location_id,
+        'observer_name': 'Tester', 'observer_contact': 'tester@example.com'
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']['sighting_id']
+
+
+def make_writes(client, species_ids, location_ids):
+    reports = [create_report(client, location_ids[0]),
+               create_report(client, location_ids[1], severity='Critical'),
+               create_report(client, location_ids[2])]
+    sightings = [create_sighting(client, species_ids[i], location_ids[i]) for i in range(3)]
+
+    assert client.put(f'/api/admin/reports/{reports[0]}', json={'status': 'completed'}).status_code == 200
+    assert client.put(f'/api/admin/reports/{reports[1]}', json={'severity': 'Low'}).status_code == 200
+    assert client.delete(f'/api/admin/reports/{reports[2]}').status_code == 200
+    for sighting_id in sightings[:2]:
+        response = client.put(f'/api/admin/sightings/{sighting_id}/verify', json={'status': 'verified'})
+        assert response.status_code == 200
+    assert client.delete(f'/api/admin/sightings/{sightings[0]}').status_code == 200
+
+
+def delete_todays_row(app):
+    with app.app_context():
+        DashboardStats.query.filter_by(stat_date=date.today()).delete()
+        db.session.commit()
+
+
+def test_counters_match_real_counts_after_writes(app, admin_client, derived_tables_rebuilt, reference_rows):
+    assert admin_client.get('/api/dashboard/stats').status_code == 200
+    make_writes(admin_client, *reference_rows)
+
+    with app.app_context():
+        assert reconcile_dashboard_stats() == {}
+
+
+def test_row_created_after_writes_counts_them(app, admin_client, derived_tables_rebuilt, reference_rows):
+    delete_todays_row(app)
+    # The deltas of these writes have no row to land in
+    make_writes(admin_client, *reference_rows)
+
+    assert admin_client.get('/api/dashboard/stats').status_code == 200
+    with app.app_context():
+        assert reconcile_dashboard_stats() == {}
+
+
+def test_row_creation_recounts_writes_made_while_counting(app, admin_client, monkeypatch,
+                                                          derived_tables_rebuilt):
+    delete_todays_row(app)
+    real_counts = routes.dashboard.compute_dashboard_counts
+
+    def stale_counts():
+        # As if a report committed after these counts were taken but before the row existed
+        counts = real_counts()
+        counts['total_reports'] -= 1
+        return counts
+
+    monkeypatch.setattr(routes.dashboard, 'compute_dashboard_counts', stale_counts)
+    data = admin_client.get('/api/dashboard/summary').get_json()['data']['stats']
+
+    with app.app_context():
+        assert data['total_reports'] == real_counts()['total_reports']
+        assert reconcile_dashboard_stats() == {}
@@ -0,0 +1,66 @@
+# FILE: tests/test_dashboard_summary.py
+# /api/dashboard/summary runs its panels through run_concurrently and must
+# return what the individual dashboard endpoints return
+
+from datetime import date
+import threading
+import pytest
+from database import db, run_concurrently
+from model import Sighting
+
+
+@pytest.fixture
+def dashboard_data(admin_client, reference_rows):
+    species_ids, location_ids = reference_rows
+    for i, report_type in enumerate(['pollution', 'pollution', 'waste_dumping', 'other']):
+        response = admin_client.post('/api/reports', json={
+            'location_id': location_ids[i % 3], 'report_type': report_type, 'severity': 'Medium',
+            'title': 'Test report', 'description': 'Dashboard summary test',
+            'reporter_name': 'Tester', 'reporter_contact': 'summary@example.com',
+            'report_date': date.today().isoformat()
+        })
+        assert response.status_code == 201, response.get_json()
+    for i in range(6):
+        response = admin_client.post('/api/sightings', json={
+            'species_id': species_ids[i % 3], 'location_id': location_ids[i % 2],
+            'observer_name': 'Tester', 'observer_contact': 'summary@example.com'
+        })
+        assert response.status_code == 201, response.get_json()
+        sighting_id = response.get_json()['data']['sighting_id']
+        if i % 2 == 0:
+            response = admin_client.put(f'/api/admin/sightings/{sighting_id}/verify', json={'status': 'verified'})
+            assert response.status_code == 200
+
+
+def get_data(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['data']
+
+
+@pytest.mark.parametrize('query', ['', 'limit=2', f'from={date.today().isoformat()}&to={date.today().isoformat()}'])
+def test_summary_matches_individual_endpoints(admin_client, dashboard_data, query):
+    summary = get_data(admin_client, f'/api/dashboard/summary?{query}')
+
+    assert summary['stats'] == get_data(admin_client, '/api/dashboard/stats')
+    assert summary['reports_by_type'] == get_data(admin_client, f'/api/dashboard/reports-by-type?{query}')
+    limit = '' if 'limit' in query else 'limit=5&'
+    for category in ('land', 'water'):
+        assert summary['sightings_by_location'][category] == get_data(
+            admin_client, f'/api/dashboard/sightings-by-location?category={category}&{limit}{query}')
+
+
+def test_run_concurrently_keeps_job_order(app):
+    with app.app_context():
+        results = run_concurrently(lambda: 1, lambda: Sighting.query.count(), lambda: 'last')
+
+        assert results == [1, db.session.query(Sighting).count(), 'last']
+
+
+def test_run_concurrently_runs_in_caller_thread_on_static_pool(app):
+    with app.app_context():
+        # In-memory SQLite shares one connection through a StaticPool
+        assert type(db.engine.pool).__name__ == 'StaticPool'
+        threads = run_concurrently(threading.get_ident, threading.get_ident)
+
+        assert threads == [threading.get_ident()] * 2
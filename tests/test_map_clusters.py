@@ -0,0 +1,76 @@
+# FILE: tests/test_map_clusters.py
+# map_cluster_cells, kept by mapper-event deltas, must equal
+# rebuild_map_clusters(), including after a location is moved
+
+from datetime import date
+from decimal import Decimal
+from database import db
+from model import EnvironmentalReport, Location, MapClusterCell, Sighting, rebuild_map_clusters
+
+
+def cells_snapshot():
+    return sorted(
+        (c.zoom, c.cell_row, c.cell_col, c.report_count, c.sighting_count, c.low_count, c.medium_count,
+         c.high_count, c.critical_count, round(c.lat_sum, 6), round(c.lon_sum, 6))
+        for c in MapClusterCell.query if c.report_count or c.sighting_count
+    )
+
+
+def assert_matches_rebuild():
+    maintained = cells_snapshot()
+    rebuild_map_clusters()
+    db.session.commit()
+    assert maintained == cells_snapshot()
+
+
+def new_report(location_id, severity):
+    return EnvironmentalReport(
+        location_id=location_id, report_type='pollution', severity=severity,
+        title='Test report', description='Cluster test', reporter_name='Tester',
+        reporter_contact='cluster@example.com', report_date=date(2026, 5, 1)
+    )
+
+
+def new_sighting(species_id, location_id):
+    return Sighting(species_id=species_id, location_id=location_id, sighting_date=date(2026, 5, 1),
+                    observer_name='Tester', observer_contact='cluster@example.com')
+
+
+def test_clusters_match_rebuild(app, derived_tables_rebuilt, reference_rows):
+    species_ids, location_ids = reference_rows
+    with app.app_context():
+        reports = [new_report(location_ids[i % 3], ('Low', 'High', 'Critical')[i % 3]) for i in range(6)]
+        sightings = [new_sighting(species_ids[i % 3], location_ids[i % 2]) for i in range(5)]
+        db.session.add_all(reports + sightings)
+        db.session.commit()
+        assert_matches_rebuild()
+
+        # Severity and location changes on the items
+        reports[0].severity = 'Medium'
+        reports[1].location_id = location_ids[2]
+        sightings[0].location_id = location_ids[2]
+        db.session.commit()
+        assert_matches_rebuild()
+
+        # A small move within the same coarse cells, and a move across the map
+        db.session.get(Location, location_ids[0]).latitude += Decimal('0.01')
+        far = db.session.get(Location, location_ids[1])
+        far.latitude, far.longitude = Decimal('-33.8'), Decimal('151.2')
+        db.session.commit()
+        assert_matches_rebuild()
+
+        # A move in the same flush as items added to and removed from the location
+        moved = db.session.get(Location, location_ids[2])
+        moved.latitude, moved.longitude = Decimal('48.85'), Decimal('2.35')
+        db.session.add(new_report(location_ids[2], 'High'))
+        db.session.add(new_sighting(species_ids[0], location_ids[2]))
+        db.session.delete(reports[2])
+        db.session.delete(sightings[0])
+        db.session.commit()
+        assert_matches_rebuild()
+
+        # Deletes
+        for item in reports[3:] + sightings[3:]:
+            db.session.delete(item)
+        db.session.commit()
+        assert_matches_rebuild()
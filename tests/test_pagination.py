@@ -0,0 +1,66 @@
+# FILE: tests/test_pagination.py
+# Keyset pagination must return every row exactly once, including rows whose
+# nullable sort column is NULL
+
+from datetime import date, datetime
+import pytest
+from database import db
+from model import Sighting
+from pagination import iter_keyset_batches, paginate_keyset
+
+ORDERINGS = [
+    [Sighting.created_at, Sighting.sighting_id],
+    [Sighting.sighting_date, Sighting.created_at, Sighting.sighting_id]
+]
+
+
+@pytest.fixture
+def paged_sightings(app, reference_rows):
+    """Sightings sharing dates and created_at values, a third with NULL created_at"""
+    species_ids, location_ids = reference_rows
+    with app.app_context():
+        sightings = [
+            Sighting(species_id=species_ids[i % 3], location_id=location_ids[i % 3],
+                     sighting_date=date(2026, 4, 1 + i % 2), created_at=datetime(2026, 4, 3, 12, i % 2),
+                     observer_name='Pager', observer_contact='pager@example.com')
+            for i in range(15)
+        ]
+        db.session.add_all(sightings)
+        db.session.flush()
+        ids = [s.sighting_id for s in sightings]
+        # Set after the insert so the column default does not fill them in
+        db.session.query(Sighting).filter(Sighting.sighting_id.in_(ids[::3])).update(
+            {'created_at': None}, synchronize_session=False)
+        db.session.commit()
+        yield set(ids)
+        Sighting.query.filter(Sighting.sighting_id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+
+
+def own_rows():
+    return db.session.query(Sighting).filter_by(observer_contact='pager@example.com')
+
+
+@pytest.mark.parametrize('columns', ORDERINGS)
+@pytest.mark.parametrize('limit', [1, 2, 4])
+def test_paginate_keyset_visits_every_row_once(app, paged_sightings, columns, limit):
+    with app.app_context():
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor = paginate_keyset(own_rows(), columns, cursor=cursor, limit=limit)
+            assert len(rows) <= limit
+            seen.extend(row.sighting_id for row in rows)
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(paged_sightings)
+
+
+@pytest.mark.parametrize('columns', ORDERINGS)
+def test_iter_keyset_batches_visits_every_row_once(app, paged_sightings, columns):
+    with app.app_context():
+        seen = [row.sighting_id for batch in iter_keyset_batches(own_rows(), columns, batch_size=2)
+                for row in batch]
+
+        assert sorted(seen) == sorted(paged_sightings)
@@ -0,0 +1,65 @@
+# FILE: tests/test_sighting_queries.py
+# Regression test: serializing sighting lists must not issue per-row queries
+
+from datetime import date, timedelta
+import pytest
+from database import db
+from model import Location, Sighting, Species, sighting_list_to_dict
+
+SIGHTING_ROWS = 1000
+# species + species stats + locations
+MAX_SERIALIZE_QUERIES = 3
+# page + the three batched loads + summary counts
+MAX_ADMIN_LIST_QUERIES = 5
+
+
+@pytest.fixture(scope='module')
+def sightings(app):
+    with app.app_context():
+        db.session.execute(Species.__table__.insert(), [
+            {'common_name': f'Species {i}', 'scientific_name': f'Genus species{i}',
+             'category': 'land' if i % 2 else 'water', 'species_type': 'bird'}
+            for i in range(20)
+        ])
+        db.session.execute(Location.__table__.insert(), [
+            {'city_name': f'City {i}', 'latitude': 13.5 + i / 10, 'longitude': 121.0 + i / 10,
+             'location_type': 'city', 'severity_level': 'Low'}
+            for i in range(10)
+        ])
+        species_ids = [row[0] for row in db.session.query(Species.species_id)]
+        location_ids = [row[0] for row in db.session.query(Location.location_id)]
+        start = date.today() - timedelta(days=100)
+        db.session.execute(Sighting.__table__.insert(), [
+            {'species_id': species_ids[i % len(species_ids)],
+             'location_id': location_ids[i % len(location_ids)],
+             'sighting_date': start + timedelta(days=i % 100),
+             'number_observed': 1 + i % 4,
+             'observer_name': f'Observer {i}',
+             'observer_contact': 'observer@example.com',
+             'verification_status': ('pending', 'verified', 'rejected')[i % 3]}
+            for i in range(SIGHTING_ROWS)
+        ])
+        db.session.commit()
+    return SIGHTING_ROWS
+
+
+def test_sighting_list_to_dict_batches_related_rows(app, app_context, sightings, count_queries):
+    # Other test modules share the database, so only take this module's rows
+    rows = Sighting.query.filter_by(observer_contact='observer@example.com').all()
+    assert len(rows) == sightings
+
+    with count_queries() as counter:
+        data = sighting_list_to_dict(rows)
+
+    assert len(data) == sightings
+    assert all(item['species'] and item['location'] for item in data)
+    assert counter.count <= MAX_SERIALIZE_QUERIES, counter.statements
+
+
+def test_admin_sightings_page_query_count(admin_client, sightings, count_queries):
+    with count_queries() as counter:
+        response = admin_client.get('/api/admin/sightings?limit=500')
+
+    assert response.status_code == 200
+    assert len(response.get_json()['data']) == 500
+    assert counter.count <= MAX_ADMIN_LIST_QUERIES, counter.statements
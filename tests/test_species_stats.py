@@ -0,0 +1,78 @@
+# FILE: tests/test_species_stats.py
+# The species stats tables and species summaries maintained by mapper
+# events must equal a rebuild from the sightings table
+
+from datetime import date, timedelta
+from database import db
+from model import (Sighting, Species, SpeciesDailyStats, SpeciesStats,
+                   rebuild_species_stats, refresh_all_species_statistics)
+
+
+def stats_snapshot():
+    return (
+        sorted((r.species_id, r.verified_count, r.total_observed)
+               for r in SpeciesStats.query if r.verified_count),
+        sorted((r.species_id, r.stat_date, r.verified_count, r.total_observed)
+               for r in SpeciesDailyStats.query if r.verified_count)
+    )
+
+
+def summary_snapshot(species_ids):
+    return sorted((s.species_id, s.total_sightings_estimate, s.status_trend)
+                  for s in Species.query.filter(Species.species_id.in_(species_ids)))
+
+
+def create_sighting(client, species_id, location_id, **fields):
+    response = client.post('/api/sightings', json={
+        'species_id': species_id, 'location_id': location_id,
+        'observer_name': 'Tester', 'observer_contact': 'tester@example.com', **fields
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']['sighting_id']
+
+
+def verify(client, sighting_id, status):
+    response = client.put(f'/api/admin/sightings/{sighting_id}/verify', json={'status': status})
+    assert response.status_code == 200, response.get_json()
+
+
+def test_sighting_transitions_match_rebuild(app, admin_client, derived_tables_rebuilt, reference_rows):
+    species_ids, location_ids = reference_rows
+    today = date.today()
+    ids = [
+        create_sighting(admin_client, species_ids[0], location_ids[0], number_observed=3),
+        create_sighting(admin_client, species_ids[0], location_ids[1], number_observed=5,
+                        sighting_date=(today - timedelta(days=40)).isoformat()),
+        create_sighting(admin_client, species_ids[1], location_ids[2], number_observed=2),
+        create_sighting(admin_client, species_ids[1], location_ids[0]),
+        create_sighting(admin_client, species_ids[2], location_ids[1], number_observed=4)
+    ]
+
+    for sighting_id in ids:
+        verify(admin_client, sighting_id, 'verified')
+    verify(admin_client, ids[2], 'rejected')
+    verify(admin_client, ids[2], 'verified')
+    verify(admin_client, ids[3], 'pending')
+    assert admin_client.delete(f'/api/admin/sightings/{ids[4]}').status_code == 200
+
+    with app.app_context():
+        # Edits: count, count to NULL and 0 (both count as 1), species and date moves
+        db.session.get(Sighting, ids[0]).number_observed = 7
+        db.session.commit()
+        db.session.get(Sighting, ids[1]).number_observed = None
+        db.session.commit()
+        sighting = db.session.get(Sighting, ids[2])
+        sighting.number_observed = 0
+        sighting.species_id = species_ids[2]
+        sighting.sighting_date = today - timedelta(days=10)
+        db.session.commit()
+
+        maintained = stats_snapshot()
+        summaries = summary_snapshot(species_ids)
+        rebuild_species_stats()
+        refresh_all_species_statistics()
+        db.session.commit()
+
+        assert maintained == stats_snapshot()
+        assert summaries == summary_snapshot(species_ids)
+        assert db.session.get(SpeciesStats, species_ids[0]).total_observed == 7 + 1